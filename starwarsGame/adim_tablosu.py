@@ -0,0 +1,206 @@
+"""
+Kötü karakterlerin bütün (kötü karakter hücresi, oyuncu hücresi) çiftleri
+için bir sonraki adımını ve kalan mesafesini önceden hesaplar ve haritanın
+yanına ikili dosya olarak kaydeder. Oyun sırasında dosya mmap ile açılır;
+her kötü karakter hamlesi tek bir tablo okumasına iner.
+
+Örnek:
+    python adim_tablosu.py harita.txt   # harita.txt.tablo dosyasını yazar
+"""
+import argparse
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+
+import karakterler
+from harita import haritaYukle
+from izgara import DUVAR_DISI
+from karakterler import Lokasyon
+
+# Tablosu tutulan hareket modelleri. Darth Vader'ın adımı zaten
+# doğrudan hesaplandığı için tablosu yoktur.
+MODELLER = ("Stormtrooper", "KyloRen")
+# Tablo hücre sayısının karesiyle büyür: 2048 hücrede model başına 12 MB
+EN_FAZLA_HUCRE = 2048
+UZANTI = ".tablo"
+
+# imza, biçim sürümü, genişlik, yükseklik, bayt sırası, hedef hücre sayısı, harita özeti
+_BASLIK = struct.Struct('<4sHHHBxI20s')
+_IMZA = b'SWAT'
+_BICIM_SURUMU = 1
+_BAYT_SIRASI = 0 if sys.byteorder == 'little' else 1
+
+ADIM_YOK = 255
+MESAFE_YOK = 0xFFFF
+
+def haritaOzeti(labirent):
+    """Hücreler ya da modeller değişince tablo geçersiz kalsın diye özet"""
+    ozet = hashlib.sha1(bytes(labirent.hucreler))
+    ozet.update(",".join(MODELLER).encode('ascii'))
+    return ozet.digest()
+
+def _dolgu(uzunluk):
+    return b'\0' * (-uzunluk % 4)
+
+def tabloOlustur(labirent):
+    """
+    Tablo dosyasının içeriğini oluşturur. Adımlar her modelin kendi
+    mesafeAlani/alandanAdim metodlarıyla bulunur, böylece tablo oyundaki
+    hareketle birebir aynıdır. Hedef olarak oyuncunun durabileceği açık
+    hücreler, kaynak olarak haritanın bütün hücreleri alınır (satır
+    içindeki sıra konumdan doğrudan hesaplansın diye). Harita
+    EN_FAZLA_HUCRE'den büyükse ValueError verir.
+    """
+    kaynak_sayisi = labirent.genislik * labirent.yukseklik
+    if kaynak_sayisi > EN_FAZLA_HUCRE:
+        raise ValueError(f"Harita {kaynak_sayisi} hücre, "
+                         f"tablo en fazla {EN_FAZLA_HUCRE} hücre için oluşturulur!")
+    hedefler = array('I', [indeks for indeks, kod in enumerate(labirent.hucreler)
+                           if DUVAR_DISI[kod]])
+    boyut = len(hedefler) * kaynak_sayisi
+
+    # Adım, bu listedeki ofsetin sırası olarak saklanır
+    yonler = {ofset: sira for sira, ofset in
+              enumerate(labirent.komsular + labirent.ikili_komsular)}
+
+    parcalar = [_BASLIK.pack(_IMZA, _BICIM_SURUMU, labirent.genislik, labirent.yukseklik,
+                             _BAYT_SIRASI, len(hedefler), haritaOzeti(labirent)),
+                hedefler.tobytes()]
+    for ad in MODELLER:
+        kotu = getattr(karakterler, ad)(Lokasyon(0, 0))
+        konum = kotu.getKonum()
+        mesafeler = array('H', [MESAFE_YOK]) * boyut
+        adimlar = bytearray([ADIM_YOK]) * boyut
+
+        # Satırlar hedefe (oyuncu hücresine) göre: bir satır tek bir mesafe alanından dolar
+        satir = 0
+        for hedef_indeks in hedefler:
+            hedef_y, hedef_x = labirent.konum(hedef_indeks)
+            alan = kotu.mesafeAlani(Lokasyon(hedef_x, hedef_y), labirent)
+            for y in range(labirent.yukseklik):
+                konum.setY(y)
+                for x in range(labirent.genislik):
+                    konum.setX(x)
+                    mesafe = kotu.alanMesafesi(alan, labirent)
+                    if mesafe is not None:
+                        mesafeler[satir] = mesafe
+                    adim = kotu.alandanAdim(alan, labirent)
+                    if adim is not None:
+                        adimlar[satir] = yonler[labirent.indeks(adim[1], adim[0])
+                                                - labirent.indeks(x, y)]
+                    satir += 1
+
+        parcalar += [mesafeler.tobytes(), bytes(adimlar), _dolgu(boyut)]
+    return b''.join(parcalar)
+
+class AdimTablosu:
+    """
+    Önceden hesaplanmış tabloyu (mmap ya da bytes) kopyalamadan okur.
+    Tablo başka bir haritaya ya da eski bir biçime aitse ValueError verir.
+    """
+    def __init__(self, labirent, tampon):
+        if len(tampon) < _BASLIK.size:
+            raise ValueError("Tablo dosyası eksik!")
+        (imza, surum, genislik, yukseklik, bayt_sirasi,
+         hedef_sayisi, ozet) = _BASLIK.unpack_from(tampon)
+        if imza != _IMZA or surum != _BICIM_SURUMU or bayt_sirasi != _BAYT_SIRASI:
+            raise ValueError("Tablo dosyasının biçimi desteklenmiyor!")
+        if (genislik, yukseklik) != (labirent.genislik, labirent.yukseklik) or \
+                ozet != haritaOzeti(labirent):
+            raise ValueError("Tablo bu haritaya ait değil!")
+
+        self.kaynak_sayisi = genislik * yukseklik
+        boyut = hedef_sayisi * self.kaynak_sayisi
+        beklenen = (_BASLIK.size + 4 * hedef_sayisi +
+                    len(MODELLER) * (3 * boyut + len(_dolgu(boyut))))
+        if len(tampon) != beklenen:
+            raise ValueError("Tablo dosyası eksik!")
+
+        self.labirent = labirent
+        self.tampon = tampon
+        self.ofsetler = labirent.komsular + labirent.ikili_komsular
+
+        gorunum = memoryview(tampon)
+        bas = _BASLIK.size
+        # Izgara indeksinden hedef sırasına (-1: oyuncu orada duramaz)
+        self._hedef_siralari = array('i', [-1]) * len(labirent.hucreler)
+        for sira, indeks in enumerate(gorunum[bas:bas + 4 * hedef_sayisi].cast('I')):
+            self._hedef_siralari[indeks] = sira
+        bas += 4 * hedef_sayisi
+
+        self._modeller = {}
+        for ad in MODELLER:
+            mesafeler = gorunum[bas:bas + 2 * boyut].cast('H')
+            bas += 2 * boyut
+            adimlar = gorunum[bas:bas + boyut]
+            bas += boyut + len(_dolgu(boyut))
+            self._modeller[getattr(karakterler, ad)] = (adimlar, mesafeler)
+
+    def destekler(self, kotu):
+        return type(kotu) in self._modeller
+
+    def _sira(self, kotu, hedef):
+        hedef_sira = self._hedef_siralari[self.labirent.indeks(hedef.x, hedef.y)]
+        if hedef_sira < 0:
+            return None
+        konum = kotu.konum
+        return hedef_sira * self.kaynak_sayisi + konum.y * self.labirent.genislik + konum.x
+
+    def adim(self, kotu, hedef):
+        """Kötü karakterin hedefe doğru bir sonraki (y, x) adımı (yoksa None)"""
+        sira = self._sira(kotu, hedef)
+        if sira is None:
+            return None
+        yon = self._modeller[type(kotu)][0][sira]
+        if yon == ADIM_YOK:
+            return None
+        konum = kotu.konum
+        return self.labirent.konum(self.labirent.indeks(konum.x, konum.y)
+                                   + self.ofsetler[yon])
+
+    def mesafe(self, kotu, hedef):
+        """Hedefe kalan hamle sayısı (yol yoksa None)"""
+        sira = self._sira(kotu, hedef)
+        if sira is None:
+            return None
+        mesafe = self._modeller[type(kotu)][1][sira]
+        return None if mesafe == MESAFE_YOK else mesafe
+
+def tabloKaydet(labirent, harita_dosyasi):
+    with open(harita_dosyasi + UZANTI, 'wb') as f:
+        f.write(tabloOlustur(labirent))
+
+def tabloYukle(labirent, harita_dosyasi, olustur=True):
+    """
+    Haritanın yanındaki tabloyu mmap ile açar. Dosya yoksa ya da harita
+    değişmişse olustur açıkken tablo yeniden hesaplanıp kaydedilir.
+    Tablo kullanılamıyorsa None döner; oyun o zaman arama ile devam eder.
+    """
+    for deneme in range(2):
+        try:
+            with open(harita_dosyasi + UZANTI, 'rb') as f:
+                tampon = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return AdimTablosu(labirent, tampon)
+        except (OSError, ValueError):
+            if not olustur or deneme:
+                return None
+
+        try:
+            tabloKaydet(labirent, harita_dosyasi)
+        except (OSError, ValueError) as e:
+            print(f"Adım tablosu oluşturulamadı: {str(e)}")
+            return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Haritalar için adım tablolarını önceden hesaplar")
+    parser.add_argument("haritalar", nargs="+", help="Harita dosyaları")
+    args = parser.parse_args()
+
+    for dosya in args.haritalar:
+        tabloKaydet(haritaYukle(dosya).labirent, dosya)
+        print(f"{dosya}{UZANTI} yazıldı")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import heapq
+from array import array
+
+# Ulaşılamayan hücrelerin mesafesi
+SONSUZ = 1 << 30
+# Bundan kısa kuyruklar eskimiş kayıtlardan temizlenmez
+KUYRUK_ESIGI = 64
+
+class ArtimsalAlan:
+    """
+    Oyuncudan (kök) geriye Izgara.mesafeAlani kurallarıyla D* Lite mesafe
+    alanı. Kök ya da başlangıç değişince alan onarılır; sadece başlangıç
+    ve komşularının mesafesi kesindir.
+    """
+    def __init__(self, labirent, ofsetler, gecis, ara_kontrol=False):
+        self.labirent = labirent
+        self.ofsetler = ofsetler
+        self.gecis = gecis
+        self.ara_kontrol = ara_kontrol
+        # Sezgisel Manhattan mesafesini bir hamlede katedilen hücre sayısına böler
+        self.adim_boyu = 2 if ara_kontrol else 1
+        self.kok = None
+        self.baslangic = None
+        self.ulasilamaz = False
+        self._bilesenler = None
+
+    def _sifirla(self, kok, baslangic):
+        boyut = len(self.labirent.hucreler)
+        self.g = array('i', [SONSUZ]) * boyut
+        self.rhs = array('i', [SONSUZ]) * boyut
+        self.km = 0
+        self.queue = []
+        self.anahtarlar = {}  # Kuyruktaki hücrelerin geçerli anahtarları
+        self.kok = kok
+        self.baslangic = baslangic
+        self.rhs[kok] = 0
+        self._ekle(kok)
+
+    def ilerle(self, kok, baslangic):
+        """
+        Kök ve başlangıç indekslerini günceller ve başlangıcın mesafesi
+        kesinleşene kadar alanı onarır. İki konum da istenildiği kadar
+        uzağa sıçrayabilir; tek adımlık değişiklikler ucuzdur.
+        """
+        if self.kok is None:
+            self._sifirla(kok, baslangic)
+        else:
+            if baslangic != self.baslangic:
+                # Eski anahtarlar yeni başlangıca göre alt sınır olarak kalsın
+                self.km += self._mesafe(self.baslangic, baslangic)
+                self.baslangic = baslangic
+            if kok != self.kok:
+                eski, self.kok = self.kok, kok
+                self.rhs[kok] = 0
+                self._guncelle(kok)
+                self._komsulariGuncelle(kok)
+                # Eski kök artık sıradan bir hücre; kendisi ve ona
+                # dayanan komşuları yeniden değerlendirilir
+                self._guncelle(eski)
+                self._komsulariGuncelle(eski)
+
+        # Aksi halde kuyruk boşalana kadar kökün bütün bileşeni taranırdı;
+        # bekleyen onarımlar ulaşılabilir olunca yapılır
+        self.ulasilamaz = not self._ulasilabilir()
+        if not self.ulasilamaz:
+            self._sikistir()
+            self._hesapla()
+
+    def mesafe(self):
+        """Başlangıçtan köke kalan hamle sayısı (yol yoksa None)"""
+        if self.ulasilamaz:
+            return None
+        mesafe = self.g[self.baslangic]
+        return mesafe if mesafe < SONSUZ else None
+
+    def adim(self):
+        """Köke yaklaştıran ilk adım (y, x); zaten kökteysek ya da yol yoksa None"""
+        if self.mesafe() is None:
+            return None
+        return self.labirent.alandanAdim(self.g, self.baslangic, self.ofsetler,
+                                         self.gecis, self.ara_kontrol)
+
+    def _ulasilabilir(self):
+        """
+        Başlangıçtan köke yol var mı? Ara noktalar sadece geçilebilir
+        hücreler olabildiği için yol ya doğrudan köke gider ya da
+        başlangıcın ve kökün değdiği bir bileşenden geçer.
+        """
+        if self.kok == self.baslangic or self.kok in self._komsular(self.baslangic):
+            return True
+        return not self._degdigiBilesenler(self.baslangic).isdisjoint(
+            self._degdigiBilesenler(self.kok))
+
+    def _degdigiBilesenler(self, indeks):
+        if self._bilesenler is None:
+            # Izgarada bir kez bulunur, haritadaki bütün planlayıcılar paylaşır
+            self._bilesenler = self.labirent.bilesenler(self.ofsetler, self.gecis,
+                                                        self.ara_kontrol)
+        bilesenler = self._bilesenler
+        degdigi = {bilesenler[komsu] for komsu in self._komsular(indeks)}
+        degdigi.add(bilesenler[indeks])
+        degdigi.discard(-1)
+        return degdigi
+
+    def _mesafe(self, indeks1, indeks2):
+        """Sezgisel: iki hücre arasındaki en az hamle sayısı (yukarı yuvarlanmış)"""
+        satir_adimi = self.labirent.satir_adimi
+        y1, x1 = divmod(indeks1, satir_adimi)
+        y2, x2 = divmod(indeks2, satir_adimi)
+        return (abs(y1 - y2) + abs(x1 - x2) + self.adim_boyu - 1) // self.adim_boyu
+
+    def _anahtar(self, indeks):
+        enaz = min(self.g[indeks], self.rhs[indeks])
+        return (enaz + self._mesafe(indeks, self.baslangic) + self.km, enaz)
+
+    def _ekle(self, indeks):
+        anahtar = self._anahtar(indeks)
+        self.anahtarlar[indeks] = anahtar
+        heapq.heappush(self.queue, (anahtar[0], anahtar[1], indeks))
+
+    def _sikistir(self):
+        """
+        Kuyruktaki eskimiş kayıtlar geçerlilerden çoğalınca kuyruğu
+        geçerli anahtarlardan yeniden kurar; uzun oyunlarda yığılmasınlar.
+        """
+        if len(self.queue) <= KUYRUK_ESIGI or len(self.queue) <= 2 * len(self.anahtarlar):
+            return
+        self.queue = [(k1, k2, indeks) for indeks, (k1, k2) in self.anahtarlar.items()]
+        heapq.heapify(self.queue)
+
+    def _komsular(self, indeks):
+        return self.labirent.komsuHucreler(indeks, self.ofsetler, self.ara_kontrol)
+
+    def _guncelle(self, indeks):
+        """Hücrenin rhs değerini komşularından yeniden hesaplar, kuyruğu düzeltir"""
+        if indeks != self.kok:
+            hucreler, gecis, g = self.labirent.hucreler, self.gecis, self.g
+            en_iyi = SONSUZ
+            for komsu in self._komsular(indeks):
+                # Kök dışındaki geçilemez hücreler ara nokta olamaz
+                if (komsu == self.kok or gecis[hucreler[komsu]]) and g[komsu] + 1 < en_iyi:
+                    en_iyi = g[komsu] + 1
+            self.rhs[indeks] = en_iyi
+
+        if self.g[indeks] != self.rhs[indeks]:
+            self._ekle(indeks)
+        else:
+            self.anahtarlar.pop(indeks, None)
+
+    def _komsulariGuncelle(self, indeks):
+        for komsu in self._komsular(indeks):
+            self._guncelle(komsu)
+
+    def _hesapla(self):
+        g, rhs, baslangic = self.g, self.rhs, self.baslangic
+        hucreler, gecis = self.labirent.hucreler, self.gecis
+
+        while self.queue:
+            k1, k2, indeks = self.queue[0]
+            if self.anahtarlar.get(indeks) != (k1, k2):
+                heapq.heappop(self.queue)  # Eskimiş kayıt
+                continue
+            if (k1, k2) >= self._anahtar(baslangic) and rhs[baslangic] == g[baslangic]:
+                break
+
+            heapq.heappop(self.queue)
+            yeni_anahtar = self._anahtar(indeks)
+            if (k1, k2) < yeni_anahtar:
+                self._ekle(indeks)
+                continue
+            del self.anahtarlar[indeks]
+
+            # Sadece kök ve geçilebilir hücreler komşularının yolunda olabilir
+            ara_nokta = indeks == self.kok or gecis[hucreler[indeks]]
+            if g[indeks] > rhs[indeks]:
+                g[indeks] = rhs[indeks]
+            else:
+                g[indeks] = SONSUZ
+                self._guncelle(indeks)
+            if ara_nokta:
+                self._komsulariGuncelle(indeks)
@@ -0,0 +1,222 @@
+import pygame
+from collections import OrderedDict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Renkler ve sabitler
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+YELLOW = (255, 255, 0)
+BLUE = (0, 0, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+PURPLE = (128, 0, 128)
+DARK_RED = (139, 0, 0)
+ORANGE = (255, 165, 0)
+CELL_SIZE = 60
+MARGIN = 3
+
+# Arka plan gradyanları: her renk kanalında satır numarasının bölüneceği
+# sayı, 0 kanalın kapalı olduğu anlamına gelir
+MENU_GRADYANI = (3, 4, 2)
+EKRAN_GRADYANI = (4, 4, 2)  # Kontroller ve yardım ekranları
+KAZANMA_GRADYANI = (0, 3, 0)
+KAYBETME_GRADYANI = (3, 0, 0)
+
+_gradyanlar = {}
+
+def gradyan(genislik, yukseklik, bolenler):
+    """
+    Yukarıdan aşağıya renklenen arka planı ekran boyutu başına bir kez
+    üretir; sonraki çağrılar aynı Surface'i döndürür. NumPy varsa bütün
+    dizi surfarray ile tek seferde kurulur, yoksa satır satır çizilir.
+    """
+    anahtar = (genislik, yukseklik, bolenler)
+    if anahtar in _gradyanlar:
+        return _gradyanlar[anahtar]
+
+    if numpy is not None:
+        satirlar = numpy.arange(yukseklik)
+        renkler = numpy.zeros((yukseklik, 3), dtype=numpy.uint8)
+        for kanal, bolen in enumerate(bolenler):
+            if bolen:
+                renkler[:, kanal] = numpy.minimum(255, satirlar // bolen)
+        pikseller = numpy.empty((genislik, yukseklik, 3), dtype=numpy.uint8)
+        pikseller[:] = renkler  # surfarray [x][y] sırasıyla indekslenir
+        yuzey = pygame.surfarray.make_surface(pikseller)
+    else:
+        yuzey = pygame.Surface((genislik, yukseklik))
+        for i in range(yukseklik):
+            color = tuple(min(255, i // bolen) if bolen else 0 for bolen in bolenler)
+            pygame.draw.line(yuzey, color, (0, i), (genislik, i))
+
+    yuzey = yuzey.convert()
+    _gradyanlar[anahtar] = yuzey
+    return yuzey
+
+class YaziOnbellegi:
+    """
+    Font nesnelerini boyuta göre, çizilmiş yazıları (boyut, metin, renk)
+    üçlüsüne göre saklar. Aynı yazı her karede yeniden çizilmez; en uzun
+    süre kullanılmayan yazılar en_fazla_yazi aşılınca atılır.
+    Dönen Surface paylaşılır: saydamlık her çağrıda alfa ile yeniden
+    ayarlanır (None tamamen opak demektir), yüzeyin üzerine çizilmemelidir.
+    """
+    def __init__(self, en_fazla_yazi=256):
+        self.en_fazla_yazi = en_fazla_yazi
+        self._fontlar = {}
+        self._yazilar = OrderedDict()
+
+    def font(self, boyut):
+        if boyut not in self._fontlar:
+            self._fontlar[boyut] = pygame.font.Font(None, boyut)
+        return self._fontlar[boyut]
+
+    def yazi(self, metin, boyut, renk, alfa=None):
+        anahtar = (boyut, metin, tuple(renk))
+        yuzey = self._yazilar.get(anahtar)
+        if yuzey is None:
+            yuzey = self.font(boyut).render(metin, True, renk)
+            self._yazilar[anahtar] = yuzey
+            if len(self._yazilar) > self.en_fazla_yazi:
+                self._yazilar.popitem(last=False)
+        else:
+            self._yazilar.move_to_end(anahtar)
+        # Yazılar piksel başına saydamdır; None (yüzey saydamlığını kapatmak)
+        # arka planı opak gösterirdi, bu yüzden tam opaklık 255 ile verilir
+        yuzey.set_alpha(255 if alfa is None else alfa)
+        return yuzey
+
+class KirliAlanlar:
+    """
+    Ekranda bir kareden diğerine değişen bölgeleri bulur. Her karede
+    çizilecek öğeler kimlik -> (görünüm, Rect) olarak verilir; görünümü
+    ya da yeri değişen, yeni çıkan veya kaybolan öğelerin eski ve yeni
+    dikdörtgenleri kirli sayılır. Kamera kayması ya da ekranın üstüne
+    başka bir şey çizilmesi gibi durumlarda tamamiKirli() çağrılır.
+    """
+    def __init__(self):
+        self._onceki = {}
+        self._tam = True
+
+    def tamamiKirli(self):
+        self._tam = True
+
+    def karsilastir(self, ogeler):
+        """Tüm ekranın çizilmesi gerekiyorsa None, aksi halde kirli Rect listesi döner"""
+        onceki, self._onceki = self._onceki, ogeler
+        if self._tam:
+            self._tam = False
+            return None
+
+        kirli = []
+        for kimlik in onceki.keys() | ogeler.keys():
+            eski, yeni = onceki.get(kimlik), ogeler.get(kimlik)
+            if eski == yeni:
+                continue
+            if eski:
+                kirli.append(eski[1])
+            if yeni:
+                kirli.append(yeni[1])
+        return kirli
+
+class LabirentKatmani:
+    """
+    Labirentin değişmeyen kısmını (duvarlar, yollar, kapılar, hedef ve
+    başlangıç) PARCA x PARCA hücrelik Surface'lere bir kez çizer.
+    Her karede sadece görüş alanına düşen parçalar kopyalanır, böylece
+    çizim maliyeti harita boyutundan bağımsız kalır. Parçalar ilk
+    göründüklerinde çizilir; en uzun süre kullanılmayanlar atılır.
+    Harita değişince (yeni sürüm) önbellek tamamen temizlenir.
+    """
+    PARCA = 8
+
+    def __init__(self, yazilar, en_fazla_parca=48):
+        self.yazilar = yazilar
+        self.en_fazla_parca = en_fazla_parca
+        self._parcalar = OrderedDict()
+        self._surum = None
+
+    def gecersizKil(self):
+        self._parcalar.clear()
+        self._surum = None
+
+    def ciz(self, hedef, harita, kamera_x, kamera_y, cols, rows):
+        """Görüş alanını (kamera_x, kamera_y) köşesinden cols x rows hücre olarak çizer"""
+        if self._surum != harita.surum:
+            self.gecersizKil()
+            self._surum = harita.surum
+
+        ilk_px, ilk_py = kamera_x // self.PARCA, kamera_y // self.PARCA
+        son_px, son_py = (kamera_x + cols - 1) // self.PARCA, (kamera_y + rows - 1) // self.PARCA
+        alan = pygame.Rect(0, 0, cols * CELL_SIZE, rows * CELL_SIZE)
+        eski_kirpma = hedef.get_clip()
+        hedef.set_clip(alan.clip(eski_kirpma))
+        for py in range(ilk_py, son_py + 1):
+            for px in range(ilk_px, son_px + 1):
+                parca = self._parcaGetir(harita, px, py)
+                hedef.blit(parca, ((px * self.PARCA - kamera_x) * CELL_SIZE,
+                                   (py * self.PARCA - kamera_y) * CELL_SIZE))
+        hedef.set_clip(eski_kirpma)
+
+    def _parcaGetir(self, harita, px, py):
+        anahtar = (px, py)
+        if anahtar in self._parcalar:
+            self._parcalar.move_to_end(anahtar)
+            return self._parcalar[anahtar]
+
+        parca = self._parcaCiz(harita, px, py)
+        self._parcalar[anahtar] = parca
+        if len(self._parcalar) > self.en_fazla_parca:
+            self._parcalar.popitem(last=False)
+        return parca
+
+    def _parcaCiz(self, harita, px, py):
+        bas_x, bas_y = px * self.PARCA, py * self.PARCA
+        cols = min(self.PARCA, harita.genislik - bas_x)
+        rows = min(self.PARCA, harita.yukseklik - bas_y)
+        parca = pygame.Surface((cols * CELL_SIZE, rows * CELL_SIZE)).convert()
+        parca.fill(WHITE)
+
+        baslangic = harita.baslangic
+        for i in range(rows):
+            for j in range(cols):
+                rect = pygame.Rect(j*CELL_SIZE, i*CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                x, y = bas_x + j, bas_y + i
+                self._hucreCiz(parca, rect, harita.labirent.hucre(x, y), harita.kapilar)
+
+                # Başlangıç noktası
+                if x == baslangic.getX() and y == baslangic.getY():
+                    pygame.draw.rect(parca, (255, 255, 200), rect)  # Açık sarı arka plan
+                    pygame.draw.rect(parca, YELLOW, rect, 2)  # Sarı çerçeve
+        return parca
+
+    def _hucreCiz(self, yuzey, rect, cell, kapilar):
+        # Önce tüm hücrelere beyaz arka plan çiz
+        pygame.draw.rect(yuzey, WHITE, rect)
+
+        # Hücre tipine göre çizim
+        if cell == '1':  # Duvar
+            # Duvarları daha belirgin yap
+            pygame.draw.rect(yuzey, BLACK, rect)
+            # Duvar kenarlarına gri çerçeve ekle
+            pygame.draw.rect(yuzey, (64, 64, 64), rect, 2)
+        elif cell == '0':  # Yol
+            # Yollara hafif gri arka plan ekle
+            pygame.draw.rect(yuzey, (240, 240, 240), rect)
+            # Izgara çizgileri ekle
+            pygame.draw.rect(yuzey, (200, 200, 200), rect, 1)
+        elif cell == 'T':  # Hedef
+            pygame.draw.rect(yuzey, (200, 255, 200), rect)  # Açık yeşil arka plan
+            pygame.draw.rect(yuzey, GREEN, rect, 2)  # Yeşil çerçeve
+            text = self.yazilar.yazi('⭐', 36, BLACK)
+            yuzey.blit(text, text.get_rect(center=rect.center))
+        elif cell in kapilar:  # Kapılar
+            # Kapılara gradyan efekti ekle
+            pygame.draw.rect(yuzey, (100, 100, 255), rect)  # Koyu mavi
+            pygame.draw.rect(yuzey, BLUE, rect, 3)  # Mavi çerçeve
+            text = self.yazilar.yazi(cell, 36, WHITE)
+            yuzey.blit(text, text.get_rect(center=rect.center))
@@ -0,0 +1,248 @@
+import argparse
+import itertools
+import mmap
+import struct
+from izgara import Izgara, SINIR
+from karakterler import Lokasyon
+
+# Her yüklenen haritaya ayrı bir sürüm numarası verilir; mesafe
+# önbellekleri bu numaraya bağlıdır
+_surum_sayaci = itertools.count(1)
+
+# İkili harita biçimi: imza, biçim sürümü, genişlik, yükseklik, başlangıç
+# x/y, hedef x/y, kapı sayısı, karakter sayısı, sürü asker sayısı.
+# Ardından kapılar (ad, x, y), karakterler (ad, kapı) ve 8 bayta
+# hizalanmış, çerçeveli hücre dizisi gelir.
+_IKILI_BASLIK = struct.Struct('<4sHxxIIIIIIHHI')
+_IKILI_IMZA = b'SWHR'
+_IKILI_SURUM = 2
+_KONUM = struct.Struct('<II')
+
+class Harita:
+    """Labirent ızgarası ile kapı, başlangıç, hedef ve karakter bilgileri"""
+    def __init__(self, labirent, karakter_bilgileri, kapilar, baslangic, hedef, suru=0):
+        self.labirent = labirent
+        self.karakter_bilgileri = karakter_bilgileri
+        self.kapilar = kapilar
+        self.baslangic = baslangic
+        self.hedef = hedef
+        # Haritaya dağıtılacak sürü askerlerinin sayısı (suru.Suru)
+        self.suru = suru
+        self.genislik = labirent.genislik
+        self.yukseklik = labirent.yukseklik
+        self.surum = next(_surum_sayaci)
+
+def haritaYukle(dosya):
+    """
+    Haritayı ve karakter konumlarını yükler. Dosya haritaKaydet ile
+    yazılmış ikili bir haritaysa mmap ile kopyalanmadan açılır, aksi
+    halde metin olarak okunur.
+    Metin formatı:
+    Boyut:14x11
+    Kapi:A,X:4,Y:0
+    Kapi:B,X:4,Y:10
+    Nokta:Baslangic,X:6,Y:5
+    Nokta:Hedef,X:4,Y:10
+    Karakter:DarthVader,Kapi:A
+    Karakter:KyloRen,Kapi:B
+    Karakter:Stormtrooper,Kapi:A
+    0 0 0 0 1 0 0 0 0 0 0 0 1 0
+    ...
+    Satırlar boşluksuz da yazılabilir (00001000000010).
+    İsteğe bağlı Suru:500 satırı haritaya 500 askerlik bir Stormtrooper
+    sürüsü dağıtır.
+    Metin dosyası satır satır okunur; bozuk satırlar satır numarasıyla
+    bildirilir.
+    Kapi ve Nokta satırları olmayan eski 14x11 haritalarda kapılar,
+    başlangıç ve hedef eski sabit konumlarına yerleştirilir.
+    """
+    try:
+        with open(dosya, 'rb') as f:
+            ikili = f.read(len(_IKILI_IMZA)) == _IKILI_IMZA
+        if ikili:
+            return _ikiliHaritaYukle(dosya)
+
+        with open(dosya, 'r', encoding='utf-8-sig') as f:
+            (karakter_bilgileri, kapilar, baslangic, hedef, boyut, suru,
+             labirent) = _metinHaritaOku(f)
+
+        # Boyut kontrolü
+        cols, rows = labirent.genislik, labirent.yukseklik
+        if boyut and boyut != (cols, rows):
+            raise ValueError(f"Harita boyutları başlıkta {boyut[0]}x{boyut[1]}, "
+                             f"labirentte {cols}x{rows}!")
+
+        if not kapilar and baslangic is None and hedef is None:
+            # Eski format: konumlar sadece 14x11 harita için tanımlı
+            if cols != 14 or rows != 11:
+                raise ValueError(f"Kapi ve Nokta satırları olmayan harita 14x11 olmalı! "
+                                 f"Mevcut: {cols}x{rows}")
+            kapilar = {
+                'A': Lokasyon(4, 0),    # x=4, y=0 (üst kapı)
+                'B': Lokasyon(4, 10)    # x=4, y=10 (alt kapı)
+            }
+            baslangic = Lokasyon(6, 5)   # x=6, y=5 (orta nokta)
+            hedef = Lokasyon(4, 10)      # x=4, y=10 (B kapısı ile aynı)
+
+        if baslangic is None or hedef is None:
+            raise ValueError("Haritada Nokta:Baslangic ve Nokta:Hedef satırları olmalı!")
+
+        isaretler = list(kapilar.items()) + [('S', baslangic), ('T', hedef)]
+        _konumlariDenetle(isaretler, cols, rows)
+
+        # İşaretlemeler
+        for isaret, konum in isaretler:
+            labirent.isaretle(konum.getX(), konum.getY(), isaret)
+
+        return Harita(labirent, karakter_bilgileri, kapilar, baslangic, hedef, suru)
+
+    except Exception as e:
+        print(f"Harita yükleme hatası: {str(e)}")
+        raise
+
+def _baslikOku(line, karakter_bilgileri, kapilar, noktalar):
+    """Virgülle ayrılmış Anahtar:Değer çiftlerinden oluşan bir başlık satırını işler"""
+    bilgi = {}
+    for part in line.split(','):
+        anahtar, _, deger = part.partition(':')
+        bilgi[anahtar.strip()] = deger.strip()
+
+    if 'Karakter' in bilgi:
+        karakter_bilgileri.append({'karakter': bilgi['Karakter'],
+                                   'kapi': bilgi.get('Kapi')})
+    elif 'Suru' in bilgi:
+        noktalar['Suru'] = int(bilgi['Suru'])
+    elif 'Kapi' in bilgi:
+        kapilar[bilgi['Kapi']] = Lokasyon(int(bilgi['X']), int(bilgi['Y']))
+    elif bilgi.get('Nokta') in ('Baslangic', 'Hedef'):
+        noktalar[bilgi['Nokta']] = Lokasyon(int(bilgi['X']), int(bilgi['Y']))
+    elif 'Boyut' in bilgi:
+        genislik, yukseklik = bilgi['Boyut'].lower().split('x')
+        noktalar['Boyut'] = (int(genislik), int(yukseklik))
+    else:
+        raise ValueError("bilinmeyen başlık")
+
+def _metinHaritaOku(f):
+    """
+    Metin haritayı satırları bellekte tutmadan okur: başlık satırları
+    işlenir, labirent satırları doğrudan çerçeveli hücre dizisine eklenir.
+    Hatalar satır numarasıyla birlikte ValueError olarak verilir.
+    """
+    karakter_bilgileri = []
+    kapilar = {}
+    noktalar = {}
+    hucreler = None
+    genislik = yukseklik = 0
+
+    for satir_no, line in enumerate(f, 1):
+        line = line.strip()
+        if hucreler is None and ':' in line:
+            try:
+                _baslikOku(line, karakter_bilgileri, kapilar, noktalar)
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{satir_no}. satır anlaşılamadı ({e}): {line}") from None
+            continue
+        if not line:
+            continue
+
+        try:
+            veri = ''.join(line.split()).encode('ascii')
+        except UnicodeEncodeError:
+            raise ValueError(f"{satir_no}. satırda geçersiz karakter: {line}") from None
+        if hucreler is None:
+            # İlk labirent satırı genişliği belirler; üst çerçeve eklenir
+            genislik = len(veri)
+            hucreler = bytearray([SINIR]) * (genislik + 2)
+        elif len(veri) != genislik:
+            raise ValueError(f"{satir_no}. satırın uzunluğu {len(veri)}, beklenen {genislik}")
+        hucreler.append(SINIR)
+        hucreler += veri
+        hucreler.append(SINIR)
+        yukseklik += 1
+
+    if hucreler is None:
+        raise ValueError("Haritada labirent satırı yok!")
+    hucreler += bytes([SINIR]) * (genislik + 2)
+
+    return (karakter_bilgileri, kapilar, noktalar.get('Baslangic'), noktalar.get('Hedef'),
+            noktalar.get('Boyut'), noktalar.get('Suru', 0),
+            Izgara(genislik, yukseklik, hucreler))
+
+def _konumlariDenetle(isaretler, cols, rows):
+    for isaret, konum in isaretler:
+        if not (0 <= konum.getX() < cols and 0 <= konum.getY() < rows):
+            raise ValueError(f"{isaret} konumu harita dışında: ({konum.getX()}, {konum.getY()})")
+
+def _metinYaz(f, metin):
+    veri = (metin or '').encode('utf-8')
+    f.write(bytes([len(veri)]) + veri)
+
+def _metinOku(tampon, ofset):
+    uzunluk = tampon[ofset]
+    return bytes(tampon[ofset + 1:ofset + 1 + uzunluk]).decode('utf-8'), ofset + 1 + uzunluk
+
+def haritaKaydet(harita, dosya):
+    """Haritayı (işaretlenmiş hücreleriyle birlikte) ikili biçimde kaydeder"""
+    with open(dosya, 'wb') as f:
+        f.write(_IKILI_BASLIK.pack(_IKILI_IMZA, _IKILI_SURUM, harita.genislik, harita.yukseklik,
+                                   harita.baslangic.getX(), harita.baslangic.getY(),
+                                   harita.hedef.getX(), harita.hedef.getY(),
+                                   len(harita.kapilar), len(harita.karakter_bilgileri),
+                                   harita.suru))
+        for kapi, konum in harita.kapilar.items():
+            _metinYaz(f, kapi)
+            f.write(_KONUM.pack(konum.getX(), konum.getY()))
+        for bilgi in harita.karakter_bilgileri:
+            _metinYaz(f, bilgi['karakter'])
+            _metinYaz(f, bilgi['kapi'])
+        f.write(b'\0' * (-f.tell() % 8))
+        f.write(harita.labirent.hucreler)
+
+def _ikiliHaritaYukle(dosya):
+    """
+    İkili haritayı mmap ile açar. Hücre dizisi kopyalanmaz; Izgara
+    doğrudan dosyanın sayfalarını okur. Dosya yazmaya karşı korunur:
+    isaretle gibi değişiklikler sadece bu süreçteki kopyaya yansır.
+    """
+    with open(dosya, 'rb') as f:
+        tampon = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    (_, surum, genislik, yukseklik, bas_x, bas_y, hedef_x, hedef_y,
+     kapi_sayisi, karakter_sayisi, suru) = _IKILI_BASLIK.unpack_from(tampon)
+    if surum != _IKILI_SURUM:
+        raise ValueError(f"İkili harita sürümü {surum} desteklenmiyor!")
+
+    ofset = _IKILI_BASLIK.size
+    kapilar = {}
+    for _ in range(kapi_sayisi):
+        kapi, ofset = _metinOku(tampon, ofset)
+        x, y = _KONUM.unpack_from(tampon, ofset)
+        ofset += _KONUM.size
+        kapilar[kapi] = Lokasyon(x, y)
+
+    karakter_bilgileri = []
+    for _ in range(karakter_sayisi):
+        karakter, ofset = _metinOku(tampon, ofset)
+        kapi, ofset = _metinOku(tampon, ofset)
+        karakter_bilgileri.append({'karakter': karakter, 'kapi': kapi or None})
+    ofset += -ofset % 8
+
+    labirent = Izgara(genislik, yukseklik, memoryview(tampon)[ofset:])
+    baslangic, hedef = Lokasyon(bas_x, bas_y), Lokasyon(hedef_x, hedef_y)
+    _konumlariDenetle(list(kapilar.items()) + [('S', baslangic), ('T', hedef)],
+                      genislik, yukseklik)
+    return Harita(labirent, karakter_bilgileri, kapilar, baslangic, hedef, suru)
+
+def haritaDonustur(kaynak, hedef):
+    """Metin (ya da ikili) haritayı ikili biçime çevirir"""
+    haritaKaydet(haritaYukle(kaynak), hedef)
+
+def main():
+    parser = argparse.ArgumentParser(description="Metin haritayı hızlı açılan ikili biçime çevirir")
+    parser.add_argument("kaynak", help="Metin harita dosyası")
+    parser.add_argument("hedef", help="Yazılacak ikili harita dosyası")
+    args = parser.parse_args()
+    haritaDonustur(args.kaynak, args.hedef)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+from array import array
+
+try:
+    import numpy
+except ImportError:  # NumPy yoksa mesafe alanları saf Python ile hesaplanır
+    numpy = None
+
+# Hücre kodları: metin haritadaki karakterin bayt değeri saklanır
+YOL = ord('0')
+DUVAR = ord('1')
+SINIR = ord('#')  # Haritanın çevresindeki çerçeve, haritanın parçası değil
+
+# Bu kadar ve daha fazla hücresi olan ızgaralarda mesafe alanları NumPy
+# ile hesaplanır; eşik kiyaslama.py sonuçlarına göre seçildi
+VEKTOR_ESIGI = 16384
+# Bundan küçük dalga cepheleri NumPy yerine düz Python ile genişletilir
+KUCUK_CEPHE = 32
+# alandanKomsular bu kadar ve daha fazla indeksin adımını NumPy ile bulur
+TOPLU_ESIGI = 128
+
+def _gecisTablosu(gecilebilir):
+    """Hücre kodundan geçilebilirliğe 256 elemanlı arama tablosu"""
+    tablo = bytearray(256)
+    for kod in range(256):
+        tablo[kod] = 1 if gecilebilir(kod) else 0
+    return bytes(tablo)
+
+# Sadece yol (0) hücreleri geçilebilir - Stormtrooper
+SADECE_YOL = _gecisTablosu(lambda kod: kod == YOL)
+# Duvar ve çerçeve dışındaki her hücre geçilebilir - Kylo Ren ve oyuncu
+DUVAR_DISI = _gecisTablosu(lambda kod: kod != DUVAR and kod != SINIR)
+
+def maliyetTablosu(maliyetler, varsayilan=1):
+    """
+    {hücre karakteri: maliyet} sözlüğünden 256 elemanlı hücreye girme
+    maliyeti tablosu kurar. A* sezgiseli için maliyetler en az 1 olmalıdır.
+    """
+    tablo = bytearray([varsayilan]) * 256
+    for karakter, maliyet in maliyetler.items():
+        tablo[ord(karakter)] = maliyet
+    if min(tablo) < 1:
+        raise ValueError("Arazi maliyetleri en az 1 olmalı!")
+    return bytes(tablo)
+
+class Izgara:
+    """
+    Labirenti tek boyutlu bir bytearray içinde tutar.
+    Haritanın çevresine bir hücrelik SINIR çerçevesi eklenir; böylece
+    komşular sınır kontrolü yapmadan sabit ofsetlerle bulunur.
+    (x, y) hücresinin indeksi (y + 1) * satir_adimi + (x + 1) olur.
+    """
+    def __init__(self, genislik, yukseklik, hucreler=None):
+        """
+        hucreler verilirse (çerçeve dahil hazır hücre dizisi, örneğin
+        mmap üzerinde bir memoryview) kopyalanmadan kullanılır.
+        """
+        self.genislik = genislik
+        self.yukseklik = yukseklik
+        self.satir_adimi = genislik + 2
+        boyut = self.satir_adimi * (yukseklik + 2)
+        if hucreler is None:
+            hucreler = bytearray([SINIR]) * boyut
+        elif len(hucreler) != boyut:
+            raise ValueError(f"Hücre dizisi {len(hucreler)} bayt, beklenen {boyut}")
+        self.hucreler = hucreler
+        # Mesafe alanları NumPy ile mi hesaplansın (kıyaslamada değiştirilebilir)
+        self.vektorel = numpy is not None and boyut >= VEKTOR_ESIGI
+        # (ofsetler, gecis, ara_kontrol) -> bileşen tablosu; bkz. bilesenler
+        self._bilesenler = {}
+
+        # Yön sırası enKisaYol ile aynı: yukarı, aşağı, sol, sağ
+        adim = self.satir_adimi
+        self.komsular = (-adim, adim, -1, 1)
+        self.ikili_komsular = (-2 * adim, 2 * adim, -2, 2)
+
+    @classmethod
+    def satirlardan(cls, satirlar):
+        """Her biri tek karakterlik hücrelerden oluşan satır listesinden ızgara kurar"""
+        izgara = cls(len(satirlar[0]), len(satirlar))
+        for y, satir in enumerate(satirlar):
+            veri = ''.join(satir).encode('ascii')
+            if len(veri) != izgara.genislik:
+                raise ValueError(f"{y + 1}. satırın uzunluğu {len(veri)}, beklenen {izgara.genislik}")
+            bas = izgara.indeks(0, y)
+            izgara.hucreler[bas:bas + izgara.genislik] = veri
+        return izgara
+
+    def indeks(self, x, y):
+        return (y + 1) * self.satir_adimi + x + 1
+
+    def konum(self, indeks):
+        """İndeksi pathfinder'ların kullandığı (y, x) demetine çevirir"""
+        y, x = divmod(indeks, self.satir_adimi)
+        return (y - 1, x - 1)
+
+    def hucre(self, x, y):
+        return chr(self.hucreler[self.indeks(x, y)])
+
+    def isaretle(self, x, y, karakter):
+        self.hucreler[self.indeks(x, y)] = ord(karakter)
+        self._bilesenler.clear()
+
+    def acik(self, x, y):
+        """Hücre harita içinde ve duvar değilse True (sınır dışı da kapalıdır)"""
+        if not (-1 <= x <= self.genislik and -1 <= y <= self.yukseklik):
+            return False
+        return DUVAR_DISI[self.hucreler[self.indeks(x, y)]] == 1
+
+    def yolOlustur(self, onceki, son):
+        """
+        Öncül dizisini hedeften geriye izleyerek başlangıçtan hedefe
+        (y, x) yolunu oluşturur. Başlangıç hücresinin önceli kendisidir.
+        """
+        yol = [self.konum(son)]
+        while onceki[son] != son:
+            son = onceki[son]
+            yol.append(self.konum(son))
+        return yol[::-1]
+
+    def komsuHucreler(self, indeks, ofsetler, ara_kontrol=False):
+        """
+        indeks hücresinden ofsetlerle ulaşılan, çerçevede olmayan hücreler.
+        ara_kontrol iki adımlık hareketlerde aradaki hücrenin de açık
+        olmasını ister.
+        """
+        hucreler = self.hucreler
+        for ofset in ofsetler:
+            # Ara nokta çerçevedeyse hedef hücre dizinin dışına taşabilir,
+            # bu yüzden önce ara nokta kontrol edilir
+            if ara_kontrol and not DUVAR_DISI[hucreler[indeks + (ofset >> 1)]]:
+                continue
+            komsu = indeks + ofset
+            if hucreler[komsu] != SINIR:
+                yield komsu
+
+    def bilesenler(self, ofsetler, gecis, ara_kontrol=False):
+        """
+        Geçilebilir hücreleri bağlı bileşenlere ayıran tablo (diğer
+        hücreler -1). Aynı hareket kuralları için ızgara başına bir kez
+        hesaplanır ve bütün planlayıcılar tarafından paylaşılır;
+        isaretle tabloları geçersiz kılar.
+        """
+        anahtar = (ofsetler, gecis, ara_kontrol)
+        tablo = self._bilesenler.get(anahtar)
+        if tablo is None:
+            tablo = self._bilesenler[anahtar] = self._bilesenleriBul(ofsetler, gecis, ara_kontrol)
+        return tablo
+
+    def _bilesenleriBul(self, ofsetler, gecis, ara_kontrol):
+        hucreler = self.hucreler
+        bilesenler = array('i', [-1]) * len(hucreler)
+        numara = 0
+        for indeks, kod in enumerate(hucreler):
+            if not gecis[kod] or bilesenler[indeks] != -1:
+                continue
+            bilesenler[indeks] = numara
+            yigin = [indeks]
+            while yigin:
+                current = yigin.pop()
+                for komsu in self.komsuHucreler(current, ofsetler, ara_kontrol):
+                    if gecis[hucreler[komsu]] and bilesenler[komsu] == -1:
+                        bilesenler[komsu] = numara
+                        yigin.append(komsu)
+            numara += 1
+        return bilesenler
+
+    def mesafeAlani(self, hedef, ofsetler, gecis, ara_kontrol=False):
+        """
+        Hedef indeksten geriye doğru tek bir BFS taşması yapar.
+        Dönen alan[i], i hücresinden hedefe kaç hamlede ulaşılacağını
+        tutar (-1: ulaşılamaz). Sadece gecis tablosunda geçilebilir olan
+        hücreler üzerinden ilerlenir, diğerleri yalnızca başlangıç
+        noktası olarak mesafe alabilir. ara_kontrol iki adımlık
+        hareketlerde aradaki hücrenin de açık olmasını ister.
+        """
+        if self.vektorel:
+            return self._vektorMesafeAlani(hedef, ofsetler, gecis, ara_kontrol)
+
+        alan = array('i', [-1]) * len(self.hucreler)
+        alan[hedef] = 0
+        cephe = [hedef]
+        mesafe = 0
+        while cephe:
+            mesafe += 1
+            cephe = self._cepheyiGenislet(alan, cephe, mesafe, ofsetler, gecis, ara_kontrol)
+        return alan
+
+    def _cepheyiGenislet(self, alan, cephe, mesafe, ofsetler, gecis, ara_kontrol):
+        """
+        BFS'in bir seviyesi: cephedeki hücrelerin henüz mesafe almamış
+        komşularına mesafe yazar ve bunlardan geçilebilir olanları, yani
+        yeni cepheyi döndürür.
+        """
+        hucreler = self.hucreler
+        yeni_cephe = []
+        for current in cephe:
+            # komsuHucreler ile aynı kural; en sık dönen döngü olduğu için
+            # üreteç çağrısı yerine burada açık yazılır
+            for ofset in ofsetler:
+                if ara_kontrol and not DUVAR_DISI[hucreler[current + (ofset >> 1)]]:
+                    continue
+                komsu = current + ofset
+                if alan[komsu] == -1 and hucreler[komsu] != SINIR:
+                    alan[komsu] = mesafe
+                    if gecis[hucreler[komsu]]:
+                        yeni_cephe.append(komsu)
+        return yeni_cephe
+
+    def _vektorMesafeAlani(self, hedef, ofsetler, gecis, ara_kontrol):
+        """
+        mesafeAlani'nın NumPy karşılığı; seviye seviye dalga cephesi
+        genişletmesi. Cephe bir indeks dizisidir: her seviyede bütün
+        cephe ofsetler kadar kaydırılır, adaylar geçilebilirlik
+        maskeleriyle tek seferde süzülür. NumPy çağrılarının sabit
+        maliyeti dar cephelerde (koridorlarda) baskın olduğundan
+        KUCUK_CEPHE'den küçük cepheler düz Python ile genişletilir.
+        Sonuç saf Python sürümüyle aynı array('i').
+        """
+        hucreler = self.hucreler
+        kodlar = numpy.frombuffer(hucreler, dtype=numpy.uint8)
+        boyut = len(kodlar)
+        gecilebilir = numpy.frombuffer(gecis, dtype=numpy.uint8).astype(bool)[kodlar]
+        acik = kodlar != SINIR
+        kaydirmalar = numpy.array(ofsetler)
+        if ara_kontrol:
+            ara_acik = numpy.frombuffer(DUVAR_DISI, dtype=numpy.uint8).astype(bool)[kodlar]
+            yarimlar = kaydirmalar >> 1
+
+        # İki yol da aynı belleğe yazar: array ile tek tek, NumPy ile toplu
+        alan = array('i', [-1]) * boyut
+        alan_np = numpy.frombuffer(alan, dtype=numpy.int32)
+        alan[hedef] = 0
+        # Aynı seviyede birden fazla kez bulunan hücreleri elemek için
+        sahip = numpy.empty(boyut, dtype=numpy.intp)
+        cephe = [hedef]
+        mesafe = 0
+
+        while len(cephe):
+            mesafe += 1
+            if len(cephe) < KUCUK_CEPHE:
+                cephe = self._cepheyiGenislet(alan, cephe, mesafe, ofsetler, gecis, ara_kontrol)
+                continue
+
+            kaynak = numpy.asarray(cephe)[:, None]
+            komsular = kaynak + kaydirmalar
+            if ara_kontrol:
+                komsular = komsular[ara_acik[kaynak + yarimlar]]
+            else:
+                komsular = komsular.ravel()
+            komsular = komsular[acik[komsular]]
+            komsular = komsular[alan_np[komsular] == -1]
+            sira = numpy.arange(len(komsular))
+            sahip[komsular] = sira
+            komsular = komsular[sahip[komsular] == sira]
+
+            alan_np[komsular] = mesafe
+            # Geçilemeyen hücreler mesafe alır ama cepheye girmez
+            cephe = komsular[gecilebilir[komsular]]
+
+        return alan
+
+    def _alandanKomsu(self, alan, indeks, ofsetler, gecis, ara_kontrol):
+        mesafe = alan[indeks]
+        if mesafe <= 0:
+            return None  # Zaten hedefteyiz ya da yol yok
+
+        hucreler = self.hucreler
+        for komsu in self.komsuHucreler(indeks, ofsetler, ara_kontrol):
+            if alan[komsu] == mesafe - 1 and (gecis[hucreler[komsu]] or mesafe == 1):
+                return komsu
+
+        return None
+
+    def alandanAdim(self, alan, indeks, ofsetler, gecis, ara_kontrol=False):
+        """
+        Mesafe alanında komşulara bakarak hedefe yaklaştıran ilk adımı
+        (y, x) olarak seçer. Ofsetler enKisaYol'daki yön sırasıyla
+        denendiği için BFS ile aynı adım bulunur.
+        """
+        komsu = self._alandanKomsu(alan, indeks, ofsetler, gecis, ara_kontrol)
+        return None if komsu is None else self.konum(komsu)
+
+    def alandanKomsular(self, alan, indeksler, ofsetler, gecis):
+        """
+        _alandanKomsu'nun toplu hali: indeksler dizisindeki her hücre
+        için hedefe yaklaştıran komşunun indeksini (adım yoksa hücrenin
+        kendisini) içeren yeni bir array('i') döndürür. Aynı hücredeki
+        karakterler için komşu bir kez aranır; TOPLU_ESIGI'nden uzun
+        dizilerde NumPy varsa bütün dizi tek seferde ilerletilir.
+        """
+        if numpy is not None and len(indeksler) >= TOPLU_ESIGI:
+            return self._vektorAlandanKomsular(alan, indeksler, ofsetler, gecis)
+
+        sonraki = {}
+        for indeks in set(indeksler):
+            komsu = self._alandanKomsu(alan, indeks, ofsetler, gecis, False)
+            sonraki[indeks] = indeks if komsu is None else komsu
+        return array('i', map(sonraki.__getitem__, indeksler))
+
+    def _vektorAlandanKomsular(self, alan, indeksler, ofsetler, gecis):
+        """alandanKomsular'ın NumPy karşılığı; ofsetler aynı sırayla denenir"""
+        alan_np = numpy.frombuffer(alan, dtype=numpy.int32)
+        kodlar = numpy.frombuffer(self.hucreler, dtype=numpy.uint8)
+        gecilebilir = numpy.frombuffer(gecis, dtype=numpy.uint8).astype(bool)
+        konumlar = numpy.frombuffer(indeksler, dtype=numpy.int32)
+
+        mesafeler = alan_np[konumlar]
+        sonraki = konumlar.copy()
+        # Zaten hedefte olanlar ya da yolu olmayanlar yerinde kalır
+        kalan = mesafeler > 0
+        for ofset in ofsetler:
+            komsular = konumlar + ofset
+            uygun = kalan & (alan_np[komsular] == mesafeler - 1) & \
+                (gecilebilir[kodlar[komsular]] | (mesafeler == 1))
+            sonraki[uygun] = komsular[uygun]
+            kalan &= ~uygun
+
+        sonuc = array('i')
+        sonuc.frombytes(sonraki.tobytes())
+        return sonuc
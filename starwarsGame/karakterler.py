@@ -0,0 +1,465 @@
+import heapq
+from collections import deque
+from izgara import SADECE_YOL, DUVAR_DISI, SINIR
+from artimsal import ArtimsalAlan
+
+class Lokasyon:
+    # __dict__ olmadan iki alan: nesne küçük, alan erişimi hızlı kalır.
+    # Sık çağrılan kod getX/getY yerine x ve y alanlarını doğrudan okur.
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        if isinstance(other, Lokasyon):
+            return self.x == other.x and self.y == other.y
+        return False
+    
+    def __hash__(self):
+        # Demet oluşturmadan; koordinatlar negatif olmayan tam sayılardır
+        return (self.y << 16) ^ self.x
+
+    def __repr__(self):
+        return f"Lokasyon({self.x}, {self.y})"
+
+    def getX(self): return self.x
+    def getY(self): return self.y
+    def setX(self, x): self.x = x
+    def setY(self, y): self.y = y
+
+class Karakter:
+    # Alt sınıflar da __slots__ tanımlar; karakterlerde __dict__ yoktur
+    __slots__ = ("ad", "tur", "konum", "can", "max_can")
+
+    def __init__(self, ad, tur, konum):
+        self.ad = ad
+        self.tur = tur
+        self.konum = konum
+        self.can = 0
+        self.max_can = 0
+
+    def getAd(self): return self.ad
+    def setAd(self, ad): self.ad = ad
+    
+    def getTur(self): return self.tur
+    def setTur(self, tur): self.tur = tur
+    
+    def getKonum(self): return self.konum
+    def setKonum(self, konum): self.konum = konum
+    
+    def getCan(self): return self.can
+    def setCan(self, can): self.can = can
+
+    def enKisaYol(self, hedef, labirent):
+        """
+        Bu metod kötü karakterler tarafından override edilecek
+        """
+        pass
+
+    def mesafeAlani(self, hedef, labirent):
+        """
+        Hedeften geriye doğru hesaplanan, aynı türdeki tüm karakterlerin
+        paylaşabileceği mesafe alanı. Kötü karakterler override eder.
+        """
+        pass
+
+    def alandanAdim(self, alan, labirent):
+        """
+        mesafeAlani sonucuna bakarak bir sonraki (y, x) adımını döndürür
+        """
+        pass
+
+    def alanMesafesi(self, alan, labirent):
+        """
+        mesafeAlani sonucuna göre hedefe kalan hamle sayısı (yol yoksa None)
+        """
+        pass
+
+    def planlayiciOlustur(self, labirent):
+        """
+        Karaktere ait, hamleler arasında arama durumunu koruyan artımsal
+        planlayıcı. Kötü karakterler override eder.
+        """
+        pass
+
+    def planlayicidanAdim(self, planlayici, hedef, labirent):
+        """
+        Planlayıcıyı hedefin ve karakterin güncel konumuna göre onarıp
+        bir sonraki (y, x) adımını döndürür
+        """
+        pass
+
+    def planlayiciMesafesi(self, planlayici, hedef, labirent):
+        """
+        Planlayıcıya göre hedefe kalan hamle sayısı (yol yoksa None)
+        """
+        pass
+
+class LukeSkywalker(Karakter):
+    __slots__ = ()
+
+    def __init__(self, konum):
+        super().__init__("Luke Skywalker", "İyi", konum)
+        self.can = 3
+        self.max_can = 3
+
+class MasterYoda(Karakter):
+    __slots__ = ()
+
+    def __init__(self, konum):
+        super().__init__("Master Yoda", "İyi", konum)
+        self.can = 6
+        self.max_can = 6
+
+class Stormtrooper(Karakter):
+    __slots__ = ()
+
+    def __init__(self, konum):
+        super().__init__("Stormtrooper", "Kötü", konum)
+    
+    def enKisaYol(self, hedef, labirent):
+        """
+        BFS algoritması ile en kısa yolu bulur.
+        Sadece geçerli yolları (0) kullanır ve dört yönde hareket eder.
+        """
+        hucreler = labirent.hucreler
+        baslangic = labirent.indeks(self.konum.x, self.konum.y)
+        hedef_konum = labirent.indeks(hedef.x, hedef.y)
+        
+        # Her hücrenin BFS ağacındaki öncülü (-1: ziyaret edilmedi).
+        # Yol kopyalamak yerine sadece hedefte bir kez geri izlenir.
+        onceki = [-1] * len(hucreler)
+        onceki[baslangic] = baslangic
+        queue = deque([baslangic])
+        
+        # Dört yön: yukarı, aşağı, sol, sağ. Çerçeve hücreleri yol
+        # olmadığı için ayrıca sınır kontrolü gerekmez.
+        komsular = labirent.komsular
+        
+        while queue:
+            current = queue.popleft()
+            
+            # Hedefe ulaştık mı?
+            if current == hedef_konum:
+                return labirent.yolOlustur(onceki, current)
+            
+            # Her yönü kontrol et
+            for ofset in komsular:
+                komsu = current + ofset
+                # Geçerli yol mu? (0 veya hedef)
+                if (onceki[komsu] == -1 and
+                    (SADECE_YOL[hucreler[komsu]] or komsu == hedef_konum)):
+                    onceki[komsu] = current
+                    queue.append(komsu)
+        
+        return None  # Yol bulunamadı
+
+    def mesafeAlani(self, hedef, labirent):
+        """Oyuncudan geriye tek bir BFS taşması (sadece 0 hücreleri)"""
+        return labirent.mesafeAlani(labirent.indeks(hedef.x, hedef.y),
+                                    labirent.komsular, SADECE_YOL)
+
+    def alandanAdim(self, alan, labirent):
+        return labirent.alandanAdim(alan, labirent.indeks(self.konum.x, self.konum.y),
+                                    labirent.komsular, SADECE_YOL)
+
+    def alanMesafesi(self, alan, labirent):
+        mesafe = alan[labirent.indeks(self.konum.x, self.konum.y)]
+        return mesafe if mesafe >= 0 else None
+
+    def planlayiciOlustur(self, labirent):
+        return ArtimsalAlan(labirent, labirent.komsular, SADECE_YOL)
+
+    def planlayicidanAdim(self, planlayici, hedef, labirent):
+        planlayici.ilerle(labirent.indeks(hedef.x, hedef.y),
+                          labirent.indeks(self.konum.x, self.konum.y))
+        return planlayici.adim()
+
+    def planlayiciMesafesi(self, planlayici, hedef, labirent):
+        planlayici.ilerle(labirent.indeks(hedef.x, hedef.y),
+                          labirent.indeks(self.konum.x, self.konum.y))
+        return planlayici.mesafe()
+
+class DarthVader(Karakter):
+    __slots__ = ("arazi_maliyeti",)
+
+    def __init__(self, konum, arazi_maliyeti=None):
+        super().__init__("Darth Vader", "Kötü", konum)
+        # Hücre kodundan o hücreye girme maliyetine 256 elemanlı tablo
+        # (izgara.maliyetTablosu). None ise tüm hücreler eşit maliyetlidir.
+        self.arazi_maliyeti = arazi_maliyeti
+    
+    def enKisaYol(self, hedef, labirent):
+        """
+        Duvarları yok saydığı için en kısa yol doğrudan bir Manhattan
+        yürüyüşüdür, arama yapmaya gerek yoktur. Eski Dijkstra ile aynı
+        yol üretilir: hedef yukarıdaysa önce dikey, sonra yatay; değilse
+        önce yatay, sonra aşağı doğru ilerlenir. arazi_maliyeti
+        tanımlıysa A* ile en ucuz yol aranır.
+        """
+        if self.arazi_maliyeti is not None:
+            return self._aYildiz(hedef, labirent)
+
+        y, x = self.konum.y, self.konum.x
+        hedef_y, hedef_x = hedef.y, hedef.x
+        yol = [(y, x)]
+
+        while y > hedef_y:
+            y -= 1
+            yol.append((y, x))
+        yon = 1 if hedef_x > x else -1
+        while x != hedef_x:
+            x += yon
+            yol.append((y, x))
+        while y < hedef_y:
+            y += 1
+            yol.append((y, x))
+
+        return yol
+
+    def _aYildiz(self, hedef, labirent):
+        """
+        Ağırlıklı arazide Manhattan sezgiseli ile A*. Bir hücreye girmenin
+        maliyeti arazi_maliyeti[hücre kodu] kadardır (en az 1, böylece
+        sezgisel hiçbir zaman fazla tahmin etmez). Eşit öncelikte hedefe
+        yakın olan, o da eşitse yukarıdaki/soldaki hücre önce açılır.
+        """
+        maliyet = self.arazi_maliyeti
+        hucreler = labirent.hucreler
+        satir_adimi = labirent.satir_adimi
+        baslangic = labirent.indeks(self.konum.x, self.konum.y)
+        hedef_konum = labirent.indeks(hedef.x, hedef.y)
+        hedef_y, hedef_x = divmod(hedef_konum, satir_adimi)
+
+        def sezgisel(indeks):
+            y, x = divmod(indeks, satir_adimi)
+            return abs(y - hedef_y) + abs(x - hedef_x)
+
+        mesafeler = {baslangic: 0}
+        onceki = {baslangic: baslangic}
+        h = sezgisel(baslangic)
+        queue = [(h, h, baslangic)]
+
+        while queue:
+            oncelik, h, current = heapq.heappop(queue)
+            mesafe = mesafeler[current]
+            if oncelik > mesafe + h:
+                continue  # Daha ucuz yoldan zaten açıldı
+
+            if current == hedef_konum:
+                return labirent.yolOlustur(onceki, current)
+
+            for ofset in labirent.komsular:
+                komsu = current + ofset
+                kod = hucreler[komsu]
+                if kod == SINIR:
+                    continue
+                yeni_mesafe = mesafe + maliyet[kod]
+                if yeni_mesafe < mesafeler.get(komsu, yeni_mesafe + 1):
+                    mesafeler[komsu] = yeni_mesafe
+                    onceki[komsu] = current
+                    h = sezgisel(komsu)
+                    heapq.heappush(queue, (yeni_mesafe + h, h, komsu))
+
+        return None
+
+    def mesafeAlani(self, hedef, labirent):
+        """
+        Duvarları yok saydığı için mesafe alanı Manhattan mesafesidir,
+        taşma yapmaya gerek yoktur; alan olarak hedefin kendisi döner.
+        """
+        return (hedef.y, hedef.x)
+
+    def alandanAdim(self, alan, labirent):
+        """
+        Manhattan mesafesini azaltan adımı Dijkstra ile aynı sırayla seçer:
+        hedef yukarıdaysa önce dikey, değilse önce yatay hareket edilir.
+        """
+        if self.arazi_maliyeti is not None:
+            yol = self._aYildiz(Lokasyon(alan[1], alan[0]), labirent)
+            return yol[1] if yol and len(yol) > 1 else None
+
+        y, x = self.konum.y, self.konum.x
+        hedef_y, hedef_x = alan
+        if hedef_y < y:
+            return (y - 1, x)
+        if hedef_x < x:
+            return (y, x - 1)
+        if hedef_x > x:
+            return (y, x + 1)
+        if hedef_y > y:
+            return (y + 1, x)
+        return None  # Zaten hedefteyiz
+
+    def alanMesafesi(self, alan, labirent):
+        if self.arazi_maliyeti is not None:
+            yol = self._aYildiz(Lokasyon(alan[1], alan[0]), labirent)
+            return len(yol) - 1 if yol else None
+        return self._mesafeHesapla((self.konum.y, self.konum.x), alan)
+
+    def planlayiciOlustur(self, labirent):
+        """Adım doğrudan hesaplandığı için saklanacak arama durumu yoktur"""
+        return None
+
+    def planlayicidanAdim(self, planlayici, hedef, labirent):
+        return self.alandanAdim(self.mesafeAlani(hedef, labirent), labirent)
+
+    def planlayiciMesafesi(self, planlayici, hedef, labirent):
+        return self.alanMesafesi(self.mesafeAlani(hedef, labirent), labirent)
+
+    def _mesafeHesapla(self, konum1, konum2):
+        """Manhattan mesafesini hesaplar"""
+        return abs(konum1[0] - konum2[0]) + abs(konum1[1] - konum2[1])
+
+class KyloRen(Karakter):
+    __slots__ = ()
+
+    def __init__(self, konum):
+        super().__init__("Kylo Ren", "Kötü", konum)
+    
+    def enKisaYol(self, hedef, labirent):
+        """
+        İki adımlı BFS algoritması ile en kısa yolu bulur.
+        Her harekette iki kare ilerler.
+        """
+        hucreler = labirent.hucreler
+        baslangic = labirent.indeks(self.konum.x, self.konum.y)
+        hedef_konum = labirent.indeks(hedef.x, hedef.y)
+        
+        onceki = [-1] * len(hucreler)
+        onceki[baslangic] = baslangic
+        queue = deque([baslangic])
+        
+        # İki adımlık yönler: yukarı, aşağı, sol, sağ
+        komsular = labirent.ikili_komsular
+        
+        while queue:
+            current = queue.popleft()
+            
+            # Hedefe ulaştık mı?
+            if current == hedef_konum:
+                return labirent.yolOlustur(onceki, current)
+            
+            # Her yönü kontrol et
+            for ofset in komsular:
+                # Ara noktayı kontrol et (bir adım). Ara nokta çerçevedeyse
+                # hedef nokta harita dışında kalır.
+                if not DUVAR_DISI[hucreler[current + (ofset >> 1)]]:
+                    continue
+                
+                # Hedef nokta geçerli yol mu?
+                komsu = current + ofset
+                if (onceki[komsu] == -1 and
+                    (DUVAR_DISI[hucreler[komsu]] or komsu == hedef_konum)):
+                    onceki[komsu] = current
+                    queue.append(komsu)
+        
+        # Hedef çok uzaksa veya ulaşılamıyorsa, normal hareket et
+        return self._normalHareket(hedef, labirent)
+
+    def _normalHareket(self, hedef, labirent):
+        """
+        Normal (tek adımlı) BFS algoritması ile yedek yol bulur
+        """
+        hucreler = labirent.hucreler
+        baslangic = labirent.indeks(self.konum.x, self.konum.y)
+        hedef_konum = labirent.indeks(hedef.x, hedef.y)
+        
+        onceki = [-1] * len(hucreler)
+        onceki[baslangic] = baslangic
+        queue = deque([baslangic])
+        
+        # Normal yönler
+        komsular = labirent.komsular
+        
+        while queue:
+            current = queue.popleft()
+            
+            if current == hedef_konum:
+                return labirent.yolOlustur(onceki, current)
+            
+            for ofset in komsular:
+                komsu = current + ofset
+                if (onceki[komsu] == -1 and
+                    (DUVAR_DISI[hucreler[komsu]] or komsu == hedef_konum)):
+                    onceki[komsu] = current
+                    queue.append(komsu)
+        
+        return None
+
+    def mesafeAlani(self, hedef, labirent):
+        """
+        İki adımlık ve yedek tek adımlık hareket için oyuncudan geriye
+        birer BFS taşması yapar.
+        """
+        hedef_konum = labirent.indeks(hedef.x, hedef.y)
+        iki_adim = labirent.mesafeAlani(hedef_konum, labirent.ikili_komsular,
+                                        DUVAR_DISI, ara_kontrol=True)
+        tek_adim = labirent.mesafeAlani(hedef_konum, labirent.komsular, DUVAR_DISI)
+        return iki_adim, tek_adim
+
+    def alandanAdim(self, alan, labirent):
+        iki_adim, tek_adim = alan
+        konum = labirent.indeks(self.konum.x, self.konum.y)
+        adim = labirent.alandanAdim(iki_adim, konum, labirent.ikili_komsular,
+                                    DUVAR_DISI, ara_kontrol=True)
+        # İki adımla ulaşılamıyorsa normal hareket et
+        if adim is None and iki_adim[konum] != 0:
+            adim = labirent.alandanAdim(tek_adim, konum, labirent.komsular, DUVAR_DISI)
+        return adim
+
+    def alanMesafesi(self, alan, labirent):
+        iki_adim, tek_adim = alan
+        konum = labirent.indeks(self.konum.x, self.konum.y)
+        mesafe = iki_adim[konum] if iki_adim[konum] >= 0 else tek_adim[konum]
+        return mesafe if mesafe >= 0 else None
+
+    def planlayiciOlustur(self, labirent):
+        """
+        Yedek tek adımlık alan ile iki adımlık alanlar. İki adımlık
+        hareketle sadece x ve y'nin tekliği aynı olan hücrelere
+        ulaşılabildiğinden oyuncu her hamlede başka bir sınıfa geçer;
+        her sınıf için ayrı alan tutulur ki onarım boşa gitmesin.
+        """
+        return ArtimsalAlan(labirent, labirent.komsular, DUVAR_DISI), {}
+
+    def _planlayiciAlani(self, planlayici, hedef, labirent):
+        """
+        Güncel konumlara göre onarılmış iki adımlık alan; karakter
+        oyuncuyla aynı sınıfta değilse iki adımla ulaşamaz, None döner
+        """
+        sinif = (hedef.x % 2, hedef.y % 2)
+        if sinif != (self.konum.x % 2, self.konum.y % 2):
+            return None
+
+        iki_adimlar = planlayici[1]
+        if sinif not in iki_adimlar:
+            iki_adimlar[sinif] = ArtimsalAlan(labirent, labirent.ikili_komsular,
+                                              DUVAR_DISI, ara_kontrol=True)
+        iki_adim = iki_adimlar[sinif]
+        iki_adim.ilerle(labirent.indeks(hedef.x, hedef.y),
+                        labirent.indeks(self.konum.x, self.konum.y))
+        return iki_adim
+
+    def planlayicidanAdim(self, planlayici, hedef, labirent):
+        iki_adim = self._planlayiciAlani(planlayici, hedef, labirent)
+        if iki_adim is not None and iki_adim.mesafe() is not None:
+            return iki_adim.adim()
+
+        # İki adımla ulaşılamıyorsa normal hareket et
+        tek_adim = planlayici[0]
+        tek_adim.ilerle(labirent.indeks(hedef.x, hedef.y),
+                        labirent.indeks(self.konum.x, self.konum.y))
+        return tek_adim.adim()
+
+    def planlayiciMesafesi(self, planlayici, hedef, labirent):
+        iki_adim = self._planlayiciAlani(planlayici, hedef, labirent)
+        if iki_adim is not None and iki_adim.mesafe() is not None:
+            return iki_adim.mesafe()
+
+        tek_adim = planlayici[0]
+        tek_adim.ilerle(labirent.indeks(hedef.x, hedef.y),
+                        labirent.indeks(self.konum.x, self.konum.y))
+        return tek_adim.mesafe()
@@ -0,0 +1,256 @@
+"""
+Yol bulma kıyaslamaları. Büyüyen boyut ve duvar yoğunluğunda labirentler
+üretip kötü karakterlerin enKisaYol metodlarını hem ulaşılabilen hem de
+ulaşılamayan hedefler için ölçer. Sonuçlar JSON olarak kaydedilebilir ve
+önceki bir kayıtla karşılaştırılarak yavaşlamalar yakalanır.
+
+Örnek:
+    python kiyaslama.py yol --json sonuc.json
+    python kiyaslama.py yol --karsilastir onceki.json --tolerans 0.2
+    python kiyaslama.py vektor --boyut 16 32 64 128 256   # NumPy ile saf Python
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import karakterler
+from izgara import Izgara, SADECE_YOL, DUVAR_DISI, maliyetTablosu, numpy
+from karakterler import Lokasyon
+from uretici import labirentUret
+
+def acikAlan(kenar, yogunluk=0.0, tohum=0):
+    """Hiç duvarı olmayan kare alan: en geniş dalga cephesi"""
+    return Izgara.satirlardan([['0'] * kenar for _ in range(kenar)])
+
+def rastgeleLabirent(kenar, yogunluk=0.2, tohum=0):
+    """
+    Hücrelerin yogunluk kadarı rastgele duvar. Köşeden çapraz köşeye iki
+    hücrelik adımlarla rastgele bir yol açılır; böylece hem tek hem iki
+    adımlık hareketle karşı köşeye ulaşılabilir.
+    """
+    rng = random.Random(tohum)
+    satirlar = [['1' if rng.random() < yogunluk else '0' for _ in range(kenar)]
+                for _ in range(kenar)]
+    x = y = 0
+    son = (kenar - 1) // 2 * 2
+    satirlar[0][0] = '0'
+    while (x, y) != (son, son):
+        if y == son or (x < son and rng.random() < 0.5):
+            satirlar[y][x + 1] = satirlar[y][x + 2] = '0'
+            x += 2
+        else:
+            satirlar[y + 1][x] = satirlar[y + 2][x] = '0'
+            y += 2
+    return Izgara.satirlardan(satirlar)
+
+def koridor(kenar, yogunluk=0.0, tohum=0):
+    """Tek bir kıvrımlı koridor: en uzun yol, en dar dalga cephesi"""
+    satirlar = []
+    for y in range(kenar):
+        if y % 2 == 0:
+            satirlar.append(['0'] * kenar)
+        else:
+            satir = ['1'] * kenar
+            satir[-1 if y % 4 == 1 else 0] = '0'
+            satirlar.append(satir)
+    return Izgara.satirlardan(satirlar)
+
+def mukemmelLabirent(kenar, yogunluk=0.0, tohum=0):
+    """Geri izlemeli mükemmel labirent (uretici): tek yol, çok çıkmaz"""
+    return labirentUret(kenar, kenar, tohum=tohum)
+
+LABIRENTLER = {
+    "acik": acikAlan,
+    "rastgele": rastgeleLabirent,
+    "koridor": koridor,
+    "labirent": mukemmelLabirent,
+}
+
+# (ad, ofset listesi özelliği, geçiş tablosu, ara kontrol)
+HAREKETLER = (
+    ("Stormtrooper", "komsular", SADECE_YOL, False),
+    ("KyloRen", "ikili_komsular", DUVAR_DISI, True),
+)
+
+# Ağırlıklı senaryoda Darth Vader'ın duvara girme maliyeti
+DUVAR_MALIYETI = maliyetTablosu({'1': 5})
+
+def olc(fonk, en_az_sure=0.2):
+    """Fonksiyonu en az en_az_sure saniye tekrarlayıp bir çağrının süresini (ms) döndürür"""
+    tekrar = 0
+    baslangic = time.perf_counter()
+    while True:
+        fonk()
+        tekrar += 1
+        gecen = time.perf_counter() - baslangic
+        if gecen >= en_az_sure:
+            return 1000 * gecen / tekrar
+
+def _enUzakHucre(labirent, baslangic, ofsetler, ara_kontrol, uygun):
+    """Başlangıca en uzak, uygun(x, y) olan ulaşılabilir hücre (x, y)"""
+    alan = labirent.mesafeAlani(labirent.indeks(*baslangic), ofsetler, DUVAR_DISI, ara_kontrol)
+    en_iyi, konum = -1, None
+    for y in range(labirent.yukseklik):
+        for x in range(labirent.genislik):
+            mesafe = alan[labirent.indeks(x, y)]
+            if mesafe > en_iyi and uygun(x, y):
+                en_iyi, konum = mesafe, (x, y)
+    return konum
+
+def _kapat(labirent, hedef):
+    """Hedefin komşularını duvarla çevrili bir kopya: hedef ulaşılamaz olur"""
+    kopya = Izgara(labirent.genislik, labirent.yukseklik, bytearray(labirent.hucreler))
+    x, y = hedef
+    for komsu_x, komsu_y in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+        if 0 <= komsu_x < kopya.genislik and 0 <= komsu_y < kopya.yukseklik:
+            kopya.isaretle(komsu_x, komsu_y, '1')
+    return kopya
+
+def senaryolar(labirent):
+    """
+    (karakter, senaryo, labirent, hedef (x, y), kötü karakteri hazırlayan
+    fonksiyon ya da None) demetleri. Kötü karakter (0, 0) köşesindedir.
+    """
+    baslangic = (0, 0)
+    tek = _enUzakHucre(labirent, baslangic, labirent.komsular, False, lambda x, y: True)
+    # Kylo Ren iki adımla sadece x ve y'nin tekliği başlangıçla aynı
+    # hücrelere ulaşır; diğerleri için _normalHareket'e düşer
+    iki = _enUzakHucre(labirent, baslangic, labirent.ikili_komsular, True,
+                       lambda x, y: x % 2 == 0 and y % 2 == 0)
+    yedek = _enUzakHucre(labirent, baslangic, labirent.komsular, False,
+                         lambda x, y: x % 2 == 1 or y % 2 == 1)
+
+    def agirlikli(kotu):
+        kotu.arazi_maliyeti = DUVAR_MALIYETI
+
+    liste = [
+        ("Stormtrooper", "ulasilir", labirent, tek, None),
+        ("Stormtrooper", "ulasilamaz", _kapat(labirent, tek), tek, None),
+        ("KyloRen", "ulasilir", labirent, iki, None),
+        ("KyloRen", "yedek", labirent, yedek, None),
+        ("KyloRen", "ulasilamaz", _kapat(labirent, tek), tek, None),
+        ("DarthVader", "ulasilir", labirent, tek, None),
+        ("DarthVader", "agirlikli", labirent, tek, agirlikli),
+    ]
+    return [senaryo for senaryo in liste if senaryo[3] is not None]
+
+def yolKiyasla(boyutlar, yogunluklar, en_az_sure=0.2, labirentler=LABIRENTLER):
+    """Her labirent, boyut, yoğunluk ve senaryo için bir sonuç sözlüğü"""
+    sonuclar = []
+    for labirent_adi, uret in labirentler.items():
+        # Açık alan, koridor ve labirentin yoğunluğu yoktur
+        for yogunluk in (yogunluklar if labirent_adi == "rastgele" else (0.0,)):
+            for kenar in boyutlar:
+                labirent = uret(kenar, yogunluk)
+                for ad, senaryo, senaryo_labirenti, hedef, hazirla in senaryolar(labirent):
+                    kotu = getattr(karakterler, ad)(Lokasyon(0, 0))
+                    if hazirla is not None:
+                        hazirla(kotu)
+                    hedef_konum = Lokasyon(*hedef)
+                    yol = kotu.enKisaYol(hedef_konum, senaryo_labirenti)
+                    sure = olc(lambda: kotu.enKisaYol(hedef_konum, senaryo_labirenti),
+                               en_az_sure)
+                    sonuclar.append({
+                        "labirent": labirent_adi,
+                        "kenar": kenar,
+                        "yogunluk": yogunluk,
+                        "karakter": ad,
+                        "senaryo": senaryo,
+                        "yol_uzunlugu": len(yol) - 1 if yol else None,
+                        "ms": sure,
+                    })
+    return sonuclar
+
+def _anahtar(sonuc):
+    return (sonuc["labirent"], sonuc["kenar"], sonuc["yogunluk"],
+            sonuc["karakter"], sonuc["senaryo"])
+
+def karsilastir(sonuclar, onceki, tolerans):
+    """Öncekinden tolerans oranından fazla yavaşlayan ölçümler: (sonuç, eski ms)"""
+    eskiler = {_anahtar(sonuc): sonuc["ms"] for sonuc in onceki}
+    return [(sonuc, eskiler[_anahtar(sonuc)]) for sonuc in sonuclar
+            if _anahtar(sonuc) in eskiler and sonuc["ms"] > eskiler[_anahtar(sonuc)] * (1 + tolerans)]
+
+def vektorKiyasla(boyutlar, en_az_sure=0.2):
+    """Her labirent, hareket ve boyut için (skaler ms, NumPy ms) satırları"""
+    satirlar = []
+    for labirent_adi, uret in LABIRENTLER.items():
+        for kenar in boyutlar:
+            labirent = uret(kenar)
+            hedef = labirent.indeks(0, 0)
+            for hareket, ofset_adi, gecis, ara_kontrol in HAREKETLER:
+                ofsetler = getattr(labirent, ofset_adi)
+                sureler = []
+                for vektorel in (False, True):
+                    labirent.vektorel = vektorel
+                    sureler.append(olc(lambda: labirent.mesafeAlani(hedef, ofsetler, gecis,
+                                                                     ara_kontrol), en_az_sure))
+                satirlar.append((labirent_adi, hareket, kenar, *sureler))
+    return satirlar
+
+def yolKomutu(args):
+    sonuclar = yolKiyasla(args.boyut, args.yogunluk, args.sure)
+    print(f"{'labirent':<9} {'kenar':>5} {'yoğ.':>5} {'karakter':<13} {'senaryo':<11} "
+          f"{'yol':>6} {'ms':>10}")
+    for sonuc in sonuclar:
+        yol = "-" if sonuc["yol_uzunlugu"] is None else sonuc["yol_uzunlugu"]
+        print(f"{sonuc['labirent']:<9} {sonuc['kenar']:>5} {sonuc['yogunluk']:>5.2f} "
+              f"{sonuc['karakter']:<13} {sonuc['senaryo']:<11} {yol:>6} {sonuc['ms']:>10.3f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"python": platform.python_version(),
+                       "numpy": numpy.__version__ if numpy is not None else None,
+                       "sonuclar": sonuclar}, f, ensure_ascii=False, indent=2)
+
+    if args.karsilastir:
+        with open(args.karsilastir, encoding='utf-8') as f:
+            onceki = json.load(f)["sonuclar"]
+        yavaslar = karsilastir(sonuclar, onceki, args.tolerans)
+        for sonuc, eski in yavaslar:
+            print(f"YAVAŞLAMA: {' '.join(map(str, _anahtar(sonuc)))} "
+                  f"{eski:.3f} ms -> {sonuc['ms']:.3f} ms")
+        if yavaslar:
+            sys.exit(1)
+
+def vektorKomutu(args):
+    if numpy is None:
+        sys.exit("Bu kıyaslama için NumPy kurulu olmalı")
+
+    print(f"{'labirent':<10} {'hareket':<13} {'hücre':>7} {'python ms':>10} {'numpy ms':>10} {'oran':>6}")
+    for labirent_adi, hareket, kenar, skaler, vektor in vektorKiyasla(args.boyut, args.sure):
+        print(f"{labirent_adi:<10} {hareket:<13} {kenar * kenar:>7} "
+              f"{skaler:>10.3f} {vektor:>10.3f} {skaler / vektor:>6.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Star Wars Labirent yol bulma kıyaslamaları")
+    komutlar = parser.add_subparsers(dest="komut", required=True)
+
+    yol = komutlar.add_parser("yol", help="enKisaYol sürelerini ölç")
+    yol.add_argument("--boyut", type=int, nargs="+", default=[16, 32, 64, 128],
+                     help="Kare labirentlerin kenar uzunlukları")
+    yol.add_argument("--yogunluk", type=float, nargs="+", default=[0.1, 0.3, 0.45],
+                     help="Rastgele labirentlerde duvar oranları")
+    yol.add_argument("--sure", type=float, default=0.2,
+                     help="Her ölçüm için en az süre (saniye)")
+    yol.add_argument("--json", help="Sonuçları bu dosyaya JSON olarak yaz")
+    yol.add_argument("--karsilastir", help="Önceki JSON sonuçlarıyla karşılaştır")
+    yol.add_argument("--tolerans", type=float, default=0.2,
+                     help="Yavaşlama sayılmayacak en fazla oran")
+    yol.set_defaults(fonk=yolKomutu)
+
+    vektor = komutlar.add_parser("vektor", help="Mesafe alanı: saf Python ile NumPy")
+    vektor.add_argument("--boyut", type=int, nargs="+", default=[16, 32, 64, 128, 256],
+                        help="Kare labirentlerin kenar uzunlukları")
+    vektor.add_argument("--sure", type=float, default=0.2,
+                        help="Her ölçüm için en az süre (saniye)")
+    vektor.set_defaults(fonk=vektorKomutu)
+
+    args = parser.parse_args()
+    args.fonk(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,280 +1,118 @@
+import argparse
+import random
 import pygame
 import sys
-import heapq
-from collections import deque
-from queue import Queue
 import math
-
-# Renkler ve sabitler
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-YELLOW = (255, 255, 0)
-BLUE = (0, 0, 255)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-PURPLE = (128, 0, 128)
-DARK_RED = (139, 0, 0)
-ORANGE = (255, 165, 0)
-CELL_SIZE = 60
-MARGIN = 3
-
-class Lokasyon:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __eq__(self, other):
-        if isinstance(other, Lokasyon):
-            return self.x == other.x and self.y == other.y
-        return False
-    
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def getX(self): return self.x
-    def getY(self): return self.y
-    def setX(self, x): self.x = x
-    def setY(self, y): self.y = y
-
-class Karakter:
-    def __init__(self, ad, tur, konum):
-        self.ad = ad
-        self.tur = tur
-        self.konum = konum
-        self.can = 0
-        self.max_can = 0
-
-    def getAd(self): return self.ad
-    def setAd(self, ad): self.ad = ad
-    
-    def getTur(self): return self.tur
-    def setTur(self, tur): self.tur = tur
-    
-    def getKonum(self): return self.konum
-    def setKonum(self, konum): self.konum = konum
-    
-    def getCan(self): return self.can
-    def setCan(self, can): self.can = can
-
-    def enKisaYol(self, hedef, labirent):
-        """
-        Bu metod kötü karakterler tarafından override edilecek
-        """
-        pass
-
-class LukeSkywalker(Karakter):
-    def __init__(self, konum):
-        super().__init__("Luke Skywalker", "İyi", konum)
-        self.can = 3
-        self.max_can = 3
-
-class MasterYoda(Karakter):
-    def __init__(self, konum):
-        super().__init__("Master Yoda", "İyi", konum)
-        self.can = 6
-        self.max_can = 6
-
-class Stormtrooper(Karakter):
-    def __init__(self, konum):
-        super().__init__("Stormtrooper", "Kötü", konum)
-    
-    def enKisaYol(self, hedef, labirent):
-        """
-        BFS algoritması ile en kısa yolu bulur.
-        Sadece geçerli yolları (0) kullanır ve dört yönde hareket eder.
-        """
-        baslangic = (self.konum.getY(), self.konum.getX())
-        hedef_konum = (hedef.getY(), hedef.getX())
-        
-        # Kuyruk yapısı: [[konum], ziyaret_edilmis]
-        queue = deque([[baslangic]])
-        ziyaret_edilmis = {baslangic}
-        
-        # Dört yön: yukarı, aşağı, sol, sağ
-        yonler = [(-1,0), (1,0), (0,-1), (0,1)]
-        
-        while queue:
-            yol = queue.popleft()
-            current = yol[-1]
-            
-            # Hedefe ulaştık mı?
-            if current == hedef_konum:
-                return yol
-            
-            # Her yönü kontrol et
-            for dy, dx in yonler:
-                ny, nx = current[0] + dy, current[1] + dx
-                
-                # Sınırlar içinde mi?
-                if 0 <= ny < len(labirent) and 0 <= nx < len(labirent[0]):
-                    # Geçerli yol mu? (0 veya hedef)
-                    if ((labirent[ny][nx] == '0' or (ny, nx) == hedef_konum) and 
-                        (ny, nx) not in ziyaret_edilmis):
-                        # Yeni konumu yola ekle
-                        yeni_yol = list(yol)
-                        yeni_yol.append((ny, nx))
-                        queue.append(yeni_yol)
-                        ziyaret_edilmis.add((ny, nx))
-        
-        return None  # Yol bulunamadı
-
-class DarthVader(Karakter):
-    def __init__(self, konum):
-        super().__init__("Darth Vader", "Kötü", konum)
-    
-    def enKisaYol(self, hedef, labirent):
-        """
-        Dijkstra algoritması ile en kısa yolu bulur.
-        Duvarları yok sayar - sadece sınır kontrolü yapar.
-        """
-        baslangic = (self.konum.getY(), self.konum.getX())
-        hedef_konum = (hedef.getY(), hedef.getX())
-        
-        # Mesafe ve önceki düğüm bilgisi
-        mesafeler = {baslangic: 0}
-        onceki = {baslangic: None}
-        ziyaret_edilmis = set()
-        
-        # Öncelik kuyruğu (mesafe, konum)
-        queue = [(0, baslangic)]
-        
-        while queue:
-            mesafe, current = heapq.heappop(queue)
-            
-            if current in ziyaret_edilmis:
-                continue
-                
-            ziyaret_edilmis.add(current)
-            
-            if current == hedef_konum:
-                break
-            
-            # Dört yön: yukarı, aşağı, sol, sağ
-            for dy, dx in [(-1,0), (1,0), (0,-1), (0,1)]:
-                ny, nx = current[0] + dy, current[1] + dx
-                
-                # Sadece sınır kontrolü yap - duvarları yok say
-                if 0 <= ny < len(labirent) and 0 <= nx < len(labirent[0]):
-                    yeni_konum = (ny, nx)
-                    yeni_mesafe = mesafe + 1
-                    
-                    if yeni_konum not in mesafeler or yeni_mesafe < mesafeler[yeni_konum]:
-                        mesafeler[yeni_konum] = yeni_mesafe
-                        onceki[yeni_konum] = current
-                        heapq.heappush(queue, (yeni_mesafe, yeni_konum))
-        
-        # Yolu oluştur
-        if hedef_konum in onceki:
-            yol = []
-            current = hedef_konum
-            while current is not None:
-                yol.append(current)
-                current = onceki[current]
-            return yol[::-1]  # Yolu tersine çevir
-        
-        return None
-
-    def _mesafeHesapla(self, konum1, konum2):
-        """Manhattan mesafesini hesaplar"""
-        return abs(konum1[0] - konum2[0]) + abs(konum1[1] - konum2[1])
-
-class KyloRen(Karakter):
-    def __init__(self, konum):
-        super().__init__("Kylo Ren", "Kötü", konum)
-    
-    def enKisaYol(self, hedef, labirent):
-        """
-        İki adımlı BFS algoritması ile en kısa yolu bulur.
-        Her harekette iki kare ilerler.
-        """
-        baslangic = (self.konum.getY(), self.konum.getX())
-        hedef_konum = (hedef.getY(), hedef.getX())
-        
-        queue = deque([[baslangic]])
-        ziyaret_edilmis = {baslangic}
-        
-        # İki adımlık yönler: yukarı, aşağı, sol, sağ
-        yonler = [(-2,0), (2,0), (0,-2), (0,2)]
-        
-        while queue:
-            yol = queue.popleft()
-            current = yol[-1]
-            
-            # Hedefe ulaştık mı?
-            if current == hedef_konum:
-                return yol
-            
-            # Her yönü kontrol et
-            for dy, dx in yonler:
-                ny, nx = current[0] + dy, current[1] + dx
-                
-                # Sınırlar içinde mi?
-                if 0 <= ny < len(labirent) and 0 <= nx < len(labirent[0]):
-                    # Ara noktayı kontrol et (bir adım)
-                    ara_y, ara_x = current[0] + dy//2, current[1] + dx//2
-                    
-                    # Hem ara nokta hem de hedef nokta geçerli yol mu?
-                    if (labirent[ara_y][ara_x] != '1' and 
-                        (labirent[ny][nx] != '1' or (ny, nx) == hedef_konum) and 
-                        (ny, nx) not in ziyaret_edilmis):
-                        
-                        # Yeni konumu yola ekle
-                        yeni_yol = list(yol)
-                        yeni_yol.append((ny, nx))
-                        queue.append(yeni_yol)
-                        ziyaret_edilmis.add((ny, nx))
-        
-        # Hedef çok uzaksa veya ulaşılamıyorsa, normal hareket et
-        if not queue:
-            return self._normalHareket(hedef, labirent)
-        
-        return None
-
-    def _normalHareket(self, hedef, labirent):
-        """
-        Normal (tek adımlı) BFS algoritması ile yedek yol bulur
-        """
-        baslangic = (self.konum.getY(), self.konum.getX())
-        hedef_konum = (hedef.getY(), hedef.getX())
-        
-        queue = deque([[baslangic]])
-        ziyaret_edilmis = {baslangic}
-        
-        # Normal yönler
-        yonler = [(-1,0), (1,0), (0,-1), (0,1)]
-        
-        while queue:
-            yol = queue.popleft()
-            current = yol[-1]
-            
-            if current == hedef_konum:
-                return yol
-            
-            for dy, dx in yonler:
-                ny, nx = current[0] + dy, current[1] + dx
-                
-                if (0 <= ny < len(labirent) and 0 <= nx < len(labirent[0]) and
-                    (labirent[ny][nx] != '1' or (ny, nx) == hedef_konum) and
-                    (ny, nx) not in ziyaret_edilmis):
-                    
-                    yeni_yol = list(yol)
-                    yeni_yol.append((ny, nx))
-                    queue.append(yeni_yol)
-                    ziyaret_edilmis.add((ny, nx))
-        
-        return None
+from karakterler import LukeSkywalker, MasterYoda, DarthVader, KyloRen
+from harita import haritaYukle
+from adim_tablosu import tabloYukle
+from motor import OyunDurumu, HAREKET, HASAR, KAYBETME, KAZANMA
+from profil import Profilci, EVRELER
+from tekrar import TekrarYazici
+from cizim import (WHITE, BLACK, YELLOW, RED, GREEN, PURPLE, DARK_RED,
+                   CELL_SIZE, MARGIN, MENU_GRADYANI, EKRAN_GRADYANI, KAZANMA_GRADYANI,
+                   KAYBETME_GRADYANI, gradyan, YaziOnbellegi, KirliAlanlar, LabirentKatmani)
+
+HARITA_DOSYASI = "harita.txt"
+
+# Pencerede aynı anda gösterilen en fazla hücre sayısı; büyük haritalarda
+# kamera oyuncuyu takip eder
+MAX_GORUS_COLS = 20
+MAX_GORUS_ROWS = 11
+
+# Hareket tuşları öncelik sırasıyla; basılı olan ilk geçerli yön kullanılır
+HAREKET_TUSLARI = [
+    (pygame.K_UP, 'yukari'),
+    (pygame.K_DOWN, 'asagi'),
+    (pygame.K_LEFT, 'sol'),
+    (pygame.K_RIGHT, 'sag'),
+]
+
+# Statik ekranlarda animasyon karelerinin aralığı (ms); animasyonların
+# gerçekte ne kadar hızlı değiştiğine göre seçildi
+MENU_KARE_ARALIGI = 100     # Başlık saniyede birkaç piksel kayıyor
+YANIP_SONME_ARALIGI = 40    # Alt bilgi saniyede bir kez yanıp sönüyor
+
+# Profil göstergesini açıp kapatan ve kayıtları CSV'ye yazan tuşlar
+PROFIL_TUSU = pygame.K_F3
+PROFIL_KAYIT_TUSU = pygame.K_F4
+PROFIL_CSV = "profil.csv"
+# Göstergedeki sayılar okunabilsin diye bu aralıkla (ms) güncellenir
+PROFIL_YENILEME_ARALIGI = 250
+
+class KareZamanlayici:
+    """
+    Menü gibi çoğunlukla duran ekranlar için sabit FPS döngüsü yerine
+    pygame.event.wait ile bir olay gelene ya da animasyonun sıradaki
+    karesinin zamanı gelene kadar uyur. aralik None ise ekran sadece
+    olay geldiğinde yeniden çizilir.
+    """
+    def __init__(self, aralik=None):
+        self.aralik = aralik
+        self._sonraki_kare = 0
+        self._ciz = True  # İlk kare hemen çizilir
+
+    def olaylar(self):
+        """Gerekirse bekler ve kuyruktaki olayları döndürür"""
+        if self._ciz:
+            olaylar = pygame.event.get()
+        else:
+            if self.aralik is None:
+                olay = pygame.event.wait()
+            else:
+                kalan = self._sonraki_kare - pygame.time.get_ticks()
+                olay = pygame.event.wait(kalan) if kalan > 0 else pygame.event.Event(pygame.NOEVENT)
+            olaylar = [] if olay.type == pygame.NOEVENT else [olay]
+            olaylar += pygame.event.get()
+
+        if olaylar:
+            self._ciz = True
+        if self.aralik is not None and pygame.time.get_ticks() >= self._sonraki_kare:
+            self._ciz = True
+        return olaylar
+
+    def cizilmeli(self):
+        """Ekran bu turda yeniden çizilecekse True döner ve sıradaki kareyi planlar"""
+        if not self._ciz:
+            return False
+        self._ciz = False
+        if self.aralik is not None:
+            self._sonraki_kare = pygame.time.get_ticks() + self.aralik
+        return True
 
 class Oyun:
-    def __init__(self):
+    def __init__(self, suru=None, tohum=None, kayit_dosyasi=None, harita_dosyasi=HARITA_DOSYASI):
         pygame.init()
         pygame.mixer.init()  # Ses sistemini başlat
         self.screen = pygame.display.set_mode((800, 600))
         pygame.display.set_caption("Star Wars Labirent")
+        # Fare kullanılmıyor; hareketleri bekleyen ekranları boşuna uyandırmasın
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
         self.clock = pygame.time.Clock()
         self.menu_aktif = True
         self.oyun_aktif = False
-        self.font = pygame.font.Font(None, 36)
+        # Fontlar ve çizilmiş yazılar tüm ekranlarda ortak önbellekten gelir
+        self.yazilar = YaziOnbellegi()
         self.FPS = 60
+        self.labirent_katmani = LabirentKatmani(self.yazilar)
+        # OyunDurumu'na aynen aktarılır (bkz. motor.OyunDurumu)
+        self.ortak_mesafe_alani = True
+        # Açıkken her kötü karakter kendi artımsal (D* Lite) planlayıcısını
+        # tutar; büyük haritalarda hamle başına maliyet haritadan bağımsızdır
+        self.artimsal_planlayici = False
+        # Oyun döngüsünün evre süreleri; F3 ya da STARWARS_PROFIL=1 ile açılır
+        self.profilci = Profilci.ortamdan()
+        # Verilirse haritadaki Suru başlığı yerine bu kadar askerlik sürü
+        # doğar; tohum verilmezse her oyunda askerler başka yerlere dağılır
+        self.suru = suru
+        self.tohum = tohum
+        # Verilirse oyunlar bu dosyaya kaydedilir (tekrar.py ile oynatılır)
+        self.kayit_dosyasi = kayit_dosyasi
+        self.kayit = None
+        # Oynanan harita (uretici.py ile büyük haritalar üretilebilir)
+        self.harita_dosyasi = harita_dosyasi
+        self._profil_satirlari = []
+        self._profil_zamani = 0
         
         # Ses efektlerini yükle
         try:
@@ -305,91 +143,6 @@ class Oyun:
         if self.sesler and ses_adi in self.sesler:
             self.sesler[ses_adi].play()
 
-    def haritaYukle(self, dosya):
-        """
-        Haritayı ve karakter konumlarını yükler
-        Format:
-        Karakter:DarthVader,Kapi:A
-        Karakter:KyloRen,Kapi:B
-        Karakter:Stormtrooper,Kapi:A
-        0 0 0 0 1 0 0 0 0 0 0 0 1 0
-        ...
-        """
-        try:
-            with open(dosya, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f.readlines()]
-
-            # Karakter ve kapı bilgilerini oku
-            self.karakter_bilgileri = []
-            line_index = 0
-            while line_index < len(lines) and 'Karakter:' in lines[line_index]:
-                line = lines[line_index].strip()
-                karakter_info = {}
-                for part in line.split(','):
-                    if 'Karakter:' in part:
-                        karakter_info['karakter'] = part.split(':')[1].strip()
-                    elif 'Kapi:' in part:
-                        karakter_info['kapi'] = part.split(':')[1].strip()
-                self.karakter_bilgileri.append(karakter_info)
-                line_index += 1
-
-            # Labirent matrisini oku
-            self.labirent = []
-            for line in lines[line_index:]:
-                if line.strip():
-                    line = ' '.join(line.split())
-                    self.labirent.append(line.split())
-
-            # Boyut kontrolü
-            self.ROWS = len(self.labirent)
-            self.COLS = len(self.labirent[0])
-            if self.COLS != 14 or self.ROWS != 11:
-                raise ValueError(f"Harita boyutları 14x11 olmalı! Mevcut: {self.COLS}x{self.ROWS}")
-
-            # Kapıları yerleştir - x ve y koordinatlarını düzelttik
-            self.kapilar = {
-                'A': Lokasyon(4, 0),    # x=4, y=0 (üst kapı)
-                'B': Lokasyon(4, 10)    # x=4, y=10 (alt kapı)
-            }
-
-            # Başlangıç ve hedef noktaları - x ve y koordinatlarını düzelttik
-            self.baslangic = Lokasyon(6, 5)   # x=6, y=5 (orta nokta)
-            self.hedef = Lokasyon(4, 10)      # x=4, y=10 (B kapısı ile aynı)
-
-            # İşaretlemeler - koordinat sistemini düzelttik
-            for kapi, konum in self.kapilar.items():
-                self.labirent[konum.getY()][konum.getX()] = kapi
-            self.labirent[self.baslangic.getY()][self.baslangic.getX()] = 'S'
-            self.labirent[self.hedef.getY()][self.hedef.getX()] = 'T'
-
-            return self.labirent
-
-        except Exception as e:
-            print(f"Harita yükleme hatası: {str(e)}")
-            raise
-
-    def oyunuHazirla(self, karakter_class):
-        """
-        Seçilen karaktere ve harita.txt'deki bilgilere göre oyunu hazırlar
-        """
-        # İyi karakteri oluştur
-        self.iyi_karakter = karakter_class(self.baslangic)
-        
-        # Kötü karakterleri oluştur
-        self.kotu_karakterler = []
-        for bilgi in self.karakter_bilgileri:
-            karakter_type = bilgi["karakter"]
-            kapi = bilgi["kapi"]
-            
-            if kapi in self.kapilar:
-                konum = self.kapilar[kapi]
-                if karakter_type == "DarthVader":
-                    self.kotu_karakterler.append(DarthVader(konum))
-                elif karakter_type == "KyloRen":
-                    self.kotu_karakterler.append(KyloRen(konum))
-                elif karakter_type == "Stormtrooper":
-                    self.kotu_karakterler.append(Stormtrooper(konum))
-
     def oyunu_baslat(self, karakter_class):
         """
         Seçilen karakterle oyunu başlatır
@@ -397,150 +150,237 @@ class Oyun:
         try:
             self.menu_aktif = False
             self.oyun_aktif = True
-            
-            # Haritayı yükle
-            self.labirent = self.haritaYukle("harita.txt")
-            
-            # Pencere boyutunu ayarla
-            pencere_genislik = self.COLS * CELL_SIZE
-            pencere_yukseklik = self.ROWS * CELL_SIZE + 50  # Can barı için ekstra alan
-            self.pencere = pygame.display.set_mode((pencere_genislik, pencere_yukseklik))
+            adim_tablosu = self.haritayiHazirla(self.harita_dosyasi)
             
             # Oyunu hazırla ve başlat
-            self.oyunuHazirla(karakter_class)
-            self.oyunDongusu()
+            tohum = self.tohum if self.tohum is not None else random.randrange(2 ** 32)
+            self.durum = OyunDurumu(self.harita, karakter_class, self.ortak_mesafe_alani,
+                                    self.artimsal_planlayici, adim_tablosu, self.profilci,
+                                    self.suru, tohum)
+            if self.kayit_dosyasi:
+                self.kayit = TekrarYazici(self.kayit_dosyasi, self.harita_dosyasi, self.durum)
+            try:
+                self.oyunDongusu()
+            finally:
+                # Pencere kapatılınca da kayıt tamamlansın
+                if self.kayit is not None:
+                    self.kayit.kapat()
+                    self.kayit = None
+            if self.profilci.csv_dosyasi:
+                self.profilKaydet(self.profilci.csv_dosyasi)
             
         except Exception as e:
             print(f"Oyun başlatma hatası: {str(e)}")
             self.menu_aktif = True
             self.oyun_aktif = False
 
+    def haritayiHazirla(self, harita_dosyasi):
+        """
+        Haritayı yükler ve pencereyi haritaya göre ayarlar. Haritanın
+        önceden hesaplanmış adım tablosunu (yoksa None) döndürür.
+        """
+        self.harita = haritaYukle(harita_dosyasi)
+        # Önceden hesaplanmış adım tablosu varsa kullanılır
+        # (python adim_tablosu.py harita.txt), yoksa arama yapılır
+        adim_tablosu = tabloYukle(self.harita.labirent, harita_dosyasi, olustur=False)
+        self.ROWS = self.harita.yukseklik
+        self.COLS = self.harita.genislik
+        
+        # Pencere boyutunu ayarla - büyük haritalarda sadece görüş alanı gösterilir
+        self.GORUS_COLS = min(self.COLS, MAX_GORUS_COLS)
+        self.GORUS_ROWS = min(self.ROWS, MAX_GORUS_ROWS)
+        self.kamera_x, self.kamera_y = 0, 0
+        self.kirli_alanlar = KirliAlanlar()
+        pencere_genislik = self.GORUS_COLS * CELL_SIZE
+        pencere_yukseklik = self.GORUS_ROWS * CELL_SIZE + 50  # Can barı için ekstra alan
+        self.pencere = pygame.display.set_mode((pencere_genislik, pencere_yukseklik))
+        return adim_tablosu
+
     def oyunDongusu(self):
         """Ana oyun döngüsü"""
-        hareket_zamani = pygame.time.get_ticks()
+        hareket_zamani = baslangic_zamani = pygame.time.get_ticks()
         HAREKET_GECIKMESI = 200
         
+        profilci = self.profilci
+        profilci.kareyiAt()
+        
         while self.oyun_aktif:
             current_time = pygame.time.get_ticks()
             
-            for event in pygame.event.get():
+            with profilci.evre("girdi"):
+                olaylar = pygame.event.get()
+            for event in olaylar:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.oyun_duraklatildi_goster()
+                        profilci.kareyiAt()
+                    elif event.key == PROFIL_TUSU:
+                        profilci.degistir()
+                        self._profil_zamani = 0
+                    elif event.key == PROFIL_KAYIT_TUSU:
+                        self.profilKaydet(profilci.csv_dosyasi or PROFIL_CSV)
 
             if current_time - hareket_zamani >= HAREKET_GECIKMESI:
-                # İyi karakter hareketi
-                keys = pygame.key.get_pressed()
-                x, y = self.iyi_karakter.getKonum().getX(), self.iyi_karakter.getKonum().getY()
-                yeni_x, yeni_y = x, y
-                hareket_var = False
-
-                # Karakter hareketi
-                if keys[pygame.K_UP] and y > 0 and self.labirent[y-1][x] != '1':
-                    yeni_y -= 1
-                    hareket_var = True
-                elif keys[pygame.K_DOWN] and y < self.ROWS-1 and self.labirent[y+1][x] != '1':
-                    yeni_y += 1
-                    hareket_var = True
-                elif keys[pygame.K_LEFT] and x > 0 and self.labirent[y][x-1] != '1':
-                    yeni_x -= 1
-                    hareket_var = True
-                elif keys[pygame.K_RIGHT] and x < self.COLS-1 and self.labirent[y][x+1] != '1':
-                    yeni_x += 1
-                    hareket_var = True
-
-                if hareket_var:
-                    self.iyi_karakter.getKonum().setX(yeni_x)
-                    self.iyi_karakter.getKonum().setY(yeni_y)
-                    
-                    # Kötü karakterlerin hareketi
-                    for kotu in self.kotu_karakterler:
-                        yol = kotu.enKisaYol(self.iyi_karakter.getKonum(), self.labirent)
-                        if yol and len(yol) > 1:
-                            next_pos = yol[1]  # Bir sonraki adım
-                            kotu.getKonum().setY(next_pos[0])
-                            kotu.getKonum().setX(next_pos[1])
-                    
-                    # Çarpışma kontrolü
-                    if self.carpismaKontrol():
+                # İyi karakter hareketi - oyun kuralları motorda işlenir
+                with profilci.evre("girdi"):
+                    keys = pygame.key.get_pressed()
+                sonuc = None
+                for tus, eylem in HAREKET_TUSLARI:
+                    if keys[tus] and self.durum.gecerliHareket(eylem):
+                        sonuc = self.durum.adim(eylem)
+                        if self.kayit is not None:
+                            self.kayit.hamle(current_time - baslangic_zamani, eylem, sonuc)
+                        break
+
+                if sonuc:
+                    # Çarpışma ya da oyun sonu
+                    if self.sonucuIsle(sonuc):
                         continue
 
                     hareket_zamani = current_time
 
                 self.ciz()
-                self.clock.tick(self.FPS)
+                with profilci.evre("bekleme"):
+                    self.clock.tick(self.FPS)
+                profilci.kareBitti()
+
+    def tekrarGoster(self, tekrar, harita_dosyasi, hiz=1.0):
+        """
+        Kaydedilmiş oyunu (tekrar.Tekrar) pencerede oynatır. Hamleler
+        kaydedildikleri zamanlara göre hiz katı hızla, hiz 0 ise
+        beklemeden yapılır. Pencere kapatılınca ya da ESC ile durur.
+        Sonucu kayıttan farklı çıkan hamleler yazdırılır.
+        """
+        adim_tablosu = self.haritayiHazirla(harita_dosyasi)
+        self.durum = tekrar.durumOlustur(self.harita, adim_tablosu, self.profilci)
+        profilci = self.profilci
+        profilci.kareyiAt()
+        baslangic = pygame.time.get_ticks()
+
+        for sira, (zaman, eylem, beklenen) in enumerate(tekrar.hamleler):
+            while True:
+                with profilci.evre("girdi"):
+                    olaylar = pygame.event.get()
+                for event in olaylar:
+                    if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and
+                                                     event.key == pygame.K_ESCAPE):
+                        return
+                    if event.type == pygame.KEYDOWN and event.key == PROFIL_TUSU:
+                        profilci.degistir()
+                        self._profil_zamani = 0
+
+                if not hiz or (pygame.time.get_ticks() - baslangic) * hiz >= zaman:
+                    break
+                self.ciz()
+                with profilci.evre("bekleme"):
+                    self.clock.tick(self.FPS)
+                profilci.kareBitti()
+
+            sonuc = self.durum.adim(eylem)
+            if sonuc != beklenen:
+                print(f"{sira + 1}. hamle: kayıtta {beklenen}, oynatmada {sonuc}")
+            self.ciz()
+            profilci.kareBitti()
+
+        print(f"Kayıt bitti: {self.durum.hamle_sayisi} hamle, sonuç={self.durum.sonuc}")
+
+    def profilKaydet(self, dosya):
+        """Profil kayıtlarını CSV olarak yazar"""
+        try:
+            self.profilci.csvYaz(dosya)
+            print(f"Profil kayıtları {dosya} dosyasına yazıldı")
+        except OSError as e:
+            print(f"Profil kayıtları yazılamadı: {str(e)}")
+
+    def sonucuIsle(self, sonuc):
+        """
+        Motorun adım sonucuna göre ses çalar, oyun bittiyse sonuç ekranını
+        gösterip menüye döner. Çarpışma ya da oyun sonunda True döner.
+        """
+        if sonuc == HAREKET:
+            return False
+
+        if sonuc in (HASAR, KAYBETME):
+            self.ses_cal('hasar')
+        if sonuc in (KAYBETME, KAZANMA):
+            self.ses_cal(sonuc)
+            self.sonuc_ekrani(sonuc == KAZANMA)
+            self.menuye_don()
+        return True
+
+    def kameraGuncelle(self):
+        """Kamerayı oyuncuyu ortalayacak şekilde kaydırır, harita kenarlarında durdurur"""
+        konum = self.durum.iyi_karakter.getKonum()
+        self.kamera_x = max(0, min(konum.getX() - self.GORUS_COLS // 2, self.COLS - self.GORUS_COLS))
+        self.kamera_y = max(0, min(konum.getY() - self.GORUS_ROWS // 2, self.ROWS - self.GORUS_ROWS))
+
+    def ekranKonumu(self, konum):
+        """Harita konumunun penceredeki sol üst piksel koordinatı"""
+        return ((konum.getX() - self.kamera_x) * CELL_SIZE,
+                (konum.getY() - self.kamera_y) * CELL_SIZE)
+
+    def gorunurMu(self, konum):
+        return (self.kamera_x <= konum.getX() < self.kamera_x + self.GORUS_COLS and
+                self.kamera_y <= konum.getY() < self.kamera_y + self.GORUS_ROWS)
 
     def ciz(self):
-        self.pencere.fill(WHITE)
-        
-        # Labirent çizimi
-        for i in range(len(self.labirent)):
-            for j in range(len(self.labirent[i])):
-                rect = pygame.Rect(j*CELL_SIZE, i*CELL_SIZE, CELL_SIZE, CELL_SIZE)
-                cell = self.labirent[i][j]
-                
-                # Önce tüm hücrelere beyaz arka plan çiz
-                pygame.draw.rect(self.pencere, WHITE, rect)
-                
-                # Hücre tipine göre çizim
-                if cell == '1':  # Duvar
-                    # Duvarları daha belirgin yap
-                    pygame.draw.rect(self.pencere, BLACK, rect)
-                    # Duvar kenarlarına gri çerçeve ekle
-                    pygame.draw.rect(self.pencere, (64, 64, 64), rect, 2)
-                elif cell == '0':  # Yol
-                    # Yollara hafif gri arka plan ekle
-                    pygame.draw.rect(self.pencere, (240, 240, 240), rect)
-                    # Izgara çizgileri ekle
-                    pygame.draw.rect(self.pencere, (200, 200, 200), rect, 1)
-                elif cell == 'T':  # Hedef
-                    pygame.draw.rect(self.pencere, (200, 255, 200), rect)  # Açık yeşil arka plan
-                    pygame.draw.rect(self.pencere, GREEN, rect, 2)  # Yeşil çerçeve
-                    text = self.font.render('⭐', True, BLACK)
-                    text_rect = text.get_rect(center=(j*CELL_SIZE + CELL_SIZE//2,
-                                                    i*CELL_SIZE + CELL_SIZE//2))
-                    self.pencere.blit(text, text_rect)
-                elif cell in ['A', 'B']:  # Kapılar
-                    # Kapılara gradyan efekti ekle
-                    pygame.draw.rect(self.pencere, (100, 100, 255), rect)  # Koyu mavi
-                    pygame.draw.rect(self.pencere, BLUE, rect, 3)  # Mavi çerçeve
-                    text = self.font.render(cell, True, WHITE)
-                    text_rect = text.get_rect(center=(j*CELL_SIZE + CELL_SIZE//2,
-                                                    i*CELL_SIZE + CELL_SIZE//2))
-                    self.pencere.blit(text, text_rect)
-
-        # Başlangıç noktası
-        baslangic_rect = pygame.Rect(6*CELL_SIZE, 5*CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        pygame.draw.rect(self.pencere, (255, 255, 200), baslangic_rect)  # Açık sarı arka plan
-        pygame.draw.rect(self.pencere, YELLOW, baslangic_rect, 2)  # Sarı çerçeve
-        
-        # İyi karakter çizimi
-        if self.iyi_karakter:
-            x = self.iyi_karakter.getKonum().getX() * CELL_SIZE
-            y = self.iyi_karakter.getKonum().getY() * CELL_SIZE
-            color = RED if isinstance(self.iyi_karakter, LukeSkywalker) else GREEN
-            pygame.draw.circle(self.pencere, color,
-                             (x + CELL_SIZE//2, y + CELL_SIZE//2),
-                             CELL_SIZE//2 - MARGIN)
-            
-            # Karakter adı - font boyutu artırıldı
-            isim_font = pygame.font.Font(None, 30)  # 20'den 30'a çıkarıldı
-            text = isim_font.render(self.iyi_karakter.getAd(), True, WHITE)
-            text_rect = text.get_rect(center=(x + CELL_SIZE//2, y - 10))  # Biraz daha yukarı çekildi
-            # Arka plan ekle
-            bg_rect = text_rect.copy()
-            bg_rect.inflate_ip(14, 8)  # Arka plan marjını artırdık
-            pygame.draw.rect(self.pencere, BLACK, bg_rect)
-            self.pencere.blit(text, text_rect)
-        
-        # Kötü karakterler çizimi
-        for kotu in self.kotu_karakterler:
-            x = kotu.getKonum().getX() * CELL_SIZE
-            y = kotu.getKonum().getY() * CELL_SIZE
-            
+        """
+        Oyun ekranını çizer. Sadece önceki kareden bu yana değişen
+        bölgeler (hareket eden karakterler, değişen etiketler ve can
+        göstergesi) yeniden çizilip display.update ile ekrana gönderilir;
+        kamera kaydığında ya da ekranın üstüne başka bir şey çizildiğinde
+        tüm pencere yenilenir.
+        """
+        profilci = self.profilci
+        with profilci.evre("ciz"):
+            eski_kamera = (self.kamera_x, self.kamera_y)
+            self.kameraGuncelle()
+            if (self.kamera_x, self.kamera_y) != eski_kamera:
+                self.kirli_alanlar.tamamiKirli()
+
+            ogeler = self.ogeleriHazirla()
+            kirli = self.kirli_alanlar.karsilastir(
+                {kimlik: (gorunum, alan) for kimlik, gorunum, alan, _ in ogeler})
+
+            if kirli is None:
+                self.bolgeCiz(self.pencere.get_rect(), ogeler)
+            elif kirli:
+                ekran = self.pencere.get_rect()
+                kirli = [alan.clip(ekran) for alan in kirli]
+                for alan in kirli:
+                    self.bolgeCiz(alan, ogeler)
+
+        with profilci.evre("ekran"):
+            if kirli is None:
+                pygame.display.flip()
+            elif kirli:
+                pygame.display.update(kirli)
+
+    def ogeleriHazirla(self):
+        """
+        Labirentin üstüne çizilen öğeleri çizim sırasıyla döndürür:
+        (kimlik, görünüm, kapladığı alan, çizim bilgisi)
+        """
+        ogeler = []
+
+        # İyi karakter
+        if self.durum.iyi_karakter:
+            color = RED if isinstance(self.durum.iyi_karakter, LukeSkywalker) else GREEN
+            ogeler.append(('iyi',) + self.karakterOgesi(self.durum.iyi_karakter, color))
+
+        # Sürü askerleri - etiketsiz, sadece görüş alanındaki dolu hücreler
+        if self.durum.suru is not None:
+            ogeler += self.suruOgeleri()
+
+        # Kötü karakterler
+        mesafeler = self.durum.mesafeleriGetir()
+        for i, (kotu, mesafe) in enumerate(zip(self.durum.kotu_karakterler, mesafeler)):
+            if not self.gorunurMu(kotu.getKonum()):
+                continue
+
             # Karakter tipine göre renk seç
             if isinstance(kotu, DarthVader):
                 color = DARK_RED
@@ -548,49 +388,119 @@ class Oyun:
                 color = PURPLE
             else:
                 color = BLACK
-            
+            ogeler.append((('kotu', i),) + self.karakterOgesi(kotu, color, mesafe))
+
+        # Can göstergesi - haritanın altındaki şerit
+        can_y = self.GORUS_ROWS * CELL_SIZE
+        alan = pygame.Rect(0, can_y, self.GORUS_COLS * CELL_SIZE, 50)
+        can = self.durum.iyi_karakter.getCan()
+        ogeler.append(('can', can, alan, None))
+
+        # Profil göstergesi - en üstte, sağ köşede
+        if self.profilci.etkin:
+            satirlar = self.profilSatirlari()
+            alan = pygame.Rect(0, 0, 230, 10 + 20 * len(satirlar))
+            alan.topright = (self.GORUS_COLS * CELL_SIZE - 10, 10)
+            ogeler.append(('profil', satirlar, alan, None))
+        return ogeler
+
+    def suruOgeleri(self):
+        """Görüş alanında asker bulunan her hücre için bir öğe"""
+        suru = self.durum.suru
+        labirent = self.harita.labirent
+        ogeler = []
+        for y in range(self.kamera_y, self.kamera_y + self.GORUS_ROWS):
+            satir = labirent.indeks(self.kamera_x, y)
+            for sutun in range(self.GORUS_COLS):
+                if suru.dolu(satir + sutun):
+                    x, ekran_y = sutun * CELL_SIZE, (y - self.kamera_y) * CELL_SIZE
+                    ogeler.append((('suru', satir + sutun), (x, ekran_y, BLACK),
+                                   pygame.Rect(x, ekran_y, CELL_SIZE, CELL_SIZE), ()))
+        return ogeler
+
+    def profilSatirlari(self):
+        """Göstergedeki FPS, evre süresi ve yol bulma sayacı satırları"""
+        simdi = pygame.time.get_ticks()
+        if simdi - self._profil_zamani >= PROFIL_YENILEME_ARALIGI:
+            self._profil_zamani = simdi
+            evreler, sayaclar = self.profilci.ortalamalar()
+            satirlar = [f"FPS: {self.profilci.fps():.1f}"]
+            satirlar += [f"{evre}: {evreler[evre]:.2f} ms" for evre in EVRELER]
+            satirlar += [f"{ad}: {deger:.1f}/kare" for ad, deger in sayaclar.items()]
+            self._profil_satirlari = tuple(satirlar)
+        return self._profil_satirlari
+
+    def karakterOgesi(self, karakter, color, mesafe=None):
+        """Karakter dairesi ile isim ve mesafe etiketlerinin görünümü ve alanı"""
+        x, y = self.ekranKonumu(karakter.getKonum())
+        etiketler = []
+
+        # Karakter adı - font boyutu 20'den 30'a çıkarıldı
+        text = self.yazilar.yazi(karakter.getAd(), 30, WHITE)
+        etiketler.append((text, text.get_rect(center=(x + CELL_SIZE//2, y - 10))))
+
+        # Mesafe göstergesi
+        if mesafe is not None:
+            mesafe_text = self.yazilar.yazi(f"Mesafe: {mesafe}", 30, WHITE)
+            etiketler.append((mesafe_text, mesafe_text.get_rect(center=(x + CELL_SIZE//2, y + CELL_SIZE + 10))))
+
+        # Etiket arka planları metinden biraz büyük çizilir
+        alan = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE).unionall(
+            [text_rect.inflate(14, 8) for _, text_rect in etiketler])
+        gorunum = (x, y, color, karakter.getAd(), mesafe)
+        return gorunum, alan, etiketler
+
+    def bolgeCiz(self, bolge, ogeler):
+        """Pencerenin verilen bölgesini labirent ve öğelerle baştan çizer"""
+        self.pencere.set_clip(bolge)
+        self.pencere.fill(WHITE)
+
+        # Labirent çizimi - değişmeyen katman önbellekten kopyalanır
+        self.labirent_katmani.ciz(self.pencere, self.harita, self.kamera_x, self.kamera_y,
+                                  self.GORUS_COLS, self.GORUS_ROWS)
+
+        for kimlik, gorunum, alan, etiketler in ogeler:
+            if not alan.colliderect(bolge):
+                continue
+            if kimlik == 'can':
+                self.canGostergesiCiz()
+                continue
+            if kimlik == 'profil':
+                pygame.draw.rect(self.pencere, BLACK, alan)
+                font = self.yazilar.font(22)
+                for i, satir in enumerate(gorunum):
+                    # Değerler sık değiştiği için yazı önbelleğine alınmaz
+                    self.pencere.blit(font.render(satir, True, YELLOW),
+                                      (alan.x + 8, alan.y + 6 + 20 * i))
+                continue
+
+            x, y, color = gorunum[:3]
             pygame.draw.circle(self.pencere, color,
                              (x + CELL_SIZE//2, y + CELL_SIZE//2),
                              CELL_SIZE//2 - MARGIN)
-            
-            # Karakter adı - font boyutu artırıldı
-            isim_font = pygame.font.Font(None, 30)  # 20'den 30'a çıkarıldı
-            text = isim_font.render(kotu.getAd(), True, WHITE)
-            text_rect = text.get_rect(center=(x + CELL_SIZE//2, y - 10))
-            # Arka plan ekle
-            bg_rect = text_rect.copy()
-            bg_rect.inflate_ip(14, 8)  # Arka plan marjını artırdık
-            pygame.draw.rect(self.pencere, BLACK, bg_rect)
-            self.pencere.blit(text, text_rect)
-            
-            # Mesafe göstergesi - font boyutu artırıldı
-            if path := kotu.enKisaYol(self.iyi_karakter.getKonum(), self.labirent):
-                mesafe = len(path) - 1
-                mesafe_text = isim_font.render(f"Mesafe: {mesafe}", True, WHITE)
-                mesafe_rect = mesafe_text.get_rect(center=(x + CELL_SIZE//2, y + CELL_SIZE + 10))
-                bg_rect = mesafe_rect.copy()
-                bg_rect.inflate_ip(14, 8)  # Arka plan marjını artırdık
-                pygame.draw.rect(self.pencere, BLACK, bg_rect)
-                self.pencere.blit(mesafe_text, mesafe_rect)
-        
-        # Can göstergesi
-        can_y = self.ROWS * CELL_SIZE + 10
+            for text, text_rect in etiketler:
+                # Arka plan ekle - marj metinden büyük
+                pygame.draw.rect(self.pencere, BLACK, text_rect.inflate(14, 8))
+                self.pencere.blit(text, text_rect)
+
+        self.pencere.set_clip(None)
+
+    def canGostergesiCiz(self):
+        can_y = self.GORUS_ROWS * CELL_SIZE + 10
         can_height = 30
-        can_width = int((self.iyi_karakter.getCan() / self.iyi_karakter.max_can) * self.COLS*CELL_SIZE)
-        pygame.draw.rect(self.pencere, RED, (0, can_y, self.COLS*CELL_SIZE, can_height))
+        can_width = int((self.durum.iyi_karakter.getCan() / self.durum.iyi_karakter.max_can) * self.GORUS_COLS*CELL_SIZE)
+        pygame.draw.rect(self.pencere, RED, (0, can_y, self.GORUS_COLS*CELL_SIZE, can_height))
         pygame.draw.rect(self.pencere, GREEN, (0, can_y, can_width, can_height))
         
         # Can miktarını ondalıklı göster (Master Yoda için)
-        if isinstance(self.iyi_karakter, MasterYoda):
-            can_text = f"Can: {self.iyi_karakter.getCan():.1f}/{self.iyi_karakter.max_can}"
+        if isinstance(self.durum.iyi_karakter, MasterYoda):
+            can_text = f"Can: {self.durum.iyi_karakter.getCan():.1f}/{self.durum.iyi_karakter.max_can}"
         else:
-            can_text = f"Can: {int(self.iyi_karakter.getCan())}/{self.iyi_karakter.max_can}"
+            can_text = f"Can: {int(self.durum.iyi_karakter.getCan())}/{self.durum.iyi_karakter.max_can}"
         
-        text = self.font.render(can_text, True, BLACK)
-        text_rect = text.get_rect(center=(self.COLS*CELL_SIZE//2, can_y + can_height//2))
+        text = self.yazilar.yazi(can_text, 36, BLACK)
+        text_rect = text.get_rect(center=(self.GORUS_COLS*CELL_SIZE//2, can_y + can_height//2))
         self.pencere.blit(text, text_rect)
-        
-        pygame.display.flip()
 
     def sonuc_ekrani(self, basarili):
         """Oyun sonuç ekranı"""
@@ -602,61 +512,46 @@ class Oyun:
         # Animasyon için değişkenler
         animation_duration = 3  # 3 saniye
         start_time = pygame.time.get_ticks() / 1000
+        arka_plan = gradyan(self.GORUS_COLS * CELL_SIZE, self.GORUS_ROWS * CELL_SIZE + 50,
+                            KAZANMA_GRADYANI if basarili else KAYBETME_GRADYANI)
         
         while (pygame.time.get_ticks() / 1000 - start_time) < animation_duration:
             current_time = pygame.time.get_ticks() / 1000
             progress = (current_time - start_time) / animation_duration
             pulse = (math.sin(current_time * 5) + 1) / 2  # Yanıp sönme efekti
             
-            # Arkaplan gradyanı
-            self.pencere.fill(BLACK)
-            if basarili:
-                # Kazanma durumunda yeşil tonlarında gradyan
-                for i in range(self.ROWS * CELL_SIZE + 50):
-                    color = (0, max(0, min(255, i // 3)), 0)
-                    pygame.draw.line(self.pencere, color, (0, i), (self.COLS * CELL_SIZE, i))
-            else:
-                # Kaybetme durumunda kırmızı tonlarında gradyan
-                for i in range(self.ROWS * CELL_SIZE + 50):
-                    color = (max(0, min(255, i // 3)), 0, 0)
-                    pygame.draw.line(self.pencere, color, (0, i), (self.COLS * CELL_SIZE, i))
+            # Arkaplan gradyanı - kazanınca yeşil, kaybedince kırmızı tonlarında
+            self.pencere.blit(arka_plan, (0, 0))
 
             # Başlık
             baslik = "TEBRİKLER! KAZANDINIZ!" if basarili else "GAME OVER!"
             baslik_color = LIGHTSABER_GREEN if basarili else LIGHTSABER_RED
-            baslik_font = pygame.font.Font(None, 72)
-            
             # Başlık efektleri
             baslik_alpha = int(255 * min(1, progress * 2))  # Fade-in efekti
             baslik_offset = math.sin(current_time * 3) * 5  # Yukarı-aşağı hareket
             
             # Başlık gölgesi
-            baslik_shadow = baslik_font.render(baslik, True, BLACK)
-            baslik_shadow.set_alpha(baslik_alpha)
-            baslik_shadow_rect = baslik_shadow.get_rect(center=(self.COLS*CELL_SIZE//2 + 3, self.ROWS*CELL_SIZE//3 + 3 + baslik_offset))
+            baslik_shadow = self.yazilar.yazi(baslik, 72, BLACK, baslik_alpha)
+            baslik_shadow_rect = baslik_shadow.get_rect(center=(self.GORUS_COLS*CELL_SIZE//2 + 3, self.GORUS_ROWS*CELL_SIZE//3 + 3 + baslik_offset))
             self.pencere.blit(baslik_shadow, baslik_shadow_rect)
             
             # Başlık metni
-            baslik_surface = baslik_font.render(baslik, True, baslik_color)
-            baslik_surface.set_alpha(baslik_alpha)
-            baslik_rect = baslik_surface.get_rect(center=(self.COLS*CELL_SIZE//2, self.ROWS*CELL_SIZE//3 + baslik_offset))
+            baslik_surface = self.yazilar.yazi(baslik, 72, baslik_color, baslik_alpha)
+            baslik_rect = baslik_surface.get_rect(center=(self.GORUS_COLS*CELL_SIZE//2, self.GORUS_ROWS*CELL_SIZE//3 + baslik_offset))
             self.pencere.blit(baslik_surface, baslik_rect)
 
             # Karakter mesajı
-            mesaj = f"{self.iyi_karakter.getAd()} başarıyla görevi tamamladı!" if basarili else f"{self.iyi_karakter.getAd()} yenildi!"
+            mesaj = f"{self.durum.iyi_karakter.getAd()} başarıyla görevi tamamladı!" if basarili else f"{self.durum.iyi_karakter.getAd()} yenildi!"
             mesaj_color = STAR_WARS_YELLOW
-            mesaj_font = pygame.font.Font(None, 48)
-            mesaj_surface = mesaj_font.render(mesaj, True, mesaj_color)
-            mesaj_surface.set_alpha(int(255 * min(1, progress * 3)))
-            mesaj_rect = mesaj_surface.get_rect(center=(self.COLS*CELL_SIZE//2, self.ROWS*CELL_SIZE//2))
+            mesaj_surface = self.yazilar.yazi(mesaj, 48, mesaj_color, int(255 * min(1, progress * 3)))
+            mesaj_rect = mesaj_surface.get_rect(center=(self.GORUS_COLS*CELL_SIZE//2, self.GORUS_ROWS*CELL_SIZE//2))
             self.pencere.blit(mesaj_surface, mesaj_rect)
 
             # Devam mesajı
             if progress > 0.7:  # Son 30% zamanında göster
                 devam_alpha = int(255 * pulse)  # Yanıp sönme efekti
-                devam_text = self.font.render("Menüye dönmek için bekleyin...", True, WHITE)
-                devam_text.set_alpha(devam_alpha)
-                devam_rect = devam_text.get_rect(center=(self.COLS*CELL_SIZE//2, self.ROWS*CELL_SIZE - 50))
+                devam_text = self.yazilar.yazi("Menüye dönmek için bekleyin...", 36, WHITE, devam_alpha)
+                devam_rect = devam_text.get_rect(center=(self.GORUS_COLS*CELL_SIZE//2, self.GORUS_ROWS*CELL_SIZE - 50))
                 self.pencere.blit(devam_text, devam_rect)
 
             pygame.display.flip()
@@ -679,16 +574,10 @@ class Oyun:
             (">", "Sağa hareket"),
             ("ESC", "Menüye dön"),
         ]
-        
-        baslik_font = pygame.font.Font(None, 72)
-        tus_font = pygame.font.Font(None, 48)
-        aciklama_font = pygame.font.Font(None, 36)
+        zamanlayici = KareZamanlayici(YANIP_SONME_ARALIGI)
 
         while kontroller_aktif:
-            current_time = pygame.time.get_ticks() / 1000
-            pulse = (math.sin(current_time * 2) + 1) / 2  # Yanıp sönme efekti
-            
-            for event in pygame.event.get():
+            for event in zamanlayici.olaylar():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -696,15 +585,18 @@ class Oyun:
                     if event.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
                         kontroller_aktif = False
 
+            if not kontroller_aktif or not zamanlayici.cizilmeli():
+                continue
+
+            current_time = pygame.time.get_ticks() / 1000
+            pulse = (math.sin(current_time * 2) + 1) / 2  # Yanıp sönme efekti
+
             # Arkaplan gradyanı
-            self.screen.fill(BLACK)
-            for i in range(600):
-                color = (max(0, min(255, i // 4)), max(0, min(255, i // 4)), max(0, min(255, i // 2)))
-                pygame.draw.line(self.screen, color, (0, i), (800, i))
+            self.screen.blit(gradyan(800, 600, EKRAN_GRADYANI), (0, 0))
 
             # Başlık
-            baslik_shadow = baslik_font.render(baslik, True, BLACK)
-            baslik_text = baslik_font.render(baslik, True, STAR_WARS_YELLOW)
+            baslik_shadow = self.yazilar.yazi(baslik, 72, BLACK)
+            baslik_text = self.yazilar.yazi(baslik, 72, STAR_WARS_YELLOW)
             baslik_rect = baslik_text.get_rect(center=(400, 100))
             self.screen.blit(baslik_shadow, (baslik_rect.x + 3, baslik_rect.y + 3))
             self.screen.blit(baslik_text, baslik_rect)
@@ -721,23 +613,22 @@ class Oyun:
                 pygame.draw.rect(self.screen, STAR_WARS_BLUE, box_rect, 3)
                 
                 # Tuş metni
-                tus_text = tus_font.render(tus, True, WHITE)
+                tus_text = self.yazilar.yazi(tus, 48, WHITE)
                 tus_rect = tus_text.get_rect(center=box_rect.center)
                 self.screen.blit(tus_text, tus_rect)
                 
                 # Açıklama
-                aciklama_text = aciklama_font.render(aciklama, True, STAR_WARS_YELLOW)
+                aciklama_text = self.yazilar.yazi(aciklama, 36, STAR_WARS_YELLOW)
                 aciklama_rect = aciklama_text.get_rect(midleft=(320, 225 + i * 60))
                 self.screen.blit(aciklama_text, aciklama_rect)
 
             # Alt bilgi
-            devam_text = aciklama_font.render("Devam etmek için ENTER'a basın", True, WHITE)
+            devam_text = self.yazilar.yazi("Devam etmek için ENTER'a basın", 36, WHITE,
+                                           int(255 * pulse))  # Yanıp sönme efekti
             devam_rect = devam_text.get_rect(center=(400, 550))
-            devam_text.set_alpha(int(255 * pulse))  # Yanıp sönme efekti
             self.screen.blit(devam_text, devam_rect)
 
             pygame.display.flip()
-            self.clock.tick(60)
 
     def yardim_goster(self):
         """Oyun hakkında yardım ve bilgi ekranı"""
@@ -748,9 +639,6 @@ class Oyun:
         LIGHTSABER_RED = (255, 0, 0)
 
         baslik = "YARDIM"
-        baslik_font = pygame.font.Font(None, 72)
-        alt_baslik_font = pygame.font.Font(None, 48)
-        aciklama_font = pygame.font.Font(None, 36)
 
         karakterler = [
             ("Luke Skywalker", "3 can hakkı", LIGHTSABER_RED),
@@ -763,11 +651,10 @@ class Oyun:
             ("Stormtrooper", "Normal hareket eder", BLACK)
         ]
 
+        zamanlayici = KareZamanlayici(YANIP_SONME_ARALIGI)
+
         while yardim_aktif:
-            current_time = pygame.time.get_ticks() / 1000
-            pulse = (math.sin(current_time * 2) + 1) / 2  # Yanıp sönme efekti
-            
-            for event in pygame.event.get():
+            for event in zamanlayici.olaylar():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -775,15 +662,18 @@ class Oyun:
                     if event.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
                         yardim_aktif = False
 
+            if not yardim_aktif or not zamanlayici.cizilmeli():
+                continue
+
+            current_time = pygame.time.get_ticks() / 1000
+            pulse = (math.sin(current_time * 2) + 1) / 2  # Yanıp sönme efekti
+
             # Arkaplan gradyanı
-            self.screen.fill(BLACK)
-            for i in range(600):
-                color = (max(0, min(255, i // 4)), max(0, min(255, i // 4)), max(0, min(255, i // 2)))
-                pygame.draw.line(self.screen, color, (0, i), (800, i))
+            self.screen.blit(gradyan(800, 600, EKRAN_GRADYANI), (0, 0))
 
             # Başlık
-            baslik_shadow = baslik_font.render(baslik, True, BLACK)
-            baslik_text = baslik_font.render(baslik, True, STAR_WARS_YELLOW)
+            baslik_shadow = self.yazilar.yazi(baslik, 72, BLACK)
+            baslik_text = self.yazilar.yazi(baslik, 72, STAR_WARS_YELLOW)
             baslik_rect = baslik_text.get_rect(center=(400, 80))
             self.screen.blit(baslik_shadow, (baslik_rect.x + 3, baslik_rect.y + 3))
             self.screen.blit(baslik_text, baslik_rect)
@@ -794,16 +684,16 @@ class Oyun:
             pygame.draw.line(self.screen, line_color, (150, 135), (650, 135), 1)
 
             # Oyun Amacı
-            amac_text = alt_baslik_font.render("Oyun Amacı", True, STAR_WARS_BLUE)
+            amac_text = self.yazilar.yazi("Oyun Amacı", 48, STAR_WARS_BLUE)
             amac_rect = amac_text.get_rect(center=(400, 180))
             self.screen.blit(amac_text, amac_rect)
             
-            hedef_text = aciklama_font.render("Hedefe (*) ulaşırken düşmanlardan kaçın!", True, WHITE)  # Yıldız karakteri değiştirildi
+            hedef_text = self.yazilar.yazi("Hedefe (*) ulaşırken düşmanlardan kaçın!", 36, WHITE)  # Yıldız karakteri değiştirildi
             hedef_rect = hedef_text.get_rect(center=(400, 220))
             self.screen.blit(hedef_text, hedef_rect)
 
             # Karakterler
-            karakter_baslik = alt_baslik_font.render("Karakterler", True, STAR_WARS_BLUE)
+            karakter_baslik = self.yazilar.yazi("Karakterler", 48, STAR_WARS_BLUE)
             self.screen.blit(karakter_baslik, (50, 280))
 
             for i, (ad, ozellik, renk) in enumerate(karakterler):
@@ -811,13 +701,13 @@ class Oyun:
                 pygame.draw.circle(self.screen, renk, (80, 340 + i * 50), 15)
                 
                 # Karakter adı ve özelliği
-                ad_text = aciklama_font.render(f"{ad}:", True, STAR_WARS_YELLOW)
-                ozellik_text = aciklama_font.render(ozellik, True, WHITE)
+                ad_text = self.yazilar.yazi(f"{ad}:", 36, STAR_WARS_YELLOW)
+                ozellik_text = self.yazilar.yazi(ozellik, 36, WHITE)
                 self.screen.blit(ad_text, (110, 330 + i * 50))
                 self.screen.blit(ozellik_text, (350, 330 + i * 50))
 
             # Düşmanlar
-            dusman_baslik = alt_baslik_font.render("Düşmanlar", True, STAR_WARS_BLUE)
+            dusman_baslik = self.yazilar.yazi("Düşmanlar", 48, STAR_WARS_BLUE)
             self.screen.blit(dusman_baslik, (50, 430))
 
             for i, (ad, ozellik, renk) in enumerate(dusmanlar):
@@ -825,19 +715,18 @@ class Oyun:
                 pygame.draw.circle(self.screen, renk, (80, 490 + i * 50), 15)
                 
                 # Düşman adı ve özelliği
-                ad_text = aciklama_font.render(f"{ad}:", True, STAR_WARS_YELLOW)
-                ozellik_text = aciklama_font.render(ozellik, True, WHITE)
+                ad_text = self.yazilar.yazi(f"{ad}:", 36, STAR_WARS_YELLOW)
+                ozellik_text = self.yazilar.yazi(ozellik, 36, WHITE)
                 self.screen.blit(ad_text, (110, 480 + i * 50))
                 self.screen.blit(ozellik_text, (350, 480 + i * 50))
 
             # Alt bilgi
-            devam_text = aciklama_font.render("Devam etmek için ENTER'a basın", True, WHITE)
+            devam_text = self.yazilar.yazi("Devam etmek için ENTER'a basın", 36, WHITE,
+                                           int(255 * pulse))  # Yanıp sönme efekti
             devam_rect = devam_text.get_rect(center=(400, 570))
-            devam_text.set_alpha(int(255 * pulse))  # Yanıp sönme efekti
             self.screen.blit(devam_text, devam_rect)
 
             pygame.display.flip()
-            self.clock.tick(60)
 
     def oyun_duraklatildi_goster(self):
         """Oyun duraklatıldığında gösterilecek ekran"""
@@ -848,8 +737,19 @@ class Oyun:
         ]
         secili = 0
 
+        # Yarı saydam siyah katman oyun ekranının bir kopyasına bir kez
+        # uygulanır; her çizimde bu kopya kullanıldığı için kararma birikmez
+        arka_plan = self.pencere.copy()
+        s = pygame.Surface((self.GORUS_COLS*CELL_SIZE, self.GORUS_ROWS*CELL_SIZE))
+        s.set_alpha(128)
+        s.fill(BLACK)
+        arka_plan.blit(s, (0,0))
+
+        # Animasyon yok, sadece tuşa basılınca yeniden çizilir
+        zamanlayici = KareZamanlayici()
+
         while True:
-            for event in pygame.event.get():
+            for event in zamanlayici.olaylar():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -863,26 +763,28 @@ class Oyun:
                     elif event.key == pygame.K_RETURN:
                         self.ses_cal('menu_onay')
                         if secili == 0:  # Devam Et
+                            self.kirli_alanlar.tamamiKirli()
                             return
                         duraklat_menu[secili]["action"]()
+                        return  # Oyun bitti, menüye dönülüyor
                     elif event.key == pygame.K_ESCAPE:
+                        self.kirli_alanlar.tamamiKirli()
                         return
 
-            # Yarı saydam siyah arka plan
-            s = pygame.Surface((self.COLS*CELL_SIZE, self.ROWS*CELL_SIZE))
-            s.set_alpha(128)
-            s.fill(BLACK)
-            self.pencere.blit(s, (0,0))
+            if not zamanlayici.cizilmeli():
+                continue
+
+            # Karartılmış oyun ekranı
+            self.pencere.blit(arka_plan, (0,0))
 
             # Menü seçenekleri
             for i, item in enumerate(duraklat_menu):
                 color = RED if i == secili else WHITE
-                text = self.font.render(item["text"], True, color)
-                rect = text.get_rect(center=(self.COLS*CELL_SIZE//2, self.ROWS*CELL_SIZE//2 - 50 + i * 50))
+                text = self.yazilar.yazi(item["text"], 36, color)
+                rect = text.get_rect(center=(self.GORUS_COLS*CELL_SIZE//2, self.GORUS_ROWS*CELL_SIZE//2 - 50 + i * 50))
                 self.pencere.blit(text, rect)
 
             pygame.display.flip()
-            self.clock.tick(30)
 
     def menuye_don(self):
         """Oyunu durdurup menüye döner"""
@@ -903,8 +805,6 @@ class Oyun:
         # Menü başlığı
         baslik = "STAR WARS"
         alt_baslik = "LABİRENT OYUNU"
-        baslik_font = pygame.font.Font(None, 72)
-        alt_baslik_font = pygame.font.Font(None, 48)
 
         # Animasyon için değişkenler
         pulse = 0
@@ -912,10 +812,10 @@ class Oyun:
         title_offset = 0
         title_speed = 0.5
 
+        zamanlayici = KareZamanlayici(MENU_KARE_ARALIGI)
+
         while self.menu_aktif:
-            current_time = pygame.time.get_ticks() / 1000  # Saniye cinsinden zaman
-            
-            for event in pygame.event.get():
+            for event in zamanlayici.olaylar():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -930,19 +830,21 @@ class Oyun:
                         self.ses_cal('menu_onay')
                         self.menu_items[self.selected_item]["action"]()
 
+            if not self.menu_aktif or not zamanlayici.cizilmeli():
+                continue
+
+            current_time = pygame.time.get_ticks() / 1000  # Saniye cinsinden zaman
+
             # Arkaplan gradyanı
-            self.screen.fill(BLACK)
-            for i in range(600):
-                color = (max(0, min(255, i // 3)), max(0, min(255, i // 4)), max(0, min(255, i // 2)))
-                pygame.draw.line(self.screen, color, (0, i), (800, i))
+            self.screen.blit(gradyan(800, 600, MENU_GRADYANI), (0, 0))
 
             # Başlık animasyonu
             pulse = (math.sin(current_time * pulse_speed) + 1) / 2  # 0 ile 1 arası
             title_offset = math.sin(current_time * title_speed) * 5  # -5 ile 5 arası
 
             # Başlık çizimi
-            baslik_shadow = baslik_font.render(baslik, True, BLACK)
-            baslik_surface = baslik_font.render(baslik, True, STAR_WARS_YELLOW)
+            baslik_shadow = self.yazilar.yazi(baslik, 72, BLACK)
+            baslik_surface = self.yazilar.yazi(baslik, 72, STAR_WARS_YELLOW)
             baslik_rect = baslik_surface.get_rect(center=(400, 80 + title_offset))
             
             # Gölge efekti
@@ -950,7 +852,7 @@ class Oyun:
             self.screen.blit(baslik_surface, baslik_rect)
 
             # Alt başlık
-            alt_baslik_surface = alt_baslik_font.render(alt_baslik, True, STAR_WARS_BLUE)
+            alt_baslik_surface = self.yazilar.yazi(alt_baslik, 48, STAR_WARS_BLUE)
             alt_baslik_rect = alt_baslik_surface.get_rect(center=(400, 140))
             self.screen.blit(alt_baslik_surface, alt_baslik_rect)
 
@@ -975,73 +877,33 @@ class Oyun:
                     color = (200, 200, 200)
                     text_color = (180, 180, 180)
 
-                text = self.font.render(item["text"], True, color)
+                text = self.yazilar.yazi(item["text"], 36, color)
                 rect = text.get_rect(center=(400, 250 + i * 50))
                 
                 # Seçili öğe için gölge efekti
                 if i == self.selected_item:
-                    glow = self.font.render(item["text"], True, text_color)
+                    glow = self.yazilar.yazi(item["text"], 36, text_color)
                     glow_rect = glow.get_rect(center=(400, 250 + i * 50))
                     self.screen.blit(glow, (glow_rect.x + 2, glow_rect.y + 2))
                 
                 self.screen.blit(text, rect)
             
             pygame.display.flip()
-            self.clock.tick(60)
-
-    def carpismaKontrol(self):
-        """Çarpışma kontrolü ve hasar hesaplama"""
-        for kotu in self.kotu_karakterler:
-            if (kotu.getKonum().getX() == self.iyi_karakter.getKonum().getX() and 
-                kotu.getKonum().getY() == self.iyi_karakter.getKonum().getY()):
-                
-                # Mevcut canı al
-                mevcut_can = float(self.iyi_karakter.getCan())
-                
-                # Karakter tipine göre hasar uygula
-                if isinstance(self.iyi_karakter, MasterYoda):
-                    yeni_can = mevcut_can - 0.5
-                else:  # Luke Skywalker
-                    yeni_can = mevcut_can - 1.0
-                
-                # Yeni can değerini ayarla
-                self.iyi_karakter.setCan(yeni_can)
-                self.ses_cal('hasar')
-                
-                # Can kontrolü
-                if yeni_can <= 0:
-                    self.iyi_karakter.setCan(0)  # Canı 0'a sabitle
-                    self.ses_cal('kaybetme')
-                    self.sonuc_ekrani(False)  # Game Over
-                    self.menuye_don()
-                    return True
-                
-                # Karakteri başlangıç noktasına geri döndür - koordinatları doğrudan atıyoruz
-                baslangic_konum = Lokasyon(6, 5)  # Başlangıç konumu net olarak tanımla
-                self.iyi_karakter.setKonum(baslangic_konum)
-                
-                # Konumun doğru ayarlandığını kontrol et (güvenlik amaçlı)
-                if self.iyi_karakter.getKonum().getX() != 6 or self.iyi_karakter.getKonum().getY() != 5:
-                    print("Konum düzeltiliyor...")
-                    self.iyi_karakter.getKonum().setX(6)
-                    self.iyi_karakter.getKonum().setY(5)
-                
-                return True
-                
-        # Hedefe ulaşma kontrolü
-        if (self.iyi_karakter.getKonum().getX() == self.hedef.getX() and 
-            self.iyi_karakter.getKonum().getY() == self.hedef.getY()):
-            self.ses_cal('kazanma')
-            self.sonuc_ekrani(True)
-            self.menuye_don()
-            return True
-            
-        return False
 
 # Ana program başlangıcı
 if __name__ == "__main__":
     try:
-        oyun = Oyun()
+        parser = argparse.ArgumentParser(description="Star Wars Labirent")
+        parser.add_argument("--suru", type=int, default=None,
+                            help="Haritaya bu kadar askerlik Stormtrooper sürüsü dağıt")
+        parser.add_argument("--tohum", type=int, default=None,
+                            help="Sürünün dağılımı için rastgele tohum")
+        parser.add_argument("--kaydet", default=None,
+                            help="Oyunu bu dosyaya kaydet (python tekrar.py ile oynatılır)")
+        parser.add_argument("--harita", default=HARITA_DOSYASI,
+                            help="Oynanacak harita dosyası (metin ya da ikili)")
+        args = parser.parse_args()
+        oyun = Oyun(args.suru, args.tohum, args.kaydet, args.harita)
         oyun.menu_dongusu()
     except Exception as e:
         print(f"Hata: {str(e)}")
@@ -0,0 +1,295 @@
+from karakterler import (Lokasyon, MasterYoda, Stormtrooper, DarthVader, KyloRen)
+from profil import Profilci
+from suru import Suru
+
+# adim() sonuçları (ses efektlerinin adlarıyla aynı)
+HAREKET = 'hareket'
+HASAR = 'hasar'
+KAYBETME = 'kaybetme'
+KAZANMA = 'kazanma'
+
+# Oyuncu eylemleri ve (x, y) yön vektörleri
+EYLEMLER = {
+    'yukari': (0, -1),
+    'asagi': (0, 1),
+    'sol': (-1, 0),
+    'sag': (1, 0),
+}
+
+KOTU_KARAKTERLER = {
+    "DarthVader": DarthVader,
+    "KyloRen": KyloRen,
+    "Stormtrooper": Stormtrooper,
+}
+
+class OyunDurumu:
+    """
+    Oyunun pygame'den bağımsız çekirdeği. Ekran, ses ya da zaman bilgisi
+    tutmaz; adim() çağrıldıkça olabildiğince hızlı ilerler. Pygame ön yüzü
+    (main.Oyun) ve toplu simülasyonlar aynı kuralları buradan kullanır.
+    """
+    def __init__(self, harita, karakter_class, ortak_mesafe_alani=True, artimsal=False,
+                 adim_tablosu=None, profilci=None, suru=None, tohum=0):
+        self.harita = harita
+        self.labirent = harita.labirent
+        # Açıkken her oyuncu hamlesinde kötü karakter türü başına tek bir
+        # mesafe alanı hesaplanır ve o türdeki tüm karakterler paylaşır
+        self.ortak_mesafe_alani = ortak_mesafe_alani
+        # Açıkken her kötü karakter kendi artımsal planlayıcısını tutar;
+        # oyuncu bir hücre ilerleyince alan baştan hesaplanmaz, onarılır.
+        # Bu mod ortak_mesafe_alani ayarından önce gelir.
+        self.artimsal = artimsal
+        # Verilirse (adim_tablosu.AdimTablosu) tablosu olan kötü karakterler
+        # adımlarını ve mesafelerini aramadan tablodan okur
+        self.adim_tablosu = adim_tablosu
+        # Kötü karakter hareketi ve çarpışma evreleri ile yol bulma
+        # çağrıları buna kaydedilir (profil.Profilci; varsayılanı kapalı)
+        self.profilci = profilci if profilci is not None else Profilci()
+        # Sürü asker sayısı; None ise haritadaki Suru başlığı kullanılır.
+        # Askerler tohuma göre dağıtılır, aynı tohum aynı oyunu verir.
+        self.suru_adedi = harita.suru if suru is None else suru
+        self.tohum = tohum
+
+        self.hamle_sayisi = 0
+        self.alinan_hasar = 0.0
+        self.bitti = False
+        self.sonuc = None  # KAZANMA ya da KAYBETME
+
+        self._alan_anahtari = None
+        self._alanlar = {}
+        self._mesafe_anahtari = None
+        self._mesafeler = []
+
+        self.oyunuHazirla(karakter_class)
+
+    def oyunuHazirla(self, karakter_class):
+        """
+        Seçilen karaktere ve haritadaki bilgilere göre oyunu hazırlar
+        """
+        # İyi karakteri oluştur - başlangıç noktası hareketle değişmesin diye kopyalanır
+        baslangic = self.harita.baslangic
+        self.iyi_karakter = karakter_class(Lokasyon(baslangic.x, baslangic.y))
+
+        # Kötü karakterleri oluştur. Her karaktere kapı konumunun kendi
+        # kopyası verilir; böylece aynı kapıda doğanlar birbirini
+        # sürüklemez ve aynı Harita nesnesi birden fazla oyunda
+        # değişmeden kullanılabilir.
+        kapilar = self.harita.kapilar
+        self.kotu_karakterler = []
+        for bilgi in self.harita.karakter_bilgileri:
+            karakter_class = KOTU_KARAKTERLER.get(bilgi["karakter"])
+            kapi = bilgi["kapi"]
+
+            if karakter_class and kapi in kapilar:
+                konum = kapilar[kapi]
+                self.kotu_karakterler.append(karakter_class(Lokasyon(konum.x, konum.y)))
+
+        # Hücre indeksinden o hücredeki kötü karakterlerin sıralarına
+        # doluluk dizini; çarpışmalar kötü karakter sayısından bağımsız
+        # olarak oyuncunun hücresine bakılarak bulunur
+        self._isgal = {}
+        self._kotu_hucreleri = []
+        for i, kotu in enumerate(self.kotu_karakterler):
+            hucre = self._hucre(kotu.konum)
+            self._kotu_hucreleri.append(hucre)
+            self._isgal.setdefault(hucre, []).append(i)
+        # Son hamlede yer değiştiren kötü karakterlerin eski hücreleri
+        self._eski_hucreler = {}
+        self._hedef_hucresi = self._hucre(self.harita.hedef)
+
+        if self.artimsal:
+            self.planlayicilar = [kotu.planlayiciOlustur(self.labirent)
+                                  for kotu in self.kotu_karakterler]
+
+        # Sürü, haritadaki Stormtrooper'larla aynı mesafe alanını kullanır;
+        # alan türe göre önbelleklendiği için örnek bir asker tutulur
+        self.suru = None
+        if self.suru_adedi:
+            self.suru = Suru.dogur(self.labirent, self.suru_adedi,
+                                   self._hucre(self.harita.baslangic), self.tohum)
+            self._suru_askeri = Stormtrooper(Lokasyon(0, 0))
+
+    def gecerliHareket(self, eylem):
+        """Oyuncu bu yönde duvara ya da harita dışına çarpmadan ilerleyebilir mi"""
+        if eylem not in EYLEMLER:
+            return False
+        dx, dy = EYLEMLER[eylem]
+        konum = self.iyi_karakter.getKonum()
+        return self.labirent.acik(konum.x + dx, konum.y + dy)
+
+    def adim(self, eylem):
+        """
+        Oyunu bir hamle ilerletir: oyuncu eylem yönünde hareket eder,
+        ardından kötü karakterler ilerler ve çarpışmalar kontrol edilir.
+        Geçersiz hamlede hiçbir şey değişmez ve None döner; aksi halde
+        HAREKET, HASAR, KAYBETME ya da KAZANMA döner.
+        """
+        if self.bitti or not self.gecerliHareket(eylem):
+            return None
+
+        dx, dy = EYLEMLER[eylem]
+        konum = self.iyi_karakter.konum
+        onceki_hucre = self._hucre(konum)
+        konum.x += dx
+        konum.y += dy
+        self.hamle_sayisi += 1
+
+        # Kötü karakterlerin hareketi
+        with self.profilci.evre("kotuler"):
+            self.kotuleriHareketEttir()
+
+        # Çarpışma kontrolü
+        with self.profilci.evre("carpisma"):
+            return self.carpismaKontrol(onceki_hucre) or HAREKET
+
+    def _hucre(self, konum):
+        return self.labirent.indeks(konum.x, konum.y)
+
+    def kotuleriHareketEttir(self):
+        """Kötü karakterleri oyuncuya doğru birer adım ilerletir"""
+        hedef = self.iyi_karakter.getKonum()
+        profilci = self.profilci
+
+        for i, kotu in enumerate(self.kotu_karakterler):
+            if self.adim_tablosu is not None and self.adim_tablosu.destekler(kotu):
+                yontem = "tablo"
+                next_pos = self.adim_tablosu.adim(kotu, hedef)
+            elif self.artimsal:
+                yontem = "artimsal"
+                next_pos = kotu.planlayicidanAdim(self.planlayicilar[i], hedef, self.labirent)
+            elif self.ortak_mesafe_alani:
+                yontem = "alandanAdim"
+                next_pos = kotu.alandanAdim(self.turAlani(kotu), self.labirent)
+            else:
+                yontem = "enKisaYol"
+                yol = kotu.enKisaYol(hedef, self.labirent)
+                next_pos = yol[1] if yol and len(yol) > 1 else None  # Bir sonraki adım
+            if profilci.etkin:
+                profilci.say(yontem)
+
+            if next_pos:
+                kotu.konum.y, kotu.konum.x = next_pos
+
+        self.isgalGuncelle()
+
+        if self.suru is not None:
+            profilci.say("suru")
+            self.suru.ilerle(self.turAlani(self._suru_askeri))
+
+    def isgalGuncelle(self):
+        """
+        Doluluk dizinini kötü karakterlerin güncel konumlarına göre
+        düzeltir; sadece kayıtlı hücresi konumundan farklı olan
+        karakterler taşınır.
+        """
+        isgal = self._isgal
+        self._eski_hucreler = {}
+        for i, kotu in enumerate(self.kotu_karakterler):
+            eski, yeni = self._kotu_hucreleri[i], self._hucre(kotu.konum)
+            if eski == yeni:
+                continue
+            self._eski_hucreler[i] = eski
+            self._kotu_hucreleri[i] = yeni
+            sakinler = isgal[eski]
+            sakinler.remove(i)
+            if not sakinler:
+                del isgal[eski]
+            isgal.setdefault(yeni, []).append(i)
+
+    def _icindenGecti(self, onceki_hucre, oyuncu_hucresi):
+        """
+        Oyuncu onceki_hucre'den oyuncu_hucresi'ne geçerken aynı kenardan
+        ters yönde geçen bir kötü karakter var mı? Kötü karakterler düz bir
+        çizgide bir ya da (Kylo Ren) iki hücre ilerler; oyuncunun içinden
+        geçenler onun eski hücresinde ya da bir ötesinde durur, sadece bu
+        iki hücreye bakılır.
+        """
+        yon = onceki_hucre - oyuncu_hucresi
+        for hucre in (onceki_hucre, onceki_hucre + yon):
+            for i in self._isgal.get(hucre, ()):
+                eski = self._eski_hucreler.get(i)
+                if eski in (oyuncu_hucresi, oyuncu_hucresi - yon) and hucre - eski in (yon, 2 * yon):
+                    return True
+        return False
+
+    def carpismaKontrol(self, onceki_hucre=None):
+        """
+        Çarpışma kontrolü ve hasar hesaplama. Kötü karakterler doluluk
+        dizininden, sürü askerleri sürünün dolu hücrelerinden bulunur.
+        onceki_hucre (oyuncunun hamleden önceki hücre indeksi) verilirse
+        oyuncuyla yer değiştirerek içinden geçen kötü karakterler de
+        çarpışmış sayılır. Bir şey olmadıysa None, aksi halde HASAR,
+        KAYBETME ya da KAZANMA döner.
+        """
+        oyuncu = self.iyi_karakter.getKonum()
+        oyuncu_hucresi = self._hucre(oyuncu)
+        if oyuncu_hucresi in self._isgal or (
+                onceki_hucre is not None and onceki_hucre != oyuncu_hucresi and
+                self._icindenGecti(onceki_hucre, oyuncu_hucresi)) or (
+                self.suru is not None and self.suru.carpti(oyuncu_hucresi, onceki_hucre)):
+            # Karakter tipine göre hasar uygula
+            hasar = 0.5 if isinstance(self.iyi_karakter, MasterYoda) else 1.0
+            yeni_can = float(self.iyi_karakter.getCan()) - hasar
+            self.iyi_karakter.setCan(yeni_can)
+            self.alinan_hasar += hasar
+
+            # Can kontrolü
+            if yeni_can <= 0:
+                self.iyi_karakter.setCan(0)  # Canı 0'a sabitle
+                self.bitti = True
+                self.sonuc = KAYBETME
+                return KAYBETME
+
+            # Karakteri başlangıç noktasına geri döndür
+            baslangic = self.harita.baslangic
+            self.iyi_karakter.setKonum(Lokasyon(baslangic.x, baslangic.y))
+            return HASAR
+
+        # Hedefe ulaşma kontrolü
+        if oyuncu_hucresi == self._hedef_hucresi:
+            self.bitti = True
+            self.sonuc = KAZANMA
+            return KAZANMA
+
+        return None
+
+    def turAlani(self, kotu):
+        """
+        Karakterin türü için oyuncunun güncel konumuna göre mesafe alanını
+        döndürür. Alan her tür için bir kez hesaplanır; oyuncu hareket edene
+        ya da harita değişene kadar önbellekten okunur.
+        """
+        hedef = self.iyi_karakter.getKonum()
+        anahtar = (self.harita.surum, hedef.x, hedef.y)
+        if self._alan_anahtari != anahtar:
+            self._alan_anahtari = anahtar
+            self._alanlar = {}
+
+        tur = type(kotu)
+        if tur not in self._alanlar:
+            self.profilci.say("mesafeAlani")
+            self._alanlar[tur] = kotu.mesafeAlani(hedef, self.labirent)
+        return self._alanlar[tur]
+
+    def mesafeleriGetir(self):
+        """
+        Her kötü karakterin oyuncuya kalan mesafesini döndürür (yol yoksa None).
+        Sonuç oyuncu ve kötü karakter konumları ile harita sürümüne göre
+        önbelleklenir, böylece çizim her karede yol aramaz.
+        """
+        hedef = self.iyi_karakter.getKonum()
+        anahtar = (self.harita.surum, hedef.x, hedef.y,
+                   tuple((kotu.konum.x, kotu.konum.y)
+                         for kotu in self.kotu_karakterler))
+        if self._mesafe_anahtari != anahtar:
+            self._mesafe_anahtari = anahtar
+            self._mesafeler = [self._kotuMesafesi(i, kotu, hedef)
+                               for i, kotu in enumerate(self.kotu_karakterler)]
+        return self._mesafeler
+
+    def _kotuMesafesi(self, i, kotu, hedef):
+        if self.adim_tablosu is not None and self.adim_tablosu.destekler(kotu):
+            return self.adim_tablosu.mesafe(kotu, hedef)
+        if self.artimsal:
+            return kotu.planlayiciMesafesi(self.planlayicilar[i], hedef, self.labirent)
+        return kotu.alanMesafesi(self.turAlani(kotu), self.labirent)
@@ -0,0 +1,134 @@
+"""
+Oyun döngüsünün evrelerini (girdi, kötü karakter hareketi, çarpışma,
+çizim, ekrana gönderme, bekleme) ölçen hafif profilci. Kapalıyken
+ölçüm yapılmaz; açıkken her karenin evre süreleri ve yol bulma çağrı
+sayaçları tutulur, ekranda gösterilebilir ve CSV olarak yazılabilir.
+
+Oyun STARWARS_PROFIL=1 ortam değişkeniyle profilci açık başlar;
+STARWARS_PROFIL_CSV=dosya verilirse oyun bitince kayıtlar bu dosyaya
+yazılır.
+"""
+import csv
+import os
+import time
+from collections import deque
+
+# Evreler ekranda ve CSV'de bu sırayla gösterilir
+EVRELER = ("girdi", "kotuler", "carpisma", "ciz", "ekran", "bekleme")
+
+class _Olcum:
+    __slots__ = ("profilci", "evre", "baslangic")
+
+    def __init__(self, profilci, evre):
+        self.profilci = profilci
+        self.evre = evre
+
+    def __enter__(self):
+        self.baslangic = time.perf_counter()
+
+    def __exit__(self, *hata):
+        kare = self.profilci._kare
+        kare[self.evre] = kare.get(self.evre, 0.0) + time.perf_counter() - self.baslangic
+
+class _BosOlcum:
+    """Profilci kapalıyken kullanılan, hiçbir şey yapmayan ölçüm"""
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *hata):
+        pass
+
+_BOS = _BosOlcum()
+
+class Profilci:
+    """
+    Kare kare evre süreleri ve sayaçlar. Ölçülecek kod
+    'with profilci.evre("ciz"):' ile sarılır, sayaçlar say() ile
+    artırılır, her karenin sonunda kareBitti() çağrılır. Son pencere
+    kadar kare ekrandaki ortalamalar için, son en_fazla_kayit kadar kare
+    CSV için saklanır.
+    """
+    def __init__(self, etkin=False, pencere=120, en_fazla_kayit=100000):
+        self.etkin = etkin
+        # Verilirse oyun bitince kayıtlar bu CSV dosyasına yazılır
+        self.csv_dosyasi = None
+        self.kareler = deque(maxlen=pencere)
+        self.kayitlar = deque(maxlen=en_fazla_kayit)
+        self._kare = {}
+        self._sayaclar = {}
+        self._kare_baslangici = None
+
+    @classmethod
+    def ortamdan(cls):
+        """STARWARS_PROFIL ortam değişkenine göre açık ya da kapalı profilci"""
+        profilci = cls(etkin=os.environ.get("STARWARS_PROFIL", "") not in ("", "0"))
+        profilci.csv_dosyasi = os.environ.get("STARWARS_PROFIL_CSV") or None
+        return profilci
+
+    def degistir(self):
+        """Profilciyi açar ya da kapatır"""
+        self.etkin = not self.etkin
+        self.kareyiAt()
+
+    def kareyiAt(self):
+        """
+        Yarım kalan kareyi atar ve sıradaki kareyi şimdi başlatır (örneğin
+        duraklatma ekranında geçen süre ölçümlere karışmasın diye)
+        """
+        self._kare = {}
+        self._sayaclar = {}
+        self._kare_baslangici = time.perf_counter() if self.etkin else None
+
+    def evre(self, ad):
+        return _Olcum(self, ad) if self.etkin else _BOS
+
+    def say(self, ad, adet=1):
+        if self.etkin:
+            self._sayaclar[ad] = self._sayaclar.get(ad, 0) + adet
+
+    def kareBitti(self):
+        """Bir önceki kareBitti çağrısından bu yana ölçülenleri bir kare olarak kaydeder"""
+        if not self.etkin:
+            return
+        simdi = time.perf_counter()
+        if self._kare_baslangici is not None:
+            kayit = (simdi - self._kare_baslangici, self._kare, self._sayaclar)
+            self.kareler.append(kayit)
+            self.kayitlar.append((simdi,) + kayit)
+        self._kare_baslangici = simdi
+        self._kare = {}
+        self._sayaclar = {}
+
+    def fps(self):
+        toplam = sum(sure for sure, _, _ in self.kareler)
+        return len(self.kareler) / toplam if toplam else 0.0
+
+    def ortalamalar(self):
+        """Son karelerde evre başına ortalama ms ve sayaç başına kare başına ortalama"""
+        adet = len(self.kareler) or 1
+        evreler = {evre: 0.0 for evre in EVRELER}
+        sayaclar = {}
+        for _, kare, kare_sayaclari in self.kareler:
+            for evre, sure in kare.items():
+                evreler[evre] = evreler.get(evre, 0.0) + sure
+            for ad, deger in kare_sayaclari.items():
+                sayaclar[ad] = sayaclar.get(ad, 0) + deger
+        return ({evre: 1000 * sure / adet for evre, sure in evreler.items()},
+                {ad: deger / adet for ad, deger in sorted(sayaclar.items())})
+
+    def csvYaz(self, dosya):
+        """Kaydedilen kareleri satır başına bir kare olacak şekilde CSV'ye yazar"""
+        evreler = list(EVRELER)
+        sayaclar = set()
+        for _, _, kare, kare_sayaclari in self.kayitlar:
+            evreler += [evre for evre in kare if evre not in evreler]
+            sayaclar.update(kare_sayaclari)
+        sayaclar = sorted(sayaclar)
+
+        with open(dosya, 'w', newline='', encoding='utf-8') as f:
+            yazici = csv.writer(f)
+            yazici.writerow(["zaman", "kare_ms"] + [f"{evre}_ms" for evre in evreler] + sayaclar)
+            for zaman, sure, kare, kare_sayaclari in self.kayitlar:
+                yazici.writerow([f"{zaman:.6f}", f"{1000 * sure:.3f}"] +
+                                [f"{1000 * kare.get(evre, 0.0):.3f}" for evre in evreler] +
+                                [kare_sayaclari.get(ad, 0) for ad in sayaclar])
@@ -0,0 +1,216 @@
+"""
+Ekran açmadan çok sayıda oyunu paralel oynatıp kazanma istatistiği çıkarır.
+
+Örnek:
+    python simulasyon.py harita.txt --oyun 1000 --politika rastgele hedef
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import karakterler
+from adim_tablosu import tabloYukle
+from harita import haritaYukle
+from izgara import DUVAR_DISI
+from motor import OyunDurumu, EYLEMLER, KAZANMA, KAYBETME
+
+KAHRAMANLAR = ("LukeSkywalker", "MasterYoda")
+POLITIKALAR = ("rastgele", "hedef")
+
+# (y, x) farkından eyleme
+_YON_EYLEM = {(dy, dx): eylem for eylem, (dx, dy) in EYLEMLER.items()}
+
+# Her işçi süreci haritaları ve hedef mesafe alanlarını bir kez yükler
+_haritalar = {}
+_hedef_alanlari = {}
+_tablolar = {}
+
+def _haritaGetir(dosya):
+    if dosya not in _haritalar:
+        _haritalar[dosya] = haritaYukle(dosya)
+    return _haritalar[dosya]
+
+def _tabloGetir(dosya, harita):
+    if dosya not in _tablolar:
+        # Tablo ana süreçte hazırlandı; işçiler sadece mmap ile açar
+        _tablolar[dosya] = tabloYukle(harita.labirent, dosya, olustur=False)
+    return _tablolar[dosya]
+
+def _hedefAlani(dosya, harita):
+    """Oyuncunun hedefe en kısa yolu için hedeften geriye mesafe alanı"""
+    if dosya not in _hedef_alanlari:
+        labirent = harita.labirent
+        hedef = labirent.indeks(harita.hedef.getX(), harita.hedef.getY())
+        _hedef_alanlari[dosya] = labirent.mesafeAlani(hedef, labirent.komsular, DUVAR_DISI)
+    return _hedef_alanlari[dosya]
+
+def rastgelePolitika(durum, rng, alan):
+    """Geçerli hamleler arasından rastgele birini seçer"""
+    secenekler = [eylem for eylem in EYLEMLER if durum.gecerliHareket(eylem)]
+    return rng.choice(secenekler) if secenekler else None
+
+def hedefPolitikasi(durum, rng, alan):
+    """Kötü karakterlere bakmadan hedefe giden en kısa yolu izler"""
+    labirent = durum.labirent
+    konum = durum.iyi_karakter.getKonum()
+    adim = labirent.alandanAdim(alan, labirent.indeks(konum.getX(), konum.getY()),
+                                labirent.komsular, DUVAR_DISI)
+    if adim is None:
+        return None
+    return _YON_EYLEM[(adim[0] - konum.getY(), adim[1] - konum.getX())]
+
+POLITIKA_FONKSIYONLARI = {
+    "rastgele": rastgelePolitika,
+    "hedef": hedefPolitikasi,
+}
+
+def oyunOyna(dosya, kahraman, politika, tohum, hamle_siniri, artimsal=False, tablo=False,
+             suru=None):
+    """
+    Tek bir oyunu sonuna kadar (ya da hamle sınırına kadar) oynatır.
+    suru verilirse haritadaki Suru başlığı yerine bu kadar asker doğar.
+    """
+    harita = _haritaGetir(dosya)
+    adim_tablosu = _tabloGetir(dosya, harita) if tablo else None
+    durum = OyunDurumu(harita, getattr(karakterler, kahraman), artimsal=artimsal,
+                       adim_tablosu=adim_tablosu, suru=suru, tohum=tohum)
+    sec = POLITIKA_FONKSIYONLARI[politika]
+    alan = _hedefAlani(dosya, harita) if politika == "hedef" else None
+    rng = random.Random(tohum)
+
+    while not durum.bitti and durum.hamle_sayisi < hamle_siniri:
+        eylem = sec(durum, rng, alan)
+        if eylem is None:
+            break  # Oyuncu hareket edemiyor
+        durum.adim(eylem)
+
+    return {
+        "harita": dosya,
+        "karakter": kahraman,
+        "politika": politika,
+        "sonuc": durum.sonuc,
+        "hamle": durum.hamle_sayisi,
+        "hasar": durum.alinan_hasar,
+    }
+
+def _grupOyna(gorev):
+    """Aynı ayarla art arda birkaç oyun oynatır; süreçler arası trafiği azaltır"""
+    dosya, kahraman, politika, tohumlar, hamle_siniri, artimsal, tablo, suru = gorev
+    return [oyunOyna(dosya, kahraman, politika, tohum, hamle_siniri, artimsal, tablo, suru)
+            for tohum in tohumlar]
+
+def gorevleriHazirla(haritalar, kahramanlar, politikalar, oyun_sayisi, tohum,
+                     hamle_siniri, grup_boyutu, artimsal=False, tablo=False, suru=None):
+    gorevler = []
+    for dosya in haritalar:
+        for kahraman in kahramanlar:
+            for politika in politikalar:
+                tohumlar = range(tohum, tohum + oyun_sayisi)
+                for bas in range(0, oyun_sayisi, grup_boyutu):
+                    gorevler.append((dosya, kahraman, politika,
+                                     tohumlar[bas:bas + grup_boyutu], hamle_siniri,
+                                     artimsal, tablo, suru))
+    return gorevler
+
+def sonuclariTopla(sonuclar):
+    """Oyun sonuçlarını (harita, karakter, politika) bazında özetler"""
+    rapor = {}
+    for sonuc in sonuclar:
+        anahtar = (sonuc["harita"], sonuc["karakter"], sonuc["politika"])
+        ozet = rapor.setdefault(anahtar, {"oyun": 0, "kazanma": 0, "kaybetme": 0,
+                                          "toplam_hamle": 0, "toplam_hasar": 0.0})
+        ozet["oyun"] += 1
+        ozet["kazanma"] += sonuc["sonuc"] == KAZANMA
+        ozet["kaybetme"] += sonuc["sonuc"] == KAYBETME
+        ozet["toplam_hamle"] += sonuc["hamle"]
+        ozet["toplam_hasar"] += sonuc["hasar"]
+
+    satirlar = []
+    for (dosya, kahraman, politika), ozet in sorted(rapor.items()):
+        oyun = ozet["oyun"]
+        satirlar.append({
+            "harita": dosya,
+            "karakter": kahraman,
+            "politika": politika,
+            "oyun": oyun,
+            "kazanma_orani": ozet["kazanma"] / oyun,
+            "kaybetme_orani": ozet["kaybetme"] / oyun,
+            "bitmeyen": oyun - ozet["kazanma"] - ozet["kaybetme"],
+            "ortalama_hamle": ozet["toplam_hamle"] / oyun,
+            "ortalama_hasar": ozet["toplam_hasar"] / oyun,
+        })
+    return satirlar
+
+def simuleEt(haritalar, kahramanlar=KAHRAMANLAR, politikalar=("rastgele",), oyun_sayisi=100,
+             tohum=0, hamle_siniri=1000, is_parcacigi=None, grup_boyutu=None,
+             artimsal=False, tablo=False, suru=None):
+    """
+    Her harita, kahraman ve politika için oyun_sayisi kadar oyunu süreç
+    havuzunda oynatır ve özet satırlarını döndürür.
+    """
+    is_parcacigi = is_parcacigi or os.cpu_count() or 1
+    if grup_boyutu is None:
+        # Her işçiye birkaç grup düşsün ki yük dengelensin
+        toplam = len(haritalar) * len(kahramanlar) * len(politikalar) * oyun_sayisi
+        grup_boyutu = max(1, min(100, toplam // (is_parcacigi * 8)))
+
+    if tablo:
+        # Eksik ya da eskimiş tablolar işçiler başlamadan bir kez hesaplanır
+        for dosya in haritalar:
+            tabloYukle(_haritaGetir(dosya).labirent, dosya)
+
+    gorevler = gorevleriHazirla(haritalar, kahramanlar, politikalar, oyun_sayisi,
+                                tohum, hamle_siniri, grup_boyutu, artimsal, tablo, suru)
+    sonuclar = []
+    if is_parcacigi == 1:
+        for gorev in gorevler:
+            sonuclar.extend(_grupOyna(gorev))
+    else:
+        with ProcessPoolExecutor(max_workers=is_parcacigi) as havuz:
+            for grup in havuz.map(_grupOyna, gorevler):
+                sonuclar.extend(grup)
+    return sonuclariTopla(sonuclar)
+
+def main():
+    parser = argparse.ArgumentParser(description="Star Wars Labirent toplu simülasyonu")
+    parser.add_argument("haritalar", nargs="+", help="Harita dosyaları")
+    parser.add_argument("--oyun", type=int, default=100, help="Her ayar için oyun sayısı")
+    parser.add_argument("--karakter", nargs="+", choices=KAHRAMANLAR, default=list(KAHRAMANLAR))
+    parser.add_argument("--politika", nargs="+", choices=POLITIKALAR, default=["rastgele"])
+    parser.add_argument("--hamle-siniri", type=int, default=1000,
+                        help="Bir oyunda en fazla oyuncu hamlesi")
+    parser.add_argument("--tohum", type=int, default=0, help="İlk oyunun rastgele tohumu")
+    parser.add_argument("--is-parcacigi", type=int, default=None,
+                        help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--artimsal", action="store_true",
+                        help="Kötü karakterler artımsal (D* Lite) planlayıcı kullansın")
+    parser.add_argument("--tablo", action="store_true",
+                        help="Önceden hesaplanmış adım tablolarını kullan (yoksa oluşturulur)")
+    parser.add_argument("--suru", type=int, default=None,
+                        help="Haritaya bu kadar askerlik Stormtrooper sürüsü dağıt")
+    parser.add_argument("--json", help="Raporu bu dosyaya JSON olarak yaz")
+    args = parser.parse_args()
+
+    baslangic = time.perf_counter()
+    rapor = simuleEt(args.haritalar, args.karakter, args.politika, args.oyun,
+                     args.tohum, args.hamle_siniri, args.is_parcacigi,
+                     artimsal=args.artimsal, tablo=args.tablo, suru=args.suru)
+    sure = time.perf_counter() - baslangic
+
+    for satir in rapor:
+        print(f"{satir['harita']:<20} {satir['karakter']:<15} {satir['politika']:<9} "
+              f"oyun={satir['oyun']:<6} kazanma=%{100 * satir['kazanma_orani']:5.1f} "
+              f"ort_hamle={satir['ortalama_hamle']:7.1f} ort_hasar={satir['ortalama_hasar']:5.2f} "
+              f"bitmeyen={satir['bitmeyen']}")
+    toplam = sum(satir["oyun"] for satir in rapor)
+    print(f"{toplam} oyun {sure:.2f} saniyede ({toplam / sure:.0f} oyun/sn)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"sure": sure, "rapor": rapor}, f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Sürü kipi: yüzlerce ya da binlerce Stormtrooper ayrı Karakter nesneleri
+yerine tek bir hücre indeksi dizisinde tutulur ve oyuncudan geriye
+hesaplanan tek bir mesafe alanıyla hep birlikte ilerletilir.
+
+Haritada 'Suru:500' başlığı, oyunda ve simülasyonda --suru seçeneği
+sürüyü açar.
+"""
+import random
+from array import array
+
+from izgara import SADECE_YOL
+
+# Sürü askerleri oyuncunun başlangıcına bundan daha az hamle uzaklıkta doğmaz
+GUVENLI_MESAFE = 6
+
+class Suru:
+    """
+    Stormtrooper sürüsü. Askerlerin hücre indeksleri konumlar dizisinde
+    tutulur (asker başına bir nesne yerine tek bir dizi); dolu hücreler
+    ve bir önceki hamledeki konumlar çarpışma kontrolü için saklanır.
+    Askerler Stormtrooper ile aynı kurallarla, sadece yol (0)
+    hücrelerinde dört yönde hareket eder.
+    """
+    def __init__(self, labirent, konumlar):
+        self.labirent = labirent
+        self.konumlar = array('i', konumlar)
+        self.onceki = self.konumlar
+        self._dolu = set(self.konumlar)
+        self._onceki_dolu = self._dolu
+
+    @classmethod
+    def dogur(cls, labirent, adet, baslangic, tohum=0):
+        """
+        Başlangıç hücresinden ulaşılabilen, GUVENLI_MESAFE'den uzak yol
+        hücrelerine tohuma göre rastgele dağıtılmış adet askerlik sürü.
+        Haritada böyle hücre yoksa ulaşılabilen herhangi bir yol hücresi
+        kullanılır; o da yoksa ValueError verir.
+        """
+        alan = labirent.mesafeAlani(baslangic, labirent.komsular, SADECE_YOL)
+        hucreler = labirent.hucreler
+        yollar = [indeks for indeks, mesafe in enumerate(alan)
+                  if mesafe > 0 and SADECE_YOL[hucreler[indeks]]]
+        adaylar = [indeks for indeks in yollar if alan[indeks] >= GUVENLI_MESAFE] or yollar
+        if not adaylar:
+            raise ValueError("Haritada sürünün doğacağı yol hücresi yok!")
+        return cls(labirent, random.Random(tohum).choices(adaylar, k=adet))
+
+    def __len__(self):
+        return len(self.konumlar)
+
+    def ilerle(self, alan):
+        """Bütün sürüyü Stormtrooper mesafe alanına göre birer adım ilerletir"""
+        self.onceki, self._onceki_dolu = self.konumlar, self._dolu
+        self.konumlar = self.labirent.alandanKomsular(alan, self.konumlar,
+                                                      self.labirent.komsular, SADECE_YOL)
+        self._dolu = set(self.konumlar)
+
+    def dolu(self, hucre):
+        """Hücrede en az bir asker var mı"""
+        return hucre in self._dolu
+
+    def carpti(self, oyuncu_hucresi, onceki_hucre=None):
+        """
+        Oyuncu bir askerle aynı hücrede mi? onceki_hucre (oyuncunun
+        hamleden önceki hücresi) verilirse oyuncuyla yer değiştirerek
+        içinden geçen askerler de çarpışmış sayılır.
+        """
+        if oyuncu_hucresi in self._dolu:
+            return True
+        if (onceki_hucre is None or onceki_hucre not in self._dolu or
+                oyuncu_hucresi not in self._onceki_dolu):
+            return False
+        return any(eski == oyuncu_hucresi and yeni == onceki_hucre
+                   for eski, yeni in zip(self.onceki, self.konumlar))
+
+    def doluHucreler(self):
+        """Askerlerin bulunduğu hücrelerin indeksleri (her hücre bir kez)"""
+        return self._dolu
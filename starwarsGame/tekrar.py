@@ -0,0 +1,231 @@
+"""
+Oyun kayıtları: oyunun ayarları ve oyuncunun her hamlesi küçük bir ikili
+dosyaya yazılır. Motor belirlenimci olduğundan (sürü de tohumla dağılır)
+kayıt aynı oyunu birebir yeniden oynatır; her hamlenin sonucu ve oyun
+sonundaki durum özeti karşılaştırılarak yol bulmadaki gerilemeler yakalanır.
+
+Örnek:
+    python main.py --kaydet oyun.swk         # oynarken kaydeder
+    python tekrar.py oyun.swk                # ekransız, olabildiğince hızlı
+    python tekrar.py kayitlar/*.swk --tekrar 20 --profil-csv profil.csv
+    python tekrar.py oyun.swk --goster --hiz 4
+"""
+import argparse
+import hashlib
+import struct
+import sys
+import time
+from array import array
+
+import karakterler
+from adim_tablosu import tabloYukle
+from harita import haritaYukle
+from motor import OyunDurumu, EYLEMLER, HAREKET, HASAR, KAYBETME, KAZANMA
+from profil import Profilci
+
+# imza, biçim sürümü, bayraklar, sürü asker sayısı, tohum, harita özeti.
+# Ardından kahraman sınıfının ve harita dosyasının adı, sonra hamleler gelir.
+_BASLIK = struct.Struct('<4sHBxIQ20s')
+_IMZA = b'SWTK'
+_BICIM_SURUMU = 1
+_ORTAK_MESAFE_ALANI = 1
+_ARTIMSAL = 2
+
+# Hamle: oyun başından beri geçen ms ve eylem sırası | sonuç sırası << 2
+_HAMLE = struct.Struct('<IB')
+_EYLEMLER = tuple(EYLEMLER)
+_SONUCLAR = (HAREKET, HASAR, KAYBETME, KAZANMA)
+# Bu kodlu hamle kaydın sonudur; ardından son durumun özeti gelir
+_BITIS = 0xFF
+_OZET_BOYUTU = 20
+
+def haritaOzeti(harita):
+    """Kayıt başka bir haritada oynatılmasın diye hücreler ve karakterlerden özet"""
+    ozet = hashlib.sha1(bytes(harita.labirent.hucreler))
+    for bilgi in harita.karakter_bilgileri:
+        ozet.update(f"{bilgi['karakter']}:{bilgi['kapi']};".encode('utf-8'))
+    return ozet.digest()
+
+def durumOzeti(durum):
+    """Oyuncu, kötü karakter ve sürü hücreleri ile candan oyun durumu özeti"""
+    labirent = durum.labirent
+    konumlar = [durum.iyi_karakter.konum] + [kotu.konum for kotu in durum.kotu_karakterler]
+    hucreler = array('i', [labirent.indeks(konum.x, konum.y) for konum in konumlar])
+    if durum.suru is not None:
+        hucreler.extend(durum.suru.konumlar)
+    ozet = hashlib.sha1(hucreler.tobytes())
+    ozet.update(f"{durum.iyi_karakter.getCan()}:{durum.hamle_sayisi}".encode('ascii'))
+    return ozet.digest()
+
+def _metinYaz(f, metin):
+    veri = metin.encode('utf-8')
+    f.write(struct.pack('<H', len(veri)) + veri)
+
+def _metinOku(tampon, ofset):
+    uzunluk, = struct.unpack_from('<H', tampon, ofset)
+    ofset += 2
+    return tampon[ofset:ofset + uzunluk].decode('utf-8'), ofset + uzunluk
+
+class TekrarYazici:
+    """
+    Oyunu oynanırken kaydeder. Hamleler oldukları anda dosyaya yazılır,
+    böylece oyun çökse bile o ana kadarki kayıt oynatılabilir;
+    kapat() kaydın sonuna son durumun özetini ekler.
+    """
+    def __init__(self, dosya, harita_dosyasi, durum):
+        bayraklar = ((_ORTAK_MESAFE_ALANI if durum.ortak_mesafe_alani else 0) |
+                     (_ARTIMSAL if durum.artimsal else 0))
+        self.durum = durum
+        self.f = open(dosya, 'wb')
+        self.f.write(_BASLIK.pack(_IMZA, _BICIM_SURUMU, bayraklar, durum.suru_adedi,
+                                  durum.tohum, haritaOzeti(durum.harita)))
+        _metinYaz(self.f, type(durum.iyi_karakter).__name__)
+        _metinYaz(self.f, harita_dosyasi)
+
+    def hamle(self, zaman, eylem, sonuc):
+        """zaman (ms) anında yapılan hamleyi ve motorun döndürdüğü sonucu yazar"""
+        self.f.write(_HAMLE.pack(zaman, _EYLEMLER.index(eylem) | _SONUCLAR.index(sonuc) << 2))
+        self.f.flush()
+
+    def kapat(self):
+        if self.f.closed:
+            return
+        self.f.write(_HAMLE.pack(self.durum.hamle_sayisi, _BITIS) + durumOzeti(self.durum))
+        self.f.close()
+
+class Tekrar:
+    """
+    Okunmuş bir kayıt: oyun ayarları ve (zaman ms, eylem, sonuç)
+    hamleleri. Kayıt kapatılmadan kesildiyse son_ozet None olur.
+    """
+    def __init__(self, kahraman, harita_dosyasi, ortak_mesafe_alani, artimsal, suru, tohum,
+                 harita_ozeti, hamleler, son_ozet):
+        self.kahraman = kahraman
+        self.harita_dosyasi = harita_dosyasi
+        self.ortak_mesafe_alani = ortak_mesafe_alani
+        self.artimsal = artimsal
+        self.suru = suru
+        self.tohum = tohum
+        self.harita_ozeti = harita_ozeti
+        self.hamleler = hamleler
+        self.son_ozet = son_ozet
+
+    def durumOlustur(self, harita, adim_tablosu=None, profilci=None):
+        """
+        Kaydın ayarlarıyla yeni bir oyun kurar. Harita kaydedilen
+        haritadan farklıysa ValueError verir.
+        """
+        if haritaOzeti(harita) != self.harita_ozeti:
+            raise ValueError("Kayıt bu haritaya ait değil!")
+        return OyunDurumu(harita, getattr(karakterler, self.kahraman), self.ortak_mesafe_alani,
+                          self.artimsal, adim_tablosu, profilci, self.suru, self.tohum)
+
+def tekrarOku(dosya):
+    """Kayıt dosyasını okur; biçim tanınmıyorsa ValueError verir"""
+    with open(dosya, 'rb') as f:
+        tampon = f.read()
+    if len(tampon) < _BASLIK.size:
+        raise ValueError("Kayıt dosyası eksik!")
+    imza, surum, bayraklar, suru, tohum, harita_ozeti = _BASLIK.unpack_from(tampon)
+    if imza != _IMZA or surum != _BICIM_SURUMU:
+        raise ValueError("Kayıt dosyasının biçimi desteklenmiyor!")
+
+    ofset = _BASLIK.size
+    kahraman, ofset = _metinOku(tampon, ofset)
+    harita_dosyasi, ofset = _metinOku(tampon, ofset)
+    if kahraman not in ("LukeSkywalker", "MasterYoda"):
+        raise ValueError(f"Kayıttaki kahraman tanınmıyor: {kahraman}")
+
+    hamleler = []
+    son_ozet = None
+    while ofset + _HAMLE.size <= len(tampon):
+        zaman, kod = _HAMLE.unpack_from(tampon, ofset)
+        ofset += _HAMLE.size
+        if kod == _BITIS:
+            son_ozet = tampon[ofset:ofset + _OZET_BOYUTU]
+            break
+        hamleler.append((zaman, _EYLEMLER[kod & 3], _SONUCLAR[kod >> 2]))
+
+    return Tekrar(kahraman, harita_dosyasi, bool(bayraklar & _ORTAK_MESAFE_ALANI),
+                  bool(bayraklar & _ARTIMSAL), suru, tohum, harita_ozeti, hamleler, son_ozet)
+
+def oynat(tekrar, harita, adim_tablosu=None, profilci=None):
+    """
+    Kaydı ekransız, beklemeden oynatır. Profilci verilirse her hamle bir
+    kare sayılır. (durum, sonucu farklı çıkan ilk hamlenin sırası ya da
+    None, son durum özeti eşleşti mi) döner; kayıt kesikse son eşleşme
+    None olur.
+    """
+    durum = tekrar.durumOlustur(harita, adim_tablosu, profilci)
+    if profilci is not None:
+        profilci.kareyiAt()
+    ayrilma = None
+    for sira, (_, eylem, beklenen) in enumerate(tekrar.hamleler):
+        if durum.adim(eylem) != beklenen and ayrilma is None:
+            ayrilma = sira
+        if profilci is not None:
+            profilci.kareBitti()
+
+    eslesme = None if tekrar.son_ozet is None else durumOzeti(durum) == tekrar.son_ozet
+    return durum, ayrilma, eslesme
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaydedilmiş oyunları yeniden oynatır")
+    parser.add_argument("kayitlar", nargs="+", help="Kayıt dosyaları")
+    parser.add_argument("--harita", help="Kayıttaki harita dosyası yerine bunu kullan")
+    parser.add_argument("--tablo", action="store_true",
+                        help="Varsa haritanın adım tablosunu kullan")
+    parser.add_argument("--tekrar", type=int, default=1,
+                        help="Süre ölçümü için her kaydı bu kadar kez oynat")
+    parser.add_argument("--profil-csv", help="Hamle başına evre sürelerini bu CSV'ye yaz")
+    parser.add_argument("--goster", action="store_true", help="Kaydı pencerede oynat")
+    parser.add_argument("--hiz", type=float, default=1.0,
+                        help="--goster ile oynatma hızı (0: beklemeden)")
+    args = parser.parse_args()
+    if args.tekrar < 1:
+        parser.error("--tekrar en az 1 olmalı")
+
+    if args.goster:
+        import main as oyun_modulu  # pygame sadece gösterirken gerekir
+        oyun = oyun_modulu.Oyun()
+        for dosya in args.kayitlar:
+            tekrar = tekrarOku(dosya)
+            oyun.tekrarGoster(tekrar, args.harita or tekrar.harita_dosyasi, args.hiz)
+        return
+
+    profilci = Profilci(etkin=True) if args.profil_csv else None
+    hatali = 0
+    for dosya in args.kayitlar:
+        try:
+            tekrar = tekrarOku(dosya)
+            harita_dosyasi = args.harita or tekrar.harita_dosyasi
+            harita = haritaYukle(harita_dosyasi)
+            adim_tablosu = tabloYukle(harita.labirent, harita_dosyasi, olustur=False) \
+                if args.tablo else None
+
+            baslangic = time.perf_counter()
+            for _ in range(args.tekrar):
+                durum, ayrilma, eslesme = oynat(tekrar, harita, adim_tablosu, profilci)
+            sure = (time.perf_counter() - baslangic) / args.tekrar
+        except (OSError, ValueError) as e:
+            print(f"{dosya}: oynatılamadı ({str(e)})")
+            hatali += 1
+            continue
+
+        hatali += ayrilma is not None or eslesme is False
+        if ayrilma is not None:
+            durum_metni = f"FARKLI (ilk fark {ayrilma + 1}. hamlede)"
+        elif eslesme is None:
+            durum_metni = "kesik kayıt"
+        else:
+            durum_metni = "aynı" if eslesme else "FARKLI (son durum)"
+        hiz = len(tekrar.hamleler) / sure if sure else 0.0
+        print(f"{dosya}: {tekrar.kahraman} {len(tekrar.hamleler)} hamle, "
+              f"sonuç={durum.sonuc}, {1000 * sure:.2f} ms ({hiz:.0f} hamle/sn), {durum_metni}")
+
+    if profilci is not None:
+        profilci.csvYaz(args.profil_csv)
+    sys.exit(1 if hatali else 0)
+
+if __name__ == "__main__":
+    main()
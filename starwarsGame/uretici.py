@@ -0,0 +1,306 @@
+"""
+Tohumlu labirent üretici. Geri izlemeli (özyinelemeli geri izleme) ya da
+Prim algoritmasıyla mükemmel bir labirent (her iki hücre arasında tek yol)
+kurar, istenirse duvarların bir kısmını yıkıp döngüler açar ve sonucu
+haritaYukle'nin okuduğu metin biçiminde (ya da ikili olarak) yazar.
+
+Hücreler çift koordinatlarda, aralarındaki duvarlar tek koordinatlardadır.
+Başlangıç sol üst, hedef sağ alt köşededir; A kapısı sağ üst, B kapısı sol
+alt köşededir.
+
+Örnek:
+    python uretici.py buyuk.txt --boyut 1001x1001 --dongu 0.05 --tohum 7
+    python uretici.py dev.bin --boyut 10000x10000 --ikili
+"""
+import argparse
+import random
+import time
+
+from harita import Harita, haritaKaydet
+from izgara import Izgara, YOL, DUVAR, SINIR, numpy
+from karakterler import Lokasyon
+
+# Bundan çok düğümü olan labirentler NumPy varsa parçalardan kurulur
+PARCALI_ESIK = 1 << 18
+# Parçaların bir kenarındaki düğüm sayısı ve her parça biçimi için
+# üretilen farklı labirent sayısı (döndürülüp çevrilerek çoğaltılır)
+PARCA = 32
+VARYANT = 16
+
+VARSAYILAN_KARAKTERLER = ("DarthVader:A", "KyloRen:B", "Stormtrooper:A")
+
+# Metin haritaya yazarken duvar dışındaki her hücre (kapı ve nokta
+# işaretleri dahil) yol olarak yazılır
+_METIN_TABLOSU = bytes(DUVAR if kod == DUVAR else YOL for kod in range(256))
+
+def _geriIzleme(dugum_genislik, dugum_yukseklik, rng):
+    """
+    Özyinelemeli geri izleme (yığınla): ziyaret edilmemiş rastgele bir
+    komşuya ilerler, çıkmaza girince geri döner. Uzun, az dallı koridorlar.
+    Sonuç (2 * dugum_genislik - 1) genişliğinde, satır satır bir bytearray.
+    """
+    genislik = 2 * dugum_genislik - 1
+    hucreler = bytearray([DUVAR]) * (genislik * (2 * dugum_yukseklik - 1))
+    ziyaret = bytearray(dugum_genislik * dugum_yukseklik)
+
+    ilk = rng.randrange(len(ziyaret))
+    ziyaret[ilk] = 1
+    y, x = divmod(ilk, dugum_genislik)
+    hucreler[2 * y * genislik + 2 * x] = YOL
+    yigin = [ilk]
+    while yigin:
+        dugum = yigin[-1]
+        y, x = divmod(dugum, dugum_genislik)
+        komsular = []
+        if y > 0 and not ziyaret[dugum - dugum_genislik]:
+            komsular.append(dugum - dugum_genislik)
+        if y < dugum_yukseklik - 1 and not ziyaret[dugum + dugum_genislik]:
+            komsular.append(dugum + dugum_genislik)
+        if x > 0 and not ziyaret[dugum - 1]:
+            komsular.append(dugum - 1)
+        if x < dugum_genislik - 1 and not ziyaret[dugum + 1]:
+            komsular.append(dugum + 1)
+        if not komsular:
+            yigin.pop()
+            continue
+
+        komsu = rng.choice(komsular)
+        ziyaret[komsu] = 1
+        komsu_y, komsu_x = divmod(komsu, dugum_genislik)
+        # Aradaki duvar iki hücrenin tam ortasındadır
+        hucreler[(y + komsu_y) * genislik + x + komsu_x] = YOL
+        hucreler[2 * komsu_y * genislik + 2 * komsu_x] = YOL
+        yigin.append(komsu)
+    return hucreler
+
+def _prim(dugum_genislik, dugum_yukseklik, rng):
+    """
+    Rastgele Prim: labirente komşu kenarlardan rastgele birini açarak
+    büyür. Kısa, çok dallı koridorlar; sonuç _geriIzleme ile aynı biçimde.
+    """
+    genislik = 2 * dugum_genislik - 1
+    hucreler = bytearray([DUVAR]) * (genislik * (2 * dugum_yukseklik - 1))
+    ziyaret = bytearray(dugum_genislik * dugum_yukseklik)
+
+    def ekle(dugum):
+        ziyaret[dugum] = 1
+        y, x = divmod(dugum, dugum_genislik)
+        hucreler[2 * y * genislik + 2 * x] = YOL
+        if y > 0 and not ziyaret[dugum - dugum_genislik]:
+            sinir.append((dugum, dugum - dugum_genislik))
+        if y < dugum_yukseklik - 1 and not ziyaret[dugum + dugum_genislik]:
+            sinir.append((dugum, dugum + dugum_genislik))
+        if x > 0 and not ziyaret[dugum - 1]:
+            sinir.append((dugum, dugum - 1))
+        if x < dugum_genislik - 1 and not ziyaret[dugum + 1]:
+            sinir.append((dugum, dugum + 1))
+
+    # (labirentteki düğüm, dışarıdaki komşusu) kenarları
+    sinir = []
+    ekle(rng.randrange(len(ziyaret)))
+    while sinir:
+        # Rastgele kenar sona alınıp çıkarılır; listenin ortası kaymaz
+        i = rng.randrange(len(sinir))
+        sinir[i], sinir[-1] = sinir[-1], sinir[i]
+        dugum, komsu = sinir.pop()
+        if ziyaret[komsu]:
+            continue
+        y, x = divmod(dugum, dugum_genislik)
+        komsu_y, komsu_x = divmod(komsu, dugum_genislik)
+        hucreler[(y + komsu_y) * genislik + x + komsu_x] = YOL
+        ekle(komsu)
+    return hucreler
+
+ALGORITMALAR = {
+    "geri_izleme": _geriIzleme,
+    "prim": _prim,
+}
+
+def _donguleriAc(hucreler, genislik, oran, rng):
+    """İki hücre arasındaki duvarların oran kadarını yıkar (düz Python)"""
+    if oran <= 0:
+        return
+    yukseklik = len(hucreler) // genislik
+    for y in range(yukseklik):
+        # Çift satırlarda tek sütunlar, tek satırlarda çift sütunlar duvardır
+        for x in range(1 - y % 2, genislik, 2):
+            indeks = y * genislik + x
+            if hucreler[indeks] == DUVAR and rng.random() < oran:
+                hucreler[indeks] = YOL
+
+def _parcaliUret(dugum_genislik, dugum_yukseklik, algoritma, oran, rng, np_rng):
+    """
+    Büyük labirentleri NumPy ile kurar. Labirent PARCA x PARCA düğümlük
+    parçalara bölünür; her parça biçimi için VARYANT kadar küçük labirent
+    üretilip döndürülerek ve çevrilerek parçalara dağıtılır. Parçalar da
+    aynı algoritmayla kurulan kaba bir labirentin kenarlarından birer
+    kapıyla bağlanır; ağaçlardan oluşan bir ağaç olduğu için sonuç yine
+    mükemmel bir labirenttir. Döngüler en son, satır blokları halinde açılır.
+    """
+    uret = ALGORITMALAR[algoritma]
+    parca_x = -(-dugum_genislik // PARCA)
+    parca_y = -(-dugum_yukseklik // PARCA)
+    # Son sütun ve satırdaki parçalar daha dar olabilir
+    genislikler = [PARCA] * (parca_x - 1) + [dugum_genislik - PARCA * (parca_x - 1)]
+    yukseklikler = [PARCA] * (parca_y - 1) + [dugum_yukseklik - PARCA * (parca_y - 1)]
+
+    # Parça biçimi başına, dönüşümleriyle birlikte varyantlar. Kenarlar tek
+    # sayıda hücre olduğundan döndürme ve çevirme düğümleri düğümde tutar.
+    varyantlar = {}
+    for genislik in set(genislikler):
+        for yukseklik in set(yukseklikler):
+            liste = []
+            for _ in range(VARYANT):
+                parca = numpy.frombuffer(uret(genislik, yukseklik, rng), dtype=numpy.uint8)
+                parca = parca.reshape(2 * yukseklik - 1, 2 * genislik - 1)
+                liste += [parca, parca[::-1], parca[:, ::-1], parca[::-1, ::-1]]
+                if genislik == yukseklik:
+                    liste += [d.T for d in liste[-4:]]
+            varyantlar[genislik, yukseklik] = liste
+
+    izgara = numpy.full((2 * dugum_yukseklik - 1, 2 * dugum_genislik - 1), DUVAR,
+                        dtype=numpy.uint8)
+    for j, yukseklik in enumerate(yukseklikler):
+        for i, genislik in enumerate(genislikler):
+            liste = varyantlar[genislik, yukseklik]
+            y, x = 2 * PARCA * j, 2 * PARCA * i
+            izgara[y:y + 2 * yukseklik - 1, x:x + 2 * genislik - 1] = liste[rng.randrange(len(liste))]
+
+    # Kaba labirentte açık duvarlar, komşu parçalar arasındaki geçişlerdir
+    kaba = numpy.frombuffer(uret(parca_x, parca_y, rng), dtype=numpy.uint8)
+    kaba = kaba.reshape(2 * parca_y - 1, 2 * parca_x - 1)
+    # Yatay geçiş: (j, i) ile (j, i + 1) parçaları arasında rastgele bir satırdan
+    j, i = numpy.nonzero(kaba[0::2, 1::2] == YOL)
+    satir = PARCA * j + np_rng.integers(0, numpy.array(yukseklikler)[j])
+    izgara[2 * satir, 2 * PARCA * (i + 1) - 1] = YOL
+    # Dikey geçiş: (j, i) ile (j + 1, i) parçaları arasında rastgele bir sütundan
+    j, i = numpy.nonzero(kaba[1::2, 0::2] == YOL)
+    sutun = PARCA * i + np_rng.integers(0, numpy.array(genislikler)[i])
+    izgara[2 * PARCA * (j + 1) - 1, 2 * sutun] = YOL
+
+    if oran > 0:
+        # Rastgele sayılar bütün harita için bir kerede üretilmesin diye bloklarla
+        for bas in range(0, len(izgara), 2 * PARCA):
+            blok = izgara[bas:bas + 2 * PARCA]
+            for duvarlar in (blok[0::2, 1::2], blok[1::2, 0::2]):
+                duvarlar[np_rng.random(duvarlar.shape, dtype=numpy.float32) < oran] = YOL
+    return izgara
+
+def labirentUret(genislik, yukseklik, algoritma="geri_izleme", dongu=0.0, tohum=0):
+    """
+    genislik x yukseklik hücrelik, çerçeveli bir Izgara üretir. dongu
+    (0-1) hücreler arasındaki duvarların yıkılacak oranıdır; 0 mükemmel
+    labirent verir. Aynı tohum ve ayarlar aynı labirenti verir (büyük
+    labirentler NumPy ile farklı bir yoldan üretildiğinden NumPy kurulu
+    olup olmamasına göre değişebilir). Boyut 3x3'ten küçükse ya da
+    algoritma bilinmiyorsa ValueError verir.
+    """
+    if algoritma not in ALGORITMALAR:
+        raise ValueError(f"Bilinmeyen algoritma: {algoritma}")
+    if genislik < 3 or yukseklik < 3:
+        raise ValueError("Labirent en az 3x3 olmalı!")
+    if not 0 <= dongu <= 1:
+        raise ValueError("Döngü oranı 0 ile 1 arasında olmalı!")
+
+    rng = random.Random(tohum)
+    # Çift kenarlarda son sütun ve satır duvar olarak kalır
+    dugum_genislik, dugum_yukseklik = (genislik + 1) // 2, (yukseklik + 1) // 2
+    ic_genislik, ic_yukseklik = 2 * dugum_genislik - 1, 2 * dugum_yukseklik - 1
+    satir_adimi = genislik + 2
+
+    if numpy is not None and dugum_genislik * dugum_yukseklik > PARCALI_ESIK:
+        izgara = numpy.full((yukseklik + 2, satir_adimi), SINIR, dtype=numpy.uint8)
+        izgara[1:-1, 1:-1] = DUVAR
+        izgara[1:ic_yukseklik + 1, 1:ic_genislik + 1] = _parcaliUret(
+            dugum_genislik, dugum_yukseklik, algoritma, dongu, rng,
+            numpy.random.default_rng(tohum))
+        return Izgara(genislik, yukseklik, bytearray(izgara.tobytes()))
+
+    ic = ALGORITMALAR[algoritma](dugum_genislik, dugum_yukseklik, rng)
+    _donguleriAc(ic, ic_genislik, dongu, rng)
+
+    dolgu = bytes([DUVAR]) * (genislik - ic_genislik)
+    hucreler = bytearray([SINIR]) * satir_adimi
+    for y in range(yukseklik):
+        hucreler.append(SINIR)
+        if y < ic_yukseklik:
+            hucreler += ic[y * ic_genislik:(y + 1) * ic_genislik] + dolgu
+        else:
+            hucreler += bytes([DUVAR]) * genislik
+        hucreler.append(SINIR)
+    hucreler += bytes([SINIR]) * satir_adimi
+    return Izgara(genislik, yukseklik, hucreler)
+
+def haritaUret(genislik, yukseklik, algoritma="geri_izleme", dongu=0.0, tohum=0,
+               karakterler=VARSAYILAN_KARAKTERLER, suru=0):
+    """
+    Labirenti kapılar, başlangıç, hedef ve kötü karakterlerle birlikte
+    oyuna hazır bir Harita olarak üretir. karakterler 'Ad:Kapı'
+    biçiminde dizelerdir.
+    """
+    labirent = labirentUret(genislik, yukseklik, algoritma, dongu, tohum)
+    # Köşelerdeki düğümler (çift kenarlarda son sütun/satır duvardır)
+    son_x, son_y = (genislik - 1) // 2 * 2, (yukseklik - 1) // 2 * 2
+    kapilar = {'A': Lokasyon(son_x, 0), 'B': Lokasyon(0, son_y)}
+    baslangic, hedef = Lokasyon(0, 0), Lokasyon(son_x, son_y)
+
+    karakter_bilgileri = []
+    for karakter in karakterler:
+        ad, _, kapi = karakter.partition(':')
+        if kapi not in kapilar:
+            raise ValueError(f"Bilinmeyen kapı: {karakter}")
+        karakter_bilgileri.append({'karakter': ad, 'kapi': kapi})
+
+    for isaret, konum in list(kapilar.items()) + [('S', baslangic), ('T', hedef)]:
+        labirent.isaretle(konum.x, konum.y, isaret)
+    return Harita(labirent, karakter_bilgileri, kapilar, baslangic, hedef, suru)
+
+def metinYaz(harita, dosya):
+    """Haritayı haritaYukle'nin okuduğu metin biçiminde, satırlar boşluksuz yazar"""
+    labirent = harita.labirent
+    with open(dosya, 'wb') as f:
+        basliklar = [f"Boyut:{harita.genislik}x{harita.yukseklik}"]
+        basliklar += [f"Kapi:{kapi},X:{konum.x},Y:{konum.y}" for kapi, konum in harita.kapilar.items()]
+        basliklar += [f"Nokta:Baslangic,X:{harita.baslangic.x},Y:{harita.baslangic.y}",
+                      f"Nokta:Hedef,X:{harita.hedef.x},Y:{harita.hedef.y}"]
+        basliklar += [f"Karakter:{bilgi['karakter']},Kapi:{bilgi['kapi']}"
+                      for bilgi in harita.karakter_bilgileri]
+        if harita.suru:
+            basliklar.append(f"Suru:{harita.suru}")
+        f.write(("\n".join(basliklar) + "\n").encode('utf-8'))
+
+        hucreler = labirent.hucreler
+        for y in range(labirent.yukseklik):
+            bas = labirent.indeks(0, y)
+            f.write(bytes(hucreler[bas:bas + labirent.genislik]).translate(_METIN_TABLOSU) + b"\n")
+
+def _boyutOku(metin):
+    genislik, _, yukseklik = metin.lower().partition('x')
+    return int(genislik), int(yukseklik)
+
+def main():
+    parser = argparse.ArgumentParser(description="Tohumlu labirent haritası üretir")
+    parser.add_argument("dosya", help="Yazılacak harita dosyası")
+    parser.add_argument("--boyut", type=_boyutOku, default=(41, 41),
+                        help="GENİŞLİKxYÜKSEKLİK (tek sayılar kenarları tam kullanır)")
+    parser.add_argument("--algoritma", choices=ALGORITMALAR, default="geri_izleme")
+    parser.add_argument("--dongu", type=float, default=0.0,
+                        help="Yıkılacak iç duvar oranı (0: mükemmel labirent)")
+    parser.add_argument("--tohum", type=int, default=0)
+    parser.add_argument("--karakter", nargs="*", default=list(VARSAYILAN_KARAKTERLER),
+                        help="Ad:Kapı biçiminde kötü karakterler (kapılar: A, B)")
+    parser.add_argument("--suru", type=int, default=0, help="Sürü asker sayısı")
+    parser.add_argument("--ikili", action="store_true",
+                        help="Metin yerine hızlı açılan ikili biçimde yaz")
+    args = parser.parse_args()
+
+    baslangic = time.perf_counter()
+    harita = haritaUret(*args.boyut, args.algoritma, args.dongu, args.tohum,
+                        args.karakter, args.suru)
+    uretim = time.perf_counter() - baslangic
+    (haritaKaydet if args.ikili else metinYaz)(harita, args.dosya)
+    print(f"{args.dosya}: {harita.genislik}x{harita.yukseklik} {uretim:.2f} saniyede üretildi, "
+          f"{time.perf_counter() - baslangic - uretim:.2f} saniyede yazıldı")
+
+if __name__ == "__main__":
+    main()